@@ -1,12 +1,33 @@
 """Utility helpers for invoking OpenAI chat completions with backward compatibility."""
 from __future__ import annotations
 
-from typing import Any, Dict, Mapping, Sequence
+from functools import lru_cache
+from typing import Any, Dict, List, Mapping, Optional, Sequence, Tuple
+
+# Token-limit parameter tried first by `create_chat_completion`; request bodies
+# built elsewhere (e.g. Batch API lines) should use the same name.
+MAX_TOKENS_PARAMETER = "max_completion_tokens"
+
+
+@lru_cache(maxsize=1)
+def load_openai_client_class() -> Any:
+    """Import `openai.OpenAI` on first use; returns None when the SDK is unavailable."""
+
+    try:  # pragma: no cover - optional dependency guard
+        from openai import OpenAI
+    except Exception:  # pragma: no cover
+        return None
+    return OpenAI
+
+
+@lru_cache(maxsize=1)
+def _load_bad_request_error() -> type:
+    try:  # pragma: no cover - optional dependency guard
+        from openai import BadRequestError
+    except Exception:  # pragma: no cover
+        return Exception
+    return BadRequestError
 
-try:  # pragma: no cover - optional dependency guard
-    from openai import BadRequestError
-except Exception:  # pragma: no cover
-    BadRequestError = Exception  # type: ignore[assignment]
 
 def _coerce_content_fragment(value: Any) -> str:
     """Normalize structured message content into text segments."""
@@ -112,6 +133,97 @@ def extract_choice_metadata(response: Any) -> Dict[str, Any]:
         metadata.setdefault("model", model)
     return metadata
 
+def _read_field(value: Any, name: str) -> Any:
+    if value is None:
+        return None
+    if isinstance(value, Mapping):
+        return value.get(name)
+    return getattr(value, name, None)
+
+
+class _JsonObjectTracker:
+    """Track brace depth across streamed fragments, ignoring braces inside strings."""
+
+    __slots__ = ("depth", "in_string", "escaped")
+
+    def __init__(self) -> None:
+        self.depth = 0
+        self.in_string = False
+        self.escaped = False
+
+    def feed(self, fragment: str) -> bool:
+        """Consume a fragment; returns True once the top-level object has closed."""
+
+        for char in fragment:
+            if self.in_string:
+                if self.escaped:
+                    self.escaped = False
+                elif char == "\\":
+                    self.escaped = True
+                elif char == '"':
+                    self.in_string = False
+            elif char == '"':
+                self.in_string = True
+            elif char == "{":
+                self.depth += 1
+            elif char == "}" and self.depth:
+                self.depth -= 1
+                if not self.depth:
+                    return True
+        return False
+
+
+def collect_streamed_completion(
+    response: Any, *, stop_on_json_close: bool = False
+) -> Tuple[str, Dict[str, Any]]:
+    """Return the text and metadata of a completion, draining it first when streamed.
+
+    With `stop_on_json_close=True` a stream is abandoned as soon as the
+    top-level JSON object in the reply closes, instead of waiting for any
+    trailing tokens (closing fences, commentary) and the final chunk.
+    """
+
+    choices = _read_field(response, "choices")
+    if choices is not None:
+        message = _read_field(choices[0], "message") if choices else None
+        return extract_message_content(message), extract_choice_metadata(response)
+
+    parts: List[str] = []
+    metadata: Dict[str, Any] = {}
+    tracker = _JsonObjectTracker() if stop_on_json_close else None
+    for chunk in response:
+        chunk_choices = _read_field(chunk, "choices") or []
+        if chunk_choices:
+            choice = chunk_choices[0]
+            text = _read_field(_read_field(choice, "delta"), "content")
+            if text:
+                parts.append(text)
+                if tracker is not None and tracker.feed(text):
+                    metadata["stopped_early"] = True
+                    _record_stream_identity(chunk, metadata)
+                    close = getattr(response, "close", None)
+                    if callable(close):
+                        close()
+                    break
+            finish_reason = _read_field(choice, "finish_reason")
+            if finish_reason is not None:
+                metadata["finish_reason"] = finish_reason
+        _record_stream_identity(chunk, metadata)
+    metadata["streamed"] = True
+    return "".join(parts).strip(), metadata
+
+
+def _record_stream_identity(chunk: Any, metadata: Dict[str, Any]) -> None:
+    if "response_id" not in metadata:
+        response_id = _read_field(chunk, "id")
+        if response_id:
+            metadata["response_id"] = response_id
+    if "model" not in metadata:
+        model = _read_field(chunk, "model")
+        if model:
+            metadata["model"] = model
+
+
 def create_chat_completion(
     client: Any,
     *,
@@ -119,6 +231,8 @@ def create_chat_completion(
     messages: Sequence[Mapping[str, str]],
     temperature: float,
     max_tokens: int,
+    response_format: Optional[Mapping[str, Any]] = None,
+    stream: bool = False,
 ) -> Any:
     """Call chat.completions.create while supporting legacy parameter names.
 
@@ -127,7 +241,11 @@ def create_chat_completion(
     fall back to alternative encodings when necessary.
 
     If a model rejects custom temperature values, we retry without overriding
-    temperature so the server default (1) is applied.
+    temperature so the server default (1) is applied. An optional
+    `response_format` is forwarded as-is and dropped if the model rejects it.
+    With `stream=True` the raw chunk stream is returned (see
+    `collect_streamed_completion`); models that refuse streaming are retried
+    without it.
     """
 
     if client is None:
@@ -143,25 +261,34 @@ def create_chat_completion(
         return names
 
     attempts = (
-        {"max_completion_tokens": max_tokens},
-        {"extra_body": {"max_completion_tokens": max_tokens}},
+        {MAX_TOKENS_PARAMETER: max_tokens},
+        {"extra_body": {MAX_TOKENS_PARAMETER: max_tokens}},
         {"max_output_tokens": max_tokens},
         {"extra_body": {"max_output_tokens": max_tokens}},
         {"max_tokens": max_tokens},
         {},  # final fallback relies on server defaults
     )
 
+    bad_request_error = _load_bad_request_error()
     normalized_messages = list(messages)
     include_temperature = True
+    include_response_format = response_format is not None
+    include_stream = stream
     last_error: Exception | None = None
 
     while True:
         retry_without_temperature = False
+        retry_without_response_format = False
+        retry_without_stream = False
         for extra in attempts:
             kwargs: Dict[str, Any] = {"model": model, "messages": normalized_messages}
             attempted_param_names = _extract_parameter_names(extra)
             if include_temperature:
                 kwargs["temperature"] = temperature
+            if include_response_format:
+                kwargs["response_format"] = response_format
+            if include_stream:
+                kwargs["stream"] = True
             try:
                 return client.chat.completions.create(  # type: ignore[attr-defined]
                     **kwargs,
@@ -170,13 +297,21 @@ def create_chat_completion(
             except TypeError as exc:  # unexpected keyword for this client version
                 last_error = exc
                 continue
-            except BadRequestError as exc:  # type: ignore[misc]
+            except bad_request_error as exc:  # type: ignore[misc]
                 message = getattr(exc, "message", "") or str(exc)
                 lowered = message.lower()
                 if include_temperature and "temperature" in lowered and "default (1)" in lowered:
                     last_error = exc
                     retry_without_temperature = True
                     break
+                if include_response_format and "response_format" in lowered:
+                    last_error = exc
+                    retry_without_response_format = True
+                    break
+                if include_stream and "stream" in lowered:
+                    last_error = exc
+                    retry_without_stream = True
+                    break
                 if (
                     "use 'max_completion_tokens' instead" in lowered
                     and any(name == "max_tokens" for name in attempted_param_names)
@@ -199,6 +334,12 @@ def create_chat_completion(
         if retry_without_temperature:
             include_temperature = False
             continue
+        if retry_without_response_format:
+            include_response_format = False
+            continue
+        if retry_without_stream:
+            include_stream = False
+            continue
         break
 
     if last_error is not None:
@@ -12,15 +12,11 @@ from projectplanner.agents._openai_helpers import (
     create_chat_completion,
     extract_choice_metadata,
     extract_message_content,
+    load_openai_client_class,
 )
 from projectplanner.models import MilestoneObjective
 from projectplanner.config import MAX_COMPLETION_TOKENS, get_setting
 
-try:  # pragma: no cover - optional dependency guard
-    from openai import OpenAI
-except Exception:  # pragma: no cover
-    OpenAI = None  # type: ignore[assignment]
-
 LOGGER = get_logger(__name__)
 
 DEFAULT_COORDINATOR_MODEL = get_setting("COORDINATOR_MODEL", "gpt-5")
@@ -43,17 +39,23 @@ COORDINATOR_SYSTEM_PROMPT = (
 )
 
 
+def resolve_coordinator_model() -> str:
+    """Return the model the coordinator agent is configured to call."""
+
+    return get_setting("COORDINATOR_MODEL") or DEFAULT_COORDINATOR_MODEL
+
 
 class CoordinatorAgent:
     """Synthesizes milestone objectives by delegating to GPT-5 when available."""
 
     def __init__(self) -> None:
-        self._model = get_setting("COORDINATOR_MODEL") or DEFAULT_COORDINATOR_MODEL
+        self._model = resolve_coordinator_model()
         self._client = None
         api_key = os.getenv("OPENAI_API_KEY")
-        if api_key and OpenAI is not None:
+        openai_cls = load_openai_client_class() if api_key else None
+        if openai_cls is not None:
             try:
-                self._client = OpenAI(api_key=api_key)
+                self._client = openai_cls(api_key=api_key)
             except Exception:  # pragma: no cover - initialization failure fallback
                 LOGGER.warning(
                     "Failed to initialize OpenAI client for CoordinatorAgent; falling back to heuristics.",
@@ -183,7 +185,7 @@ class CoordinatorAgent:
                 "payload": {"count": len(objectives)},
             },
         )
-        return CoordinatorAgentOutput(objectives=objectives)
+        return CoordinatorAgentOutput(objectives=objectives, from_model=used_model)
 
     def _request_objectives(self, payload: CoordinatorAgentInput, user_prompt: str) -> str:
         if not self._client:
@@ -11,16 +11,12 @@ from projectplanner.agents._openai_helpers import (
     create_chat_completion,
     extract_choice_metadata,
     extract_message_content,
+    load_openai_client_class,
 )
 from projectplanner.logging_utils import get_logger, log_prompt
 from projectplanner.models import MilestoneObjective, PromptStep
 from projectplanner.config import MAX_COMPLETION_TOKENS, get_setting
 
-try:  # pragma: no cover - optional dependency guard
-    from openai import OpenAI
-except Exception:  # pragma: no cover
-    OpenAI = None  # type: ignore[assignment]
-
 LOGGER = get_logger(__name__)
 
 DEFAULT_DECOMPOSER_MODEL = get_setting("DECOMPOSER_MODEL", "gpt-5")
@@ -34,16 +30,23 @@ DECOMPOSER_SYSTEM_PROMPT = (
 )
 
 
+def resolve_decomposer_model() -> str:
+    """Return the model the decomposer agent is configured to call."""
+
+    return get_setting("DECOMPOSER_MODEL") or DEFAULT_DECOMPOSER_MODEL
+
+
 class DecomposerAgent:
     """Transforms high-level milestones into sequenced PromptStep entries."""
 
     def __init__(self) -> None:
-        self._model = get_setting("DECOMPOSER_MODEL") or DEFAULT_DECOMPOSER_MODEL
+        self._model = resolve_decomposer_model()
         self._client = None
         api_key = os.getenv("OPENAI_API_KEY")
-        if api_key and OpenAI is not None:
+        openai_cls = load_openai_client_class() if api_key else None
+        if openai_cls is not None:
             try:
-                self._client = OpenAI(api_key=api_key)
+                self._client = openai_cls(api_key=api_key)
             except Exception:  # pragma: no cover - initialization failure fallback
                 LOGGER.warning(
                     "Failed to initialize OpenAI client for DecomposerAgent; heuristics will be used.",
@@ -132,6 +135,7 @@ class DecomposerAgent:
                         },
                     )
                     step = fallback_step
+                    using_gpt = False
             else:
                 LOGGER.debug(
                     "Decomposer agent using heuristic prompt for %s",
@@ -154,7 +158,7 @@ class DecomposerAgent:
                 "payload": {"step_count": len(steps)},
             },
         )
-        return DecomposerAgentOutput(steps=steps)
+        return DecomposerAgentOutput(steps=steps, from_model=using_gpt)
 
     def _generate_step_with_gpt(
         self,
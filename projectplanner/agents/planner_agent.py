@@ -12,16 +12,12 @@ from projectplanner.agents._openai_helpers import (
     create_chat_completion,
     extract_choice_metadata,
     extract_message_content,
+    load_openai_client_class,
 )
 from projectplanner.logging_utils import get_logger, log_prompt
 from projectplanner.models import PromptPlan
 from projectplanner.config import MAX_COMPLETION_TOKENS, get_setting
 
-try:  # pragma: no cover - optional dependency guard
-    from openai import OpenAI
-except Exception:  # pragma: no cover
-    OpenAI = None  # type: ignore[assignment]
-
 LOGGER = get_logger(__name__)
 
 DEFAULT_PLANNER_MODEL = get_setting("PLANNER_MODEL", "gpt-5")
@@ -43,16 +39,23 @@ SECTION_PATTERNS = {
 }
 
 
+def resolve_planner_model() -> str:
+    """Return the model the planner agent is configured to call."""
+
+    return get_setting("PLANNER_MODEL") or DEFAULT_PLANNER_MODEL
+
+
 class PlannerAgent:
     """Extracts a structured plan from normalized research chunks."""
 
     def __init__(self) -> None:
-        self._model = get_setting("PLANNER_MODEL") or DEFAULT_PLANNER_MODEL
+        self._model = resolve_planner_model()
         self._client = None
         api_key = os.getenv("OPENAI_API_KEY")
-        if api_key and OpenAI is not None:
+        openai_cls = load_openai_client_class() if api_key else None
+        if openai_cls is not None:
             try:
-                self._client = OpenAI(api_key=api_key)
+                self._client = openai_cls(api_key=api_key)
             except Exception:  # pragma: no cover - initialization failure fallback
                 LOGGER.warning(
                     "Failed to initialize OpenAI client for PlannerAgent; heuristics will be used.",
@@ -117,7 +120,7 @@ class PlannerAgent:
                     },
                 },
             )
-            return PlannerAgentOutput(plan=plan)
+            return PlannerAgentOutput(plan=plan, from_model=True)
         except Exception as error:  # pragma: no cover - fall back to heuristic result
             LOGGER.warning(
                 "Planner GPT synthesis failed; returning heuristic plan. (%s)",
@@ -17,6 +17,7 @@ class CoordinatorAgentInput(BaseModel):
 
 class CoordinatorAgentOutput(BaseModel):
     objectives: List[MilestoneObjective]
+    from_model: bool = Field(False, description="True when an OpenAI model, not the heuristic fallback, produced the output.")
 
 
 class PlannerAgentInput(BaseModel):
@@ -29,6 +30,7 @@ class PlannerAgentInput(BaseModel):
 
 class PlannerAgentOutput(BaseModel):
     plan: PromptPlan
+    from_model: bool = Field(False, description="True when an OpenAI model, not the heuristic fallback, produced the output.")
 
 
 class DecomposerAgentInput(BaseModel):
@@ -40,6 +42,7 @@ class DecomposerAgentInput(BaseModel):
 
 class DecomposerAgentOutput(BaseModel):
     steps: List[PromptStep]
+    from_model: bool = Field(False, description="True when an OpenAI model, not the heuristic fallback, produced the output.")
 
 
 class ReviewerAgentInput(BaseModel):
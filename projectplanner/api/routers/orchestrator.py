@@ -1,6 +1,7 @@
 """API router exposing The Coding Orchestrator endpoints."""
 from __future__ import annotations
 
+import asyncio
 from typing import List
 
 from fastapi import APIRouter, HTTPException, Response
@@ -34,7 +35,8 @@ def _handle_error(run_id: str, error: Exception) -> None:
 async def create_run(payload: IngestionRequest) -> OrchestratorSummaryEnvelope:
     """Create a new orchestrator run and return the generated summary."""
 
-    run_id, summary, source = orchestrator_service.create_session(payload)
+    # Decoding uploads and the summary request both block; run them off the event loop.
+    run_id, summary, source = await asyncio.to_thread(orchestrator_service.create_session, payload)
     LOGGER.info(
         "Orchestrator run %s created",
         run_id,
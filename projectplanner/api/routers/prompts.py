@@ -1,6 +1,7 @@
 """API router exposing The Coding Conductor endpoints."""
 from __future__ import annotations
 
+import asyncio
 import json
 from datetime import datetime, timezone
 
@@ -9,7 +10,12 @@ from typing import Iterator, Optional
 from fastapi import APIRouter, HTTPException, Query, Request
 from fastapi.responses import StreamingResponse
 
-from projectplanner.logging_utils import get_log_manager, get_logger, get_prompt_audit_path
+from projectplanner.logging_utils import (
+    flush_prompt_audit,
+    get_log_manager,
+    get_logger,
+    get_prompt_audit_path,
+)
 from projectplanner.models import (
     ExportRequest,
     IngestionRequest,
@@ -255,6 +261,7 @@ async def export_logs(
 async def download_prompt_audit() -> StreamingResponse:
     """Download the full prompt audit log with untruncated content."""
 
+    await asyncio.to_thread(flush_prompt_audit)
     path = get_prompt_audit_path()
     if not path.exists() or path.stat().st_size == 0:
         raise HTTPException(status_code=404, detail="Prompt audit log is not available.")
@@ -362,15 +369,15 @@ async def export_prompts(payload: ExportRequest, request: Request) -> StreamingR
         extra={"event": "api.export.start", "run_id": payload.run_id, "payload": {"format": payload.format}},
     )
     store = request.app.state.store
-    export_bundle = await plan_service.export_prompts(payload, store=store)
+    metadata, chunks = plan_service.stream_export(payload, store=store)
     response = StreamingResponse(
-        content=(chunk.encode("utf-8") for chunk in [export_bundle.content]),
-        media_type=export_bundle.metadata.content_type,
+        content=(chunk.encode("utf-8") for chunk in chunks),
+        media_type=metadata.content_type,
     )
-    response.headers["Content-Disposition"] = f"attachment; filename={export_bundle.metadata.filename}"
+    response.headers["Content-Disposition"] = f"attachment; filename={metadata.filename}"
     LOGGER.info(
         "Export response ready for run %s",
         payload.run_id,
-        extra={"event": "api.export.complete", "run_id": payload.run_id, "payload": {"filename": export_bundle.metadata.filename}},
+        extra={"event": "api.export.complete", "run_id": payload.run_id, "payload": {"filename": metadata.filename}},
     )
     return response
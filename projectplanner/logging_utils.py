@@ -1,13 +1,17 @@
 """Shared logging utilities for coding conductor and future modules."""
 from __future__ import annotations
 
+import atexit
+import copy
 import inspect
 import json
 import logging
 import os
+import queue
 import sys
 import threading
 from collections import deque
+from logging.handlers import QueueHandler, QueueListener
 from datetime import datetime, timezone
 from pathlib import Path
 from threading import RLock
@@ -73,14 +77,13 @@ def get_prompt_audit_path() -> Path:
     return _PROMPT_LOG_PATH
 
 
-def _append_prompt_audit(entry: Mapping[str, Any]) -> None:
+def _write_prompt_audit(entries: Sequence[Mapping[str, Any]]) -> None:
     try:
         _PROMPT_LOG_PATH.parent.mkdir(parents=True, exist_ok=True)
-        line = json.dumps(entry, ensure_ascii=False)
+        lines = ''.join(json.dumps(entry, ensure_ascii=False) + '\n' for entry in entries)
         with _PROMPT_LOG_LOCK:
             with _PROMPT_LOG_PATH.open('a', encoding='utf-8') as handle:
-                handle.write(line)
-                handle.write('\n')
+                handle.write(lines)
     except Exception:
         logging.getLogger('codingconductor.prompt_audit').exception(
             'Failed to write prompt audit entry.',
@@ -88,6 +91,71 @@ def _append_prompt_audit(entry: Mapping[str, Any]) -> None:
         )
 
 
+def _append_prompt_audit(entry: Mapping[str, Any]) -> None:
+    _write_prompt_audit((entry,))
+
+
+class _PromptAuditWriter:
+    """Background writer that keeps prompt audit file I/O off the caller's thread.
+
+    Entries are queued and appended by a daemon thread in batches; call
+    `flush()` before reading the audit file to see every queued entry.
+    """
+
+    _STOP = object()
+
+    def __init__(self) -> None:
+        self._queue: queue.Queue = queue.Queue()
+        self._lock = threading.Lock()
+        self._thread: Optional[threading.Thread] = None
+
+    def submit(self, entry: Mapping[str, Any]) -> None:
+        if self._thread is None:
+            with self._lock:
+                if self._thread is None:
+                    thread = threading.Thread(target=self._run, name='prompt-audit-writer', daemon=True)
+                    thread.start()
+                    self._thread = thread
+                    atexit.register(self.close)
+        self._queue.put(entry)
+
+    def _run(self) -> None:
+        while True:
+            batch = [self._queue.get()]
+            while True:
+                try:
+                    batch.append(self._queue.get_nowait())
+                except queue.Empty:
+                    break
+            entries = [entry for entry in batch if entry is not self._STOP]
+            if entries:
+                _write_prompt_audit(entries)
+            for _ in batch:
+                self._queue.task_done()
+            if len(entries) != len(batch):
+                return
+
+    def flush(self) -> None:
+        if self._thread is not None:
+            self._queue.join()
+
+    def close(self) -> None:
+        thread = self._thread
+        if thread is not None and thread.is_alive():
+            self._queue.put(self._STOP)
+            thread.join()
+
+
+_PROMPT_AUDIT_WRITER: Optional[_PromptAuditWriter] = None
+
+
+def flush_prompt_audit() -> None:
+    """Block until queued prompt audit entries have been written to disk."""
+
+    if _PROMPT_AUDIT_WRITER is not None:
+        _PROMPT_AUDIT_WRITER.flush()
+
+
 def _coerce_level(level: str | int | None) -> Optional[int]:
     if level is None:
         return None
@@ -255,6 +323,38 @@ class InMemoryLogHandler(logging.Handler):
         return self._session_started
 
 
+class _SnapshotQueueHandler(QueueHandler):
+    """Queue handler that freezes the message and extras before hand-off.
+
+    Unlike the stdlib default it keeps `exc_info` and structured extras so the
+    in-memory handler can render them on the listener thread.
+    """
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        record = copy.copy(record)
+        try:
+            record.msg = record.getMessage()
+        except Exception:  # pragma: no cover - defensive
+            record.msg = str(record.msg)
+        record.args = None
+        for attr in ("payload", "context"):
+            value = getattr(record, attr, None)
+            if value is not None:
+                setattr(record, attr, _sanitize(value))
+        return record
+
+
+def _should_queue_logs() -> bool:
+    flag = _get_env("LOG_ASYNC")
+    if flag is None:
+        return True
+    return flag.strip().lower() not in {"0", "false", "no", "off"}
+
+
+if _should_queue_logs():
+    _PROMPT_AUDIT_WRITER = _PromptAuditWriter()
+
+
 class LogManager:
     """Coordinator for shared logging state across modules."""
 
@@ -263,6 +363,27 @@ class LogManager:
         self._lock = RLock()
         self._configured = False
         self._attached_logger: Optional[logging.Logger] = None
+        self._queue: Optional[queue.Queue] = None
+        self._listener: Optional[QueueListener] = None
+        self._entry_handler: logging.Handler = self.handler
+        if _should_queue_logs():
+            self._queue = queue.Queue()
+            self._entry_handler = _SnapshotQueueHandler(self._queue)
+            self._listener = QueueListener(self._queue, self.handler)
+            self._listener.start()
+            atexit.register(self._stop_listener)
+
+    def _stop_listener(self) -> None:
+        listener = self._listener
+        if listener is not None:
+            self._listener = None
+            listener.stop()
+
+    def flush(self) -> None:
+        """Block until queued records have reached the in-memory buffer."""
+
+        if self._queue is not None and self._listener is not None:
+            self._queue.join()
 
     @property
     def configured(self) -> bool:
@@ -283,11 +404,11 @@ class LogManager:
             if self._attached_logger is not target_logger:
                 if self._attached_logger is not None:
                     try:
-                        self._attached_logger.removeHandler(self.handler)
+                        self._attached_logger.removeHandler(self._entry_handler)
                     except (ValueError, AttributeError):  # pragma: no cover - defensive
                         pass
-                if self.handler not in target_logger.handlers:
-                    target_logger.addHandler(self.handler)
+                if self._entry_handler not in target_logger.handlers:
+                    target_logger.addHandler(self._entry_handler)
                 self._attached_logger = target_logger
             resolved_level = _coerce_level(level)
             if resolved_level is not None:
@@ -313,6 +434,7 @@ class LogManager:
         end_dt = _coerce_datetime(end)
         start_ts = start_dt.timestamp() if start_dt else None
         end_ts = end_dt.timestamp() if end_dt else None
+        self.flush()
         records = self.handler.records(
             after=after,
             limit=limit,
@@ -338,9 +460,11 @@ class LogManager:
         ]
 
     def latest_cursor(self) -> int:
+        self.flush()
         return self.handler.latest_sequence()
 
     def clear(self) -> None:
+        self.flush()
         self.handler.clear()
 
 
@@ -589,7 +713,10 @@ def log_prompt(
         audit_entry["model"] = model
     if metadata_payload:
         audit_entry["metadata"] = metadata_payload
-    _append_prompt_audit(audit_entry)
+    if _PROMPT_AUDIT_WRITER is not None:
+        _PROMPT_AUDIT_WRITER.submit(audit_entry)
+    else:
+        _append_prompt_audit(audit_entry)
     target.info(
         "%s prompt for %s (%d chars)",
         normalized_stage.capitalize(),
@@ -617,6 +744,7 @@ __all__ = [
     "configure_logging",
     "disable_function_call_logging",
     "enable_function_call_logging",
+    "flush_prompt_audit",
     "get_log_manager",
     "get_logger",
     "get_prompt_audit_path",
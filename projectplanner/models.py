@@ -1,10 +1,19 @@
 ﻿"""Core Pydantic models for the coding conductor module."""
 from __future__ import annotations
 
+import re
 from datetime import datetime
 from typing import Any, Dict, List, Literal, Optional
 
-from pydantic import AliasChoices, BaseModel, ConfigDict, Field, model_validator
+from pydantic import AliasChoices, BaseModel, ConfigDict, Field, field_validator, model_validator
+
+_ID_RE = re.compile(r"[a-z0-9\-]+")
+
+
+def _validate_identifier(value: str) -> str:
+    if _ID_RE.fullmatch(value) is None:
+        raise ValueError("Identifier may only contain lowercase letters, digits, and hyphens.")
+    return value
 
 
 class IngestionRequest(BaseModel):
@@ -85,17 +94,22 @@ class PlanRequest(BaseModel):
     run_id: str = Field(..., description="Ingestion run to base the plan on.")
     target_stack: TargetStack = Field(default_factory=TargetStack)
     style: Literal["strict", "creative"] = Field("strict")
+    use_cache: bool = Field(True, description="Reuse a cached plan for identical inputs; false forces the agents to run.")
 
 class MilestoneObjective(BaseModel):
     """Ordered milestone objective produced by the coordinator agent."""
 
-    id: str = Field(..., pattern=r"^[a-z0-9\-]+$", description="Stable identifier for the milestone.")
+    id: str = Field(..., description="Stable identifier for the milestone.")
     order: int = Field(..., ge=0, description="Zero-based execution order.")
     title: str = Field(..., description="Concise milestone title.")
     objective: str = Field(..., description="Concrete outcome delivered by the milestone.")
     success_criteria: List[str] = Field(..., min_items=1, description="How we know the milestone is successful.")
     dependencies: List[str] = Field(default_factory=list, description="Milestone ids that must precede this milestone.")
 
+    @field_validator("id")
+    def validate_id(cls, value: str) -> str:
+        return _validate_identifier(value)
+
 class PromptPlan(BaseModel):
     """High-level application strategy extracted from the submitted blueprint."""
 
@@ -110,7 +124,7 @@ class PromptPlan(BaseModel):
 class PromptStep(BaseModel):
     """Execution-ready instructions empowering an autonomous AI to design and deliver a robust application."""
 
-    id: str = Field(..., pattern=r"^[a-z0-9\-]+$", description="Stable identifier for the step.")
+    id: str = Field(..., description="Stable identifier for the step.")
     title: str
     system_prompt: str
     user_prompt: str
@@ -128,6 +142,10 @@ class PromptStep(BaseModel):
         None, description="Reviewer-suggested adjustments to clarify the step."
     )
 
+    @field_validator("id")
+    def validate_id(cls, value: str) -> str:
+        return _validate_identifier(value)
+
 
 class StepFeedback(BaseModel):
     """Structured reviewer feedback at the step level."""
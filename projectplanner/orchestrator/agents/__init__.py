@@ -1,6 +1,17 @@
 """Agent exports for The Coding Orchestrator."""
-from projectplanner.orchestrator.agents.milestones_agent import MilestonesAgent
-from projectplanner.orchestrator.agents.agent_planner import AgentPlanner
-from projectplanner.orchestrator.agents.graph_audit_agent import GraphAuditAgent
+from projectplanner.orchestrator.agents._client import get_openai_client
+from projectplanner.orchestrator.agents.milestones_agent import MilestonesAgent, get_milestones_agent
+from projectplanner.orchestrator.agents.milestones_batch import MilestonesBatch
+from projectplanner.orchestrator.agents.agent_planner import AgentPlanner, get_agent_planner
+from projectplanner.orchestrator.agents.graph_audit_agent import GraphAuditAgent, get_graph_audit_agent
 
-__all__ = ["MilestonesAgent", "AgentPlanner", "GraphAuditAgent"]
+__all__ = [
+    "MilestonesAgent",
+    "MilestonesBatch",
+    "AgentPlanner",
+    "GraphAuditAgent",
+    "get_milestones_agent",
+    "get_agent_planner",
+    "get_graph_audit_agent",
+    "get_openai_client",
+]
@@ -0,0 +1,38 @@
+"""Shared OpenAI client for orchestrator agents."""
+from __future__ import annotations
+
+from functools import lru_cache
+from typing import Any
+
+from projectplanner.agents._openai_helpers import load_openai_client_class
+
+try:  # pragma: no cover - optional dependency guard
+    import httpx
+except Exception:  # pragma: no cover
+    httpx = None  # type: ignore[assignment]
+
+MAX_CONNECTIONS = 100
+MAX_KEEPALIVE_CONNECTIONS = 50
+
+
+@lru_cache(maxsize=4)
+def get_openai_client(api_key: str) -> Any:
+    """Return the process-wide OpenAI client for `api_key`, or None without the SDK.
+
+    Agents share one client so they also share its pooled keep-alive
+    connections instead of opening a fresh pool (and TLS handshakes) each.
+    """
+
+    openai_cls = load_openai_client_class()
+    if openai_cls is None:
+        return None
+    if httpx is None:  # pragma: no cover - httpx ships with the OpenAI SDK
+        return openai_cls(api_key=api_key)
+    limits = httpx.Limits(
+        max_connections=MAX_CONNECTIONS,
+        max_keepalive_connections=MAX_KEEPALIVE_CONNECTIONS,
+    )
+    return openai_cls(api_key=api_key, http_client=httpx.Client(limits=limits, follow_redirects=True))
+
+
+__all__ = ["get_openai_client"]
@@ -0,0 +1,48 @@
+"""Shared JSON parsing helpers for orchestrator agents."""
+from __future__ import annotations
+
+import json
+import re
+from typing import Any, Dict, List
+
+try:  # pragma: no cover - optional dependency guard
+    import orjson
+except Exception:  # pragma: no cover
+    orjson = None  # type: ignore[assignment]
+
+
+# The closing fence is optional: truncated replies often stop before it.
+_JSON_FENCE_RE = re.compile(r"^\s*```(?:json)?\s*(.*?)\s*(?:```)?\s*$", re.DOTALL | re.IGNORECASE)
+
+_loads = orjson.loads if orjson is not None else json.loads
+
+
+def strip_code_fence(raw: str) -> str:
+    """Return the reply body without a surrounding Markdown code fence."""
+
+    match = _JSON_FENCE_RE.match(raw)
+    return match.group(1) if match else raw.strip()
+
+
+def parse_json(raw: str) -> Dict[str, Any]:
+    """Parse a model reply that may be wrapped in a Markdown code fence."""
+
+    candidate = strip_code_fence(raw)
+    return _loads(candidate) if candidate else {}
+
+
+def ensure_str_list(value: Any) -> List[str]:
+    """Coerce a model-provided list (or single string) into stripped, non-empty strings."""
+
+    if isinstance(value, list):
+        return [
+            text
+            for item in value
+            if (text := (item if isinstance(item, str) else str(item)).strip())
+        ]
+    if isinstance(value, str) and (text := value.strip()):
+        return [text]
+    return []
+
+
+__all__ = ["ensure_str_list", "parse_json", "strip_code_fence"]
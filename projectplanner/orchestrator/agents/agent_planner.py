@@ -1,21 +1,22 @@
 """AgentPlanner produces milestone-level execution prompts."""
 from __future__ import annotations
 
-import json
 import os
-from typing import Any, Dict, List, Optional
+import sys
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from typing import Any, Dict, Iterable, List, Optional, Sequence
 
 from projectplanner.agents._openai_helpers import (
+    collect_streamed_completion,
     create_chat_completion,
-    extract_choice_metadata,
-    extract_message_content,
+    load_openai_client_class,
 )
 from projectplanner.logging_utils import get_logger, log_prompt
-from projectplanner.orchestrator.config import (
-    get_max_completion_tokens,
-    get_prompt_model,
-    get_temperature,
-)
+from projectplanner.orchestrator.agents._client import get_openai_client
+from projectplanner.orchestrator.agents._json_utils import ensure_str_list, parse_json
+from projectplanner.orchestrator.cache import cache_scope, fingerprint, get_summary_cache
+from projectplanner.orchestrator.config import CONFIG, OrchestratorConfig
 from projectplanner.orchestrator.models import (
     BlueprintSummary,
     GraphCoverageSnapshot,
@@ -24,41 +25,71 @@ from projectplanner.orchestrator.models import (
     PromptBundle,
 )
 
-try:  # pragma: no cover - optional dependency guard
-    from openai import OpenAI
-except Exception:  # pragma: no cover
-    OpenAI = None  # type: ignore[assignment]
-
-
 LOGGER = get_logger(__name__)
 
-PROMPT_SYSTEM_PROMPT = (
+PROMPT_SYSTEM_PROMPT = sys.intern(
     "You are AgentPlanner, an elite staff engineer guiding autonomous coding agents. "
     "For each milestone you must output JSON with keys: title (string), system_prompt (string), user_prompt (string), "
     "acceptance_criteria (list of strings), expected_artifacts (list of strings), references (list of strings). "
     "System prompts must be authoritative and set guardrails. User prompts should include concrete tasks, inputs, and acceptance gates."
 )
 
+BATCH_SYSTEM_PROMPT = sys.intern(
+    PROMPT_SYSTEM_PROMPT
+    + " When several milestones are provided, respond with a single JSON object of the form "
+    '{"milestones": [{"milestone_id": <int>, "title": ..., "system_prompt": ..., "user_prompt": ..., '
+    '"acceptance_criteria": [...], "expected_artifacts": [...], "references": [...]}]} '
+    "containing exactly one entry per milestone, in milestone order."
+)
+
+# Invariant system messages shared by every request; never mutated.
+_SYSTEM_MESSAGE = {"role": "system", "content": PROMPT_SYSTEM_PROMPT}
+_BATCH_SYSTEM_MESSAGE = {"role": "system", "content": BATCH_SYSTEM_PROMPT}
+
+
+def _extend_bullets(parts: List[str], items: Iterable[str], placeholder: str) -> None:
+    """Append items as "- item" lines, or the placeholder when there are none."""
+
+    start = len(parts)
+    for item in items:
+        parts.extend(("- ", item, "\n"))
+    if len(parts) == start:
+        parts.append(placeholder)
+    else:
+        parts.pop()
+
+
+def _extend_coverage(parts: List[str], graph_snapshot: GraphCoverageSnapshot) -> None:
+    parts.append("\n\nGraph coverage reference:\nCovered nodes:\n")
+    _extend_bullets(parts, graph_snapshot.covered_nodes, "- Pending coverage")
+    parts.append("\nRemaining nodes of concern:\n")
+    _extend_bullets(parts, graph_snapshot.uncovered_nodes, "- All nodes covered so far")
+
 
 class AgentPlanner:
     """Generates milestone execution prompts."""
 
-    def __init__(self) -> None:
-        self._model = get_prompt_model()
-        self._temperature = get_temperature()
-        self._max_tokens = get_max_completion_tokens()
+    def __init__(self, config: Optional[OrchestratorConfig] = None) -> None:
+        cfg = config or CONFIG
+        self._model = cfg.prompt_model
+        self._temperature = cfg.temperature
+        self._max_tokens = cfg.max_completion_tokens
+        self._max_parallel = max(1, cfg.max_concurrent_requests)
+        self._cache = get_summary_cache()
+        self._cache_scope = cache_scope(self._model, PROMPT_SYSTEM_PROMPT, BATCH_SYSTEM_PROMPT)
         self._client = self._init_client()
 
     def _init_client(self):
         api_key = os.getenv("OPENAI_API_KEY")
-        if not api_key or OpenAI is None:
+        openai_cls = load_openai_client_class() if api_key else None
+        if openai_cls is None:
             LOGGER.warning(
                 "AgentPlanner running without OpenAI client; fallback heuristics active.",
                 extra={"event": "orchestrator.agentplanner.no_client"},
             )
             return None
         try:
-            client = OpenAI(api_key=api_key)
+            client = get_openai_client(api_key)
             LOGGER.info(
                 "AgentPlanner OpenAI client initialized",
                 extra={"event": "orchestrator.agentplanner.client_ready", "payload": {"model": self._model}},
@@ -78,21 +109,153 @@ class AgentPlanner:
         summary: BlueprintSummary,
         milestones: List[Milestone],
         graph_snapshot: GraphCoverageSnapshot,
+        use_cache: bool = True,
     ) -> PromptBundle:
-        """Generate sequential prompts for each milestone."""
+        """Generate sequential prompts for each milestone.
 
-        prompts: List[MilestonePrompt] = []
-        for milestone in sorted(milestones, key=lambda item: item.milestone_id):
-            previous_titles = [prompt.title for prompt in prompts]
-            prompt = self._generate_for_milestone(
+        Bundles produced entirely by GPT are cached by summary, milestones, and
+        coverage; `use_cache=False` forces a fresh call.
+        """
+
+        ordered = tuple(sorted(milestones, key=lambda item: item.milestone_id))
+        cache = self._cache if self._client else None
+        key = fingerprint(summary, *ordered, graph_snapshot, scope=self._cache_scope) if cache is not None else ""
+        if cache is not None and use_cache:
+            cached = cache.get_plan("prompts", key, PromptBundle)
+            if cached is not None:
+                LOGGER.info(
+                    "Prompt bundle served from cache",
+                    extra={"event": "orchestrator.agentplanner.cache_hit", "run_id": run_id},
+                )
+                return cached.model_copy(update={"run_id": run_id})
+        batched = self._generate_batch(
+            run_id=run_id,
+            milestones=ordered,
+            summary=summary,
+            graph_snapshot=graph_snapshot,
+        )
+        # Milestones the batch missed are generated independently, so each sees the
+        # batched title where one exists and the milestone's own title otherwise.
+        titles = [
+            prompt.title if (prompt := batched.get(milestone.milestone_id)) else self._milestone_title(milestone)
+            for milestone in ordered
+        ]
+        missing = [index for index, milestone in enumerate(ordered) if milestone.milestone_id not in batched]
+
+        def generate(index: int) -> MilestonePrompt:
+            return self._generate_for_milestone(
                 run_id=run_id,
-                milestone=milestone,
+                milestone=ordered[index],
                 summary=summary,
-                previous_titles=previous_titles,
+                previous_titles=titles[:index],
                 graph_snapshot=graph_snapshot,
             )
-            prompts.append(prompt)
-        return PromptBundle(run_id=run_id, prompts=prompts)
+
+        if self._client and len(missing) > 1:
+            with ThreadPoolExecutor(max_workers=min(self._max_parallel, len(missing))) as pool:
+                generated = dict(zip(missing, pool.map(generate, missing)))
+        else:
+            generated = {index: generate(index) for index in missing}
+        prompts = [
+            batched.get(milestone.milestone_id) or generated[index]
+            for index, milestone in enumerate(ordered)
+        ]
+        bundle = PromptBundle.model_construct(run_id=run_id, prompts=prompts)
+        # Per-milestone fallbacks may be heuristic, so only complete batches are cached.
+        if cache is not None and len(batched) == len(ordered):
+            try:
+                cache.put_plan("prompts", key, bundle)
+            except Exception:
+                LOGGER.exception(
+                    "Failed to store prompt bundle in cache",
+                    extra={"event": "orchestrator.agentplanner.cache_error", "run_id": run_id},
+                )
+        return bundle
+
+    def _generate_batch(
+        self,
+        *,
+        run_id: str,
+        milestones: Sequence[Milestone],
+        summary: BlueprintSummary,
+        graph_snapshot: GraphCoverageSnapshot,
+    ) -> Dict[int, MilestonePrompt]:
+        """Request prompts for every milestone in one call; empty on failure."""
+
+        if not self._client or len(milestones) < 2:
+            return {}
+
+        payload = self._format_batch_payload(milestones, summary, graph_snapshot)
+        log_prompt(
+            agent="AgentPlanner",
+            role="system",
+            prompt=BATCH_SYSTEM_PROMPT,
+            run_id=run_id,
+            stage="request",
+            model=self._model,
+            metadata={"mode": "batch"},
+        )
+        log_prompt(
+            agent="AgentPlanner",
+            role="user",
+            prompt=payload,
+            run_id=run_id,
+            stage="request",
+            model=self._model,
+            metadata={"mode": "batch"},
+        )
+        try:
+            response = create_chat_completion(
+                self._client,
+                model=self._model,
+                messages=[_BATCH_SYSTEM_MESSAGE, {"role": "user", "content": payload}],
+                temperature=self._temperature,
+                max_tokens=self._max_tokens,
+                response_format={"type": "json_object"},
+                stream=True,
+            )
+            content, metadata = collect_streamed_completion(response)
+            log_prompt(
+                agent="AgentPlanner",
+                role="assistant",
+                prompt=content,
+                run_id=run_id,
+                stage="response",
+                model=metadata.get("model", self._model),
+                metadata={**metadata, "mode": "batch"},
+            )
+            entries = self._parse_json(content).get("milestones")
+            if not isinstance(entries, list):
+                raise ValueError("Batch reply did not include a milestones list.")
+        except Exception:
+            LOGGER.exception(
+                "Batched prompt generation failed; generating prompts per milestone.",
+                extra={"event": "orchestrator.agentplanner.batch_error", "run_id": run_id},
+            )
+            return {}
+
+        by_id = {milestone.milestone_id: milestone for milestone in milestones}
+        prompts: Dict[int, MilestonePrompt] = {}
+        for entry in entries:
+            if not isinstance(entry, dict):
+                continue
+            try:
+                milestone = by_id.get(int(entry.get("milestone_id")))
+            except (TypeError, ValueError):
+                continue
+            if milestone is not None and milestone.milestone_id not in prompts:
+                prompts[milestone.milestone_id] = self._build_prompt(milestone, entry)
+        missing = [mid for mid in by_id if mid not in prompts]
+        if missing:
+            LOGGER.warning(
+                "Batched prompt reply skipped milestones; falling back for those.",
+                extra={
+                    "event": "orchestrator.agentplanner.batch_partial",
+                    "run_id": run_id,
+                    "payload": {"missing": missing},
+                },
+            )
+        return prompts
 
     def _generate_for_milestone(
         self,
@@ -127,15 +290,12 @@ class AgentPlanner:
             response = create_chat_completion(
                 self._client,
                 model=self._model,
-                messages=[
-                    {"role": "system", "content": PROMPT_SYSTEM_PROMPT},
-                    {"role": "user", "content": payload},
-                ],
+                messages=[_SYSTEM_MESSAGE, {"role": "user", "content": payload}],
                 temperature=self._temperature,
                 max_tokens=self._max_tokens,
+                stream=True,
             )
-            metadata = extract_choice_metadata(response)
-            content = self._extract_content(response)
+            content, metadata = collect_streamed_completion(response)
             log_prompt(
                 agent="AgentPlanner",
                 role="assistant",
@@ -145,16 +305,7 @@ class AgentPlanner:
                 model=metadata.get("model", self._model),
                 metadata=metadata,
             )
-            data = self._parse_json(content)
-            return MilestonePrompt(
-                milestone_id=milestone.milestone_id,
-                title=data.get("title", f"Milestone {milestone.milestone_id}"),
-                system_prompt=data.get("system_prompt", ""),
-                user_prompt=data.get("user_prompt", ""),
-                acceptance_criteria=self._ensure_list(data.get("acceptance_criteria")),
-                expected_artifacts=self._ensure_list(data.get("expected_artifacts")),
-                references=self._ensure_list(data.get("references")),
-            )
+            return self._build_prompt(milestone, self._parse_json(content))
         except Exception:
             LOGGER.exception(
                 "Prompt generation failed for milestone %s; using heuristic prompt.",
@@ -167,6 +318,46 @@ class AgentPlanner:
             )
             return self._heuristic_prompt(milestone, summary, previous_titles)
 
+    def _build_prompt(self, milestone: Milestone, data: Dict[str, Any]) -> MilestonePrompt:
+        # Values are coerced here so the model can be built without re-validation.
+        return MilestonePrompt.model_construct(
+            milestone_id=milestone.milestone_id,
+            title=str(data.get("title") or f"Milestone {milestone.milestone_id}"),
+            system_prompt=str(data.get("system_prompt") or ""),
+            user_prompt=str(data.get("user_prompt") or ""),
+            acceptance_criteria=self._ensure_list(data.get("acceptance_criteria")),
+            expected_artifacts=self._ensure_list(data.get("expected_artifacts")),
+            references=self._ensure_list(data.get("references")),
+        )
+
+    @staticmethod
+    def _format_batch_payload(
+        milestones: Sequence[Milestone],
+        summary: BlueprintSummary,
+        graph_snapshot: GraphCoverageSnapshot,
+    ) -> str:
+        parts: List[str] = [
+            "Application summary:\n",
+            summary.summary,
+            "\n\nMilestones (execute in this order; later milestones build on earlier ones):\n",
+        ]
+        for index, milestone in enumerate(milestones):
+            if index:
+                parts.append("\n\n")
+            parts.extend(
+                (
+                    f"Milestone {milestone.milestone_id} details:\n",
+                    milestone.details,
+                    f"\nMilestone {milestone.milestone_id} context:\n",
+                    milestone.context or "(context not provided)",
+                )
+            )
+        _extend_coverage(parts, graph_snapshot)
+        parts.append(
+            "\n\nGenerate a JSON object with a milestones list holding the required fields for every milestone."
+        )
+        return "".join(parts)
+
     @staticmethod
     def _format_payload(
         milestone: Milestone,
@@ -174,54 +365,31 @@ class AgentPlanner:
         previous_titles: List[str],
         graph_snapshot: GraphCoverageSnapshot,
     ) -> str:
-        previous_section = "\n".join(f"- {title}" for title in previous_titles) or "- None yet"
-        uncovered_section = (
-            "\n".join(f"- {node}" for node in graph_snapshot.uncovered_nodes)
-            if graph_snapshot.uncovered_nodes
-            else "- All nodes covered so far"
-        )
-        covered_section = (
-            "\n".join(f"- {node}" for node in graph_snapshot.covered_nodes)
-            if graph_snapshot.covered_nodes
-            else "- Pending coverage"
-        )
-        return (
-            f"Application summary:\n{summary.summary}\n\n"
-            f"Milestone {milestone.milestone_id} details:\n{milestone.details}\n\n"
-            f"Milestone context:\n{milestone.context or '(context not provided)'}\n\n"
-            f"Prior milestones delivered:\n{previous_section}\n\n"
-            f"Graph coverage reference:\nCovered nodes:\n{covered_section}\nRemaining nodes of concern:\n{uncovered_section}\n\n"
-            f"Generate a JSON object with the required fields."
-        )
+        parts: List[str] = [
+            "Application summary:\n",
+            summary.summary,
+            f"\n\nMilestone {milestone.milestone_id} details:\n",
+            milestone.details,
+            "\n\nMilestone context:\n",
+            milestone.context or "(context not provided)",
+            "\n\nPrior milestones delivered:\n",
+        ]
+        _extend_bullets(parts, previous_titles, "- None yet")
+        _extend_coverage(parts, graph_snapshot)
+        parts.append("\n\nGenerate a JSON object with the required fields.")
+        return "".join(parts)
 
     @staticmethod
-    def _parse_json(raw: str) -> Dict[str, Any]:
-        candidate = raw.strip()
-        if candidate.startswith("```"):
-            candidate = candidate.strip("`")
-            if candidate.lower().startswith("json"):
-                candidate = candidate[4:]
-        candidate = candidate.strip()
-        return json.loads(candidate) if candidate else {}
+    def _milestone_title(milestone: Milestone) -> str:
+        return milestone.details.split(".")[0].strip() or f"Milestone {milestone.milestone_id}"
 
     @staticmethod
-    def _ensure_list(value: Any) -> List[str]:
-        if isinstance(value, list):
-            return [str(item).strip() for item in value if str(item).strip()]
-        if isinstance(value, str) and value.strip():
-            return [value.strip()]
-        return []
+    def _parse_json(raw: str) -> Dict[str, Any]:
+        return parse_json(raw)
 
     @staticmethod
-    def _extract_content(response: Any) -> str:
-        if hasattr(response, "choices") and response.choices:
-            return extract_message_content(response.choices[0].message)
-        if isinstance(response, dict):
-            choices = response.get("choices") or []
-            if choices:
-                message = choices[0].get("message")
-                return extract_message_content(message)
-        return ""
+    def _ensure_list(value: Any) -> List[str]:
+        return ensure_str_list(value)
 
     def _heuristic_prompt(
         self,
@@ -229,7 +397,7 @@ class AgentPlanner:
         summary: BlueprintSummary,
         previous_titles: List[str],
     ) -> MilestonePrompt:
-        title = milestone.details.split(".")[0].strip() or f"Milestone {milestone.milestone_id}"
+        title = self._milestone_title(milestone)
         system_prompt = (
             "You are an autonomous senior engineer executing milestone goals with discipline. "
             "Follow the user instructions precisely, produce code when necessary, and maintain audit-ready notes."
@@ -257,7 +425,7 @@ class AgentPlanner:
                 "payload": {"milestone_id": milestone.milestone_id, "previous": previous_titles},
             },
         )
-        return MilestonePrompt(
+        return MilestonePrompt.model_construct(
             milestone_id=milestone.milestone_id,
             title=title,
             system_prompt=system_prompt,
@@ -268,4 +436,11 @@ class AgentPlanner:
         )
 
 
-__all__ = ["AgentPlanner"]
+@lru_cache(maxsize=1)
+def get_agent_planner() -> AgentPlanner:
+    """Return the shared AgentPlanner instance reused across orchestrator sessions."""
+
+    return AgentPlanner()
+
+
+__all__ = ["AgentPlanner", "get_agent_planner"]
@@ -1,21 +1,22 @@
 """Graph audit agent validating coverage between milestones and components."""
 from __future__ import annotations
 
-import json
 import os
-from typing import Any, Dict, List
+import sys
+from functools import lru_cache
+from itertools import chain
+from typing import Any, Dict, List, Optional
 
 from projectplanner.agents._openai_helpers import (
     create_chat_completion,
     extract_choice_metadata,
     extract_message_content,
+    load_openai_client_class,
 )
 from projectplanner.logging_utils import get_logger, log_prompt
-from projectplanner.orchestrator.config import (
-    get_max_completion_tokens,
-    get_prompt_model,
-    get_temperature,
-)
+from projectplanner.orchestrator.agents._client import get_openai_client
+from projectplanner.orchestrator.agents._json_utils import ensure_str_list, parse_json
+from projectplanner.orchestrator.config import CONFIG, OrchestratorConfig
 from projectplanner.orchestrator.graph_store import GraphStore
 from projectplanner.orchestrator.models import (
     BlueprintSummary,
@@ -23,41 +24,40 @@ from projectplanner.orchestrator.models import (
     Milestone,
 )
 
-try:  # pragma: no cover - optional dependency guard
-    from openai import OpenAI
-except Exception:  # pragma: no cover
-    OpenAI = None  # type: ignore[assignment]
-
-
 LOGGER = get_logger(__name__)
 
-AUDIT_SYSTEM_PROMPT = (
+AUDIT_SYSTEM_PROMPT = sys.intern(
     "You are GraphAuditAgent, accountable for verifying that every blueprint component is covered by the milestone plan. "
     "Given the component graph and milestone descriptions, respond with JSON containing: "
     "notes (string), uncovered_nodes (list of component names requiring additional work), "
     "covered_nodes (list of components that appear to be satisfied)."
 )
 
+# Invariant system message shared by every audit request; never mutated.
+_SYSTEM_MESSAGE = {"role": "system", "content": AUDIT_SYSTEM_PROMPT}
+
 
 class GraphAuditAgent:
     """Validates graph coverage using GPT or heuristics."""
 
-    def __init__(self) -> None:
-        self._model = get_prompt_model()
-        self._temperature = get_temperature()
-        self._max_tokens = get_max_completion_tokens()
+    def __init__(self, config: Optional[OrchestratorConfig] = None) -> None:
+        cfg = config or CONFIG
+        self._model = cfg.prompt_model
+        self._temperature = cfg.temperature
+        self._max_tokens = cfg.max_completion_tokens
         self._client = self._init_client()
 
     def _init_client(self):
         api_key = os.getenv("OPENAI_API_KEY")
-        if not api_key or OpenAI is None:
+        openai_cls = load_openai_client_class() if api_key else None
+        if openai_cls is None:
             LOGGER.warning(
                 "GraphAuditAgent running without OpenAI client; heuristic audit active.",
                 extra={"event": "orchestrator.graphaudit.no_client"},
             )
             return None
         try:
-            client = OpenAI(api_key=api_key)
+            client = get_openai_client(api_key)
             LOGGER.info(
                 "GraphAuditAgent OpenAI client initialized",
                 extra={"event": "orchestrator.graphaudit.client_ready", "payload": {"model": self._model}},
@@ -103,10 +103,7 @@ class GraphAuditAgent:
             response = create_chat_completion(
                 self._client,
                 model=self._model,
-                messages=[
-                    {"role": "system", "content": AUDIT_SYSTEM_PROMPT},
-                    {"role": "user", "content": payload},
-                ],
+                messages=[_SYSTEM_MESSAGE, {"role": "user", "content": payload}],
                 temperature=self._temperature,
                 max_tokens=self._max_tokens,
             )
@@ -124,11 +121,12 @@ class GraphAuditAgent:
             data = self._parse_json(content)
             covered = self._merge_lists(baseline_snapshot.covered_nodes, data.get("covered_nodes"))
             uncovered = self._merge_lists(baseline_snapshot.uncovered_nodes, data.get("uncovered_nodes"))
-            return GraphCoverageSnapshot(
+            notes = data.get("notes")
+            return GraphCoverageSnapshot.model_construct(
                 run_id=run_id,
-                covered_nodes=sorted(set(covered)),
-                uncovered_nodes=sorted(set(uncovered)),
-                notes=data.get("notes") or baseline_snapshot.notes,
+                covered_nodes=sorted(covered),
+                uncovered_nodes=sorted(uncovered),
+                notes=str(notes) if notes else baseline_snapshot.notes,
             )
         except Exception:
             LOGGER.exception(
@@ -143,39 +141,39 @@ class GraphAuditAgent:
         milestones: List[Milestone],
         graph_store: GraphStore,
     ) -> str:
-        milestone_lines = "\n".join(
-            f"Milestone {milestone.milestone_id}: {milestone.details} | Context: {milestone.context}"
-            for milestone in sorted(milestones, key=lambda item: item.milestone_id)
-        )
-        node_lines = "\n".join(
-            f"- {node.name} :: milestones {', '.join(str(mid) for mid in node.milestone_ids) or 'none'}"
-            for node in sorted(graph_store.nodes(), key=lambda item: item.name.lower())
-        )
-        return (
-            f"Application summary:\n{summary.summary}\n\n"
-            f"Milestones:\n{milestone_lines or 'None'}\n\n"
-            f"Graph nodes and linked milestones:\n{node_lines or '- None registered'}\n\n"
-            "Confirm coverage for each node."
+        parts: List[str] = ["Application summary:\n", summary.summary, "\n\nMilestones:\n"]
+        if milestones:
+            for index, milestone in enumerate(sorted(milestones, key=lambda item: item.milestone_id)):
+                if index:
+                    parts.append("\n")
+                parts.extend(
+                    (
+                        f"Milestone {milestone.milestone_id}: ",
+                        milestone.details,
+                        " | Context: ",
+                        milestone.context,
+                    )
+                )
+        else:
+            parts.append("None")
+        parts.extend(
+            (
+                "\n\nGraph nodes and linked milestones:\n",
+                graph_store.formatted_node_listing() or "- None registered",
+                "\n\nConfirm coverage for each node.",
+            )
         )
+        return "".join(parts)
 
     @staticmethod
     def _parse_json(raw: str) -> Dict[str, Any]:
-        candidate = raw.strip()
-        if candidate.startswith("```"):
-            candidate = candidate.strip("`")
-            if candidate.lower().startswith("json"):
-                candidate = candidate[4:]
-        candidate = candidate.strip()
-        return json.loads(candidate) if candidate else {}
+        return parse_json(raw)
 
     @staticmethod
     def _merge_lists(base: List[str], extra: Any) -> List[str]:
-        merged = list(base)
-        if isinstance(extra, list):
-            merged.extend(str(item).strip() for item in extra if str(item).strip())
-        elif isinstance(extra, str) and extra.strip():
-            merged.append(extra.strip())
-        return merged
+        """Merge base and model-provided names, de-duplicated in first-seen order."""
+
+        return list(dict.fromkeys(chain(base, ensure_str_list(extra))))
 
     @staticmethod
     def _extract_content(response: Any) -> str:
@@ -197,7 +195,7 @@ class GraphAuditAgent:
             )
         else:
             notes = snapshot.notes or "Heuristic audit: coverage inferred from milestone text."
-        return GraphCoverageSnapshot(
+        return GraphCoverageSnapshot.model_construct(
             run_id=snapshot.run_id,
             covered_nodes=snapshot.covered_nodes,
             uncovered_nodes=snapshot.uncovered_nodes,
@@ -205,4 +203,11 @@ class GraphAuditAgent:
         )
 
 
-__all__ = ["GraphAuditAgent"]
+@lru_cache(maxsize=1)
+def get_graph_audit_agent() -> GraphAuditAgent:
+    """Return the shared GraphAuditAgent instance reused across orchestrator sessions."""
+
+    return GraphAuditAgent()
+
+
+__all__ = ["GraphAuditAgent", "get_graph_audit_agent"]
@@ -1,31 +1,27 @@
 """Milestones agent orchestrating summary and milestone synthesis."""
 from __future__ import annotations
 
-import json
+import asyncio
 import os
-import textwrap
-from typing import Any, Dict, Iterable, List
+import re
+import threading
+from concurrent.futures import Future
+from functools import lru_cache
+from typing import Any, Callable, Dict, Iterable, List, Optional, Sequence, Tuple
 
 from projectplanner.agents._openai_helpers import (
+    MAX_TOKENS_PARAMETER,
+    collect_streamed_completion,
     create_chat_completion,
-    extract_choice_metadata,
-    extract_message_content,
+    load_openai_client_class,
 )
 from projectplanner.logging_utils import get_logger, log_prompt
-from projectplanner.orchestrator.config import (
-    get_max_completion_tokens,
-    get_milestone_model,
-    get_summary_model,
-    get_temperature,
-)
+from projectplanner.orchestrator.agents._client import get_openai_client
+from projectplanner.orchestrator.agents._json_utils import ensure_str_list, parse_json
+from projectplanner.orchestrator.cache import cache_key, cache_scope, fingerprint, get_summary_cache
+from projectplanner.orchestrator.config import CONFIG, OrchestratorConfig
 from projectplanner.orchestrator.models import BlueprintSummary, Milestone, MilestonePlan
 
-try:  # pragma: no cover - optional dependency guard
-    from openai import OpenAI
-except Exception:  # pragma: no cover
-    OpenAI = None  # type: ignore[assignment]
-
-
 LOGGER = get_logger(__name__)
 
 SUMMARY_SYSTEM_PROMPT = (
@@ -40,32 +36,133 @@ MILESTONE_SYSTEM_PROMPT = (
     "Given the approved application summary, produce exactly five milestones following the schema: "
     "{\"milestones\": [{\"milestoneID\": number, \"MilestoneDetails\": string, \"Context\": string}]}. "
     "Each milestone should be delivery-focused, mutually exclusive, and collectively cover the entire scope. "
-    "Context must cite the specific blueprint signals informing the milestone."
+    "Context must cite the specific blueprint signals informing the milestone. "
+    "Return milestones in the specified JSON schema."
 )
 
+SUMMARY_USER_TEMPLATE = "Blueprint:\n{blueprint}"
+MILESTONE_USER_TEMPLATE = "Approved application summary:\n{summary}\n\n{highlights}\n\n{risks}\n\n{components}"
+
+# Static system messages form the shared prompt prefix; run-specific content
+# only ever appears in the trailing user message so the prefix stays cacheable.
+_SUMMARY_SYSTEM_MESSAGE = {"role": "system", "content": SUMMARY_SYSTEM_PROMPT}
+_MILESTONE_SYSTEM_MESSAGE = {"role": "system", "content": MILESTONE_SYSTEM_PROMPT}
+
+_STRING_LIST_SCHEMA = {"type": "array", "items": {"type": "string"}}
+
+# Free-form `metadata` rules out strict mode for summaries; milestones are strict.
+SUMMARY_RESPONSE_FORMAT: Dict[str, Any] = {
+    "type": "json_schema",
+    "json_schema": {
+        "name": "blueprint_summary",
+        "strict": False,
+        "schema": {
+            "type": "object",
+            "properties": {
+                "summary": {"type": "string"},
+                "highlights": _STRING_LIST_SCHEMA,
+                "risks": _STRING_LIST_SCHEMA,
+                "components": _STRING_LIST_SCHEMA,
+                "metadata": {"type": "object"},
+            },
+            "required": ["summary", "highlights", "risks", "components"],
+        },
+    },
+}
+
+MILESTONE_RESPONSE_FORMAT: Dict[str, Any] = {
+    "type": "json_schema",
+    "json_schema": {
+        "name": "milestone_plan",
+        "strict": True,
+        "schema": {
+            "type": "object",
+            "properties": {
+                "milestones": {
+                    "type": "array",
+                    "items": {
+                        "type": "object",
+                        "properties": {
+                            "milestoneID": {"type": "integer"},
+                            "MilestoneDetails": {"type": "string"},
+                            "Context": {"type": "string"},
+                        },
+                        "required": ["milestoneID", "MilestoneDetails", "Context"],
+                        "additionalProperties": False,
+                    },
+                },
+            },
+            "required": ["milestones"],
+            "additionalProperties": False,
+        },
+    },
+}
+
 MAX_CONTEXT_CHARS = 18000
+COMPRESSION_MODEL = "microsoft/llmlingua-2-xlm-roberta-large-meetingbank"
+COMPRESSION_RATE = 0.4
+
+# Substring (not word) matches, mirroring the original keyword checks.
+_RISK_RE = re.compile("risk", re.IGNORECASE)
+_COMPONENT_RE = re.compile("api|service|database|frontend", re.IGNORECASE)
+
+
+@lru_cache(maxsize=1)
+def _load_prompt_compressor() -> Any:
+    """Load the optional LLMLingua compressor once; None when unavailable."""
+
+    try:  # pragma: no cover - optional dependency guard
+        from llmlingua import PromptCompressor
+    except Exception:  # pragma: no cover
+        return None
+    try:  # pragma: no cover - requires model weights
+        return PromptCompressor(model_name=COMPRESSION_MODEL, use_llmlingua2=True)
+    except Exception:  # pragma: no cover
+        LOGGER.exception(
+            "Failed to load LLMLingua compressor; falling back to truncation.",
+            extra={"event": "orchestrator.milestones.compressor_error"},
+        )
+        return None
 
 
 class MilestonesAgent:
     """Agent responsible for blueprint synthesis and milestone planning."""
 
-    def __init__(self) -> None:
-        self._summary_model = get_summary_model()
-        self._milestone_model = get_milestone_model()
-        self._temperature = get_temperature()
-        self._max_tokens = get_max_completion_tokens()
+    def __init__(self, config: Optional[OrchestratorConfig] = None) -> None:
+        cfg = config or CONFIG
+        self._summary_model = cfg.summary_model
+        self._milestone_model = cfg.milestone_model
+        self._fast_model = cfg.fast_model
+        self._temperature = cfg.temperature
+        self._max_tokens = cfg.max_completion_tokens
+        # Bounds in-flight OpenAI calls across every thread sharing this agent.
+        self._request_slots = threading.BoundedSemaphore(cfg.max_concurrent_requests)
+        self._summary_cache = get_summary_cache()
+        self._summary_cache_scope = cache_scope(
+            self._summary_model, self._fast_model, SUMMARY_SYSTEM_PROMPT, SUMMARY_USER_TEMPLATE, SUMMARY_RESPONSE_FORMAT
+        )
+        self._milestone_cache_scope = cache_scope(
+            self._milestone_model,
+            self._fast_model,
+            MILESTONE_SYSTEM_PROMPT,
+            MILESTONE_USER_TEMPLATE,
+            MILESTONE_RESPONSE_FORMAT,
+        )
+        self._inflight: Dict[str, "Future[Optional[BlueprintSummary]]"] = {}
+        self._inflight_lock = threading.Lock()
         self._client = self._init_client()
 
     def _init_client(self):
         api_key = os.getenv("OPENAI_API_KEY")
-        if not api_key or OpenAI is None:
+        openai_cls = load_openai_client_class() if api_key else None
+        if openai_cls is None:
             LOGGER.warning(
                 "MilestonesAgent running without OpenAI client; fallback heuristics active.",
                 extra={"event": "orchestrator.milestones.no_client"},
             )
             return None
         try:
-            client = OpenAI(api_key=api_key)
+            client = get_openai_client(api_key)
             LOGGER.info(
                 "MilestonesAgent OpenAI client initialized",
                 extra={
@@ -84,181 +181,396 @@ class MilestonesAgent:
             )
             return None
 
-    def summarize_blueprint(self, *, run_id: str, blueprint_text: str) -> BlueprintSummary:
-        """Produce a structured summary for the supplied blueprint text."""
+    def summarize_blueprint(
+        self, *, run_id: str, blueprint_text: str, use_cache: bool = True
+    ) -> BlueprintSummary:
+        """Produce a structured summary for the supplied blueprint text.
 
-        cleaned = self._compress_text(blueprint_text)
-        if not self._client:
-            return self._heuristic_summary(run_id=run_id, blueprint_text=cleaned)
+        GPT summaries are cached by blueprint content; pass `use_cache=False`
+        to force a fresh call (the cache is still refreshed with the result).
+        Concurrent calls for the same blueprint share a single in-flight request.
+        """
 
-        user_prompt = textwrap.dedent(
-            f"""
-            Blueprint:
-            {cleaned}
-            """
-        ).strip()
-        messages = [
-            {"role": "system", "content": SUMMARY_SYSTEM_PROMPT},
-            {"role": "user", "content": user_prompt},
-        ]
-        log_prompt(
-            agent="MilestonesAgent",
-            role="system",
-            prompt=SUMMARY_SYSTEM_PROMPT,
-            run_id=run_id,
-            stage="request",
-            model=self._summary_model,
-        )
-        log_prompt(
-            agent="MilestonesAgent",
-            role="user",
-            prompt=user_prompt,
-            run_id=run_id,
-            stage="request",
-            model=self._summary_model,
-        )
+        source = (blueprint_text or "").strip()
+        if not self._client:
+            return self._heuristic_summary(run_id=run_id, blueprint_text=self._truncate_text(source))
+
+        cache = self._summary_cache
+        if cache is not None and use_cache:
+            cached = cache.get(source, self._summary_cache_scope)
+            if cached is not None:
+                LOGGER.info(
+                    "Blueprint summary served from cache",
+                    extra={"event": "orchestrator.milestones.summary_cache_hit", "run_id": run_id},
+                )
+                return cached.model_copy(update={"run_id": run_id})
+
+        key = cache_key(source)
+        with self._inflight_lock:
+            future = self._inflight.get(key)
+            leader = future is None
+            if leader:
+                future = self._inflight[key] = Future()
+        if not leader:
+            summary = future.result()
+            LOGGER.info(
+                "Blueprint summary shared with in-flight request",
+                extra={"event": "orchestrator.milestones.summary_coalesced", "run_id": run_id},
+            )
+        else:
+            try:
+                summary = self._request_summary(run_id=run_id, source=source)
+            except BaseException as exc:
+                future.set_exception(exc)
+                raise
+            finally:
+                with self._inflight_lock:
+                    self._inflight.pop(key, None)
+            future.set_result(summary)
+        if summary is None:
+            return self._heuristic_summary(run_id=run_id, blueprint_text=self._truncate_text(source))
+        return summary if leader else summary.model_copy(update={"run_id": run_id})
+
+    def _request_summary(self, *, run_id: str, source: str) -> Optional[BlueprintSummary]:
+        """Ask GPT for a summary and cache it; returns None when the request fails."""
+
+        _, messages = self._summary_messages(self._compress_text(source))
         try:
-            response = create_chat_completion(
-                self._client,
+            payload, _ = self._complete_json(
+                run_id=run_id,
                 model=self._summary_model,
                 messages=messages,
-                temperature=self._temperature,
-                max_tokens=self._max_tokens,
-            )
-            metadata = extract_choice_metadata(response)
-            content = self._extract_content(response)
-            log_prompt(
-                agent="MilestonesAgent",
-                role="assistant",
-                prompt=content,
-                run_id=run_id,
-                stage="response",
-                model=metadata.get("model", self._summary_model),
-                metadata=metadata,
-            )
-            payload = self._parse_json(content)
-            return BlueprintSummary(
-                run_id=run_id,
-                summary=payload.get("summary", ""),
-                highlights=self._ensure_list(payload.get("highlights")),
-                risks=self._ensure_list(payload.get("risks")),
-                components=self._ensure_list(payload.get("components")),
-                metadata=payload.get("metadata", {}) or {},
+                response_format=SUMMARY_RESPONSE_FORMAT,
+                accept=self._is_complete_summary,
             )
+            summary = self._summary_from_payload(run_id, payload)
         except Exception:
             LOGGER.exception(
                 "Summary generation via GPT failed; using heuristics.",
                 extra={"event": "orchestrator.milestones.summary_error", "run_id": run_id},
             )
-            return self._heuristic_summary(run_id=run_id, blueprint_text=cleaned)
+            return None
+        self.remember_summary(source, summary)
+        return summary
+
+    def generate_milestones(
+        self, *, run_id: str, summary: BlueprintSummary, use_cache: bool = True
+    ) -> MilestonePlan:
+        """Generate exactly five milestones from the approved summary.
 
-    def generate_milestones(self, *, run_id: str, summary: BlueprintSummary) -> MilestonePlan:
-        """Generate exactly five milestones from the approved summary."""
+        GPT plans are cached by summary content; `use_cache=False` forces a fresh call.
+        """
 
         if not self._client:
             return self._heuristic_milestones(run_id=run_id, summary=summary)
 
-        sections = [
-            self._format_section("Highlights", summary.highlights),
-            self._format_section("Known risks", summary.risks),
-            self._format_section("Components to cover", summary.components),
-        ]
-        prompt = textwrap.dedent(
-            f"""
-            Approved application summary:
-            {summary.summary}
-
-            {sections[0]}
-
-            {sections[1]}
-
-            {sections[2]}
+        cache = self._summary_cache
+        key = fingerprint(summary, scope=self._milestone_cache_scope) if cache is not None else ""
+        if cache is not None and use_cache:
+            cached = cache.get_plan("milestones", key, MilestonePlan)
+            if cached is not None:
+                LOGGER.info(
+                    "Milestone plan served from cache",
+                    extra={"event": "orchestrator.milestones.plan_cache_hit", "run_id": run_id},
+                )
+                return cached.model_copy(update={"run_id": run_id})
 
-            Return milestones in the specified JSON schema.
-            """
-        ).strip()
-        messages = [
-            {"role": "system", "content": MILESTONE_SYSTEM_PROMPT},
-            {"role": "user", "content": prompt},
-        ]
-        log_prompt(
-            agent="MilestonesAgent",
-            role="system",
-            prompt=MILESTONE_SYSTEM_PROMPT,
-            run_id=run_id,
-            stage="request",
-            model=self._milestone_model,
-        )
-        log_prompt(
-            agent="MilestonesAgent",
-            role="user",
-            prompt=prompt,
-            run_id=run_id,
-            stage="request",
-            model=self._milestone_model,
-        )
         try:
+            payload, content = self._complete_json(
+                run_id=run_id,
+                model=self._milestone_model,
+                messages=self._milestone_messages(summary),
+                response_format=MILESTONE_RESPONSE_FORMAT,
+                accept=self._has_five_milestones,
+            )
+            plan = self._plan_from_payload(run_id, payload, content)
+        except Exception:
+            LOGGER.exception(
+                "Milestone generation via GPT failed; using heuristics.",
+                extra={"event": "orchestrator.milestones.milestone_error", "run_id": run_id},
+            )
+            return self._heuristic_milestones(run_id=run_id, summary=summary)
+        self._store_milestones(key, plan)
+        return plan
+
+    def _complete(
+        self,
+        *,
+        run_id: str,
+        model: str,
+        messages: List[Dict[str, str]],
+        response_format: Dict[str, Any],
+    ) -> str:
+        for message in messages:
+            log_prompt(
+                agent="MilestonesAgent",
+                role=message["role"],
+                prompt=message["content"],
+                run_id=run_id,
+                stage="request",
+                model=model,
+            )
+        with self._request_slots:
             response = create_chat_completion(
                 self._client,
-                model=self._milestone_model,
+                model=model,
                 messages=messages,
                 temperature=self._temperature,
                 max_tokens=self._max_tokens,
+                response_format=response_format,
+                stream=True,
             )
-            metadata = extract_choice_metadata(response)
-            content = self._extract_content(response)
-            log_prompt(
-                agent="MilestonesAgent",
-                role="assistant",
-                prompt=content,
-                run_id=run_id,
-                stage="response",
-                model=metadata.get("model", self._milestone_model),
-                metadata=metadata,
+            content, metadata = collect_streamed_completion(response, stop_on_json_close=True)
+        log_prompt(
+            agent="MilestonesAgent",
+            role="assistant",
+            prompt=content,
+            run_id=run_id,
+            stage="response",
+            model=metadata.get("model", model),
+            metadata=metadata,
+        )
+        return content
+
+    def _complete_json(
+        self,
+        *,
+        run_id: str,
+        model: str,
+        messages: List[Dict[str, str]],
+        response_format: Dict[str, Any],
+        accept: Callable[[Dict[str, Any]], bool],
+    ) -> Tuple[Dict[str, Any], str]:
+        """Try the fast model first and escalate to `model` when its reply is unusable."""
+
+        fast_model = self._fast_model
+        if fast_model and fast_model != model:
+            try:
+                content = self._complete(
+                    run_id=run_id, model=fast_model, messages=messages, response_format=response_format
+                )
+                payload = self._parse_json(content)
+                if isinstance(payload, dict) and accept(payload):
+                    return payload, content
+            except Exception:
+                LOGGER.warning(
+                    "Fast model request failed",
+                    extra={"event": "orchestrator.milestones.fast_model_error", "run_id": run_id},
+                    exc_info=True,
+                )
+            LOGGER.info(
+                "Escalating to primary model",
+                extra={
+                    "event": "orchestrator.milestones.escalated",
+                    "run_id": run_id,
+                    "payload": {"from": fast_model, "to": model},
+                },
+            )
+        content = self._complete(run_id=run_id, model=model, messages=messages, response_format=response_format)
+        return self._parse_json(content), content
+
+    @staticmethod
+    def _is_complete_summary(payload: Dict[str, Any]) -> bool:
+        return bool(str(payload.get("summary") or "").strip())
+
+    @staticmethod
+    def _has_five_milestones(payload: Dict[str, Any]) -> bool:
+        items = payload.get("milestones")
+        if not isinstance(items, list):
+            return False
+        detailed = sum(
+            1 for item in items if isinstance(item, dict) and str(item.get("MilestoneDetails") or "").strip()
+        )
+        return detailed >= 5
+
+    async def asummarize_blueprint(
+        self, *, run_id: str, blueprint_text: str, use_cache: bool = True
+    ) -> BlueprintSummary:
+        """Async variant of `summarize_blueprint` that runs on a worker thread.
+
+        Cancelling the caller does not cancel the worker, so a shared in-flight
+        request still completes for every other caller waiting on it.
+        """
+
+        return await asyncio.to_thread(
+            self.summarize_blueprint, run_id=run_id, blueprint_text=blueprint_text, use_cache=use_cache
+        )
+
+    async def agenerate_milestones(self, *, run_id: str, summary: BlueprintSummary) -> MilestonePlan:
+        """Async variant of `generate_milestones` that runs on a worker thread."""
+
+        return await asyncio.to_thread(self.generate_milestones, run_id=run_id, summary=summary)
+
+    async def process_batch(
+        self, runs: Sequence[Tuple[str, str]]
+    ) -> List[Tuple[BlueprintSummary, MilestonePlan]]:
+        """Summarize and plan several `(run_id, blueprint_text)` pairs concurrently."""
+
+        async def _process(run_id: str, blueprint_text: str) -> Tuple[BlueprintSummary, MilestonePlan]:
+            summary = await self.asummarize_blueprint(run_id=run_id, blueprint_text=blueprint_text)
+            plan = await self.agenerate_milestones(run_id=run_id, summary=summary)
+            return summary, plan
+
+        return list(await asyncio.gather(*(_process(run_id, text) for run_id, text in runs)))
+
+    @property
+    def client(self) -> Any:
+        """The OpenAI client the agent calls, or None in heuristic mode."""
+
+        return self._client
+
+    def summary_request_body(self, blueprint_text: str) -> Dict[str, Any]:
+        """Return the chat-completions request body that summarizes `blueprint_text`."""
+
+        _, messages = self._summary_messages(self._compress_text((blueprint_text or "").strip()))
+        return self._request_body(self._summary_model, messages, SUMMARY_RESPONSE_FORMAT)
+
+    def summary_from_completion(self, run_id: str, completion: Any) -> BlueprintSummary:
+        """Parse a chat completion for a `summary_request_body` request into a summary."""
+
+        text, _ = collect_streamed_completion(completion)
+        return self._summary_from_payload(run_id, self._parse_json(text))
+
+    def remember_summary(self, blueprint_text: str, summary: BlueprintSummary) -> None:
+        """Store a GPT summary of `blueprint_text` in the summary cache, when enabled."""
+
+        cache = self._summary_cache
+        if cache is None:
+            return
+        try:
+            cache.put((blueprint_text or "").strip(), summary, self._summary_cache_scope)
+        except Exception:
+            LOGGER.exception(
+                "Failed to store blueprint summary in cache",
+                extra={"event": "orchestrator.milestones.summary_cache_error", "run_id": summary.run_id},
+            )
+
+    def milestone_request_body(self, summary: BlueprintSummary) -> Dict[str, Any]:
+        """Return the chat-completions request body that plans milestones for `summary`."""
+
+        return self._request_body(
+            self._milestone_model, self._milestone_messages(summary), MILESTONE_RESPONSE_FORMAT
+        )
+
+    def milestones_from_completion(self, run_id: str, completion: Any) -> MilestonePlan:
+        """Parse a chat completion for a `milestone_request_body` request into a plan."""
+
+        text, _ = collect_streamed_completion(completion)
+        return self._plan_from_payload(run_id, self._parse_json(text), text)
+
+    def remember_milestones(self, summary: BlueprintSummary, plan: MilestonePlan) -> None:
+        """Store a GPT milestone plan for `summary` in the plan cache, when enabled."""
+
+        if self._summary_cache is not None:
+            self._store_milestones(fingerprint(summary, scope=self._milestone_cache_scope), plan)
+
+    def _store_milestones(self, key: str, plan: MilestonePlan) -> None:
+        cache = self._summary_cache
+        if cache is None:
+            return
+        try:
+            cache.put_plan("milestones", key, plan)
+        except Exception:
+            LOGGER.exception(
+                "Failed to store milestone plan in cache",
+                extra={"event": "orchestrator.milestones.plan_cache_error", "run_id": plan.run_id},
             )
-            payload = self._parse_json(content)
-            raw_milestones: Iterable[Dict[str, Any]] = payload.get("milestones", [])
-            milestones = [
-                Milestone(
-                    milestone_id=int(item.get("milestoneID", idx + 1)),
+
+    def _request_body(
+        self, model: str, messages: List[Dict[str, str]], response_format: Dict[str, Any]
+    ) -> Dict[str, Any]:
+        # Mirrors the first attempt of `create_chat_completion`. Temperature is left
+        # at the server default because a batch line has no retry to drop it.
+        return {
+            "model": model,
+            "messages": messages,
+            MAX_TOKENS_PARAMETER: self._max_tokens,
+            "response_format": response_format,
+        }
+
+    def _milestone_messages(self, summary: BlueprintSummary) -> List[Dict[str, str]]:
+        prompt = MILESTONE_USER_TEMPLATE.format(
+            summary=summary.summary,
+            highlights=self._format_section("Highlights", summary.highlights),
+            risks=self._format_section("Known risks", summary.risks),
+            components=self._format_section("Components to cover", summary.components),
+        ).strip()
+        return [_MILESTONE_SYSTEM_MESSAGE, {"role": "user", "content": prompt}]
+
+    def _plan_from_payload(self, run_id: str, payload: Dict[str, Any], content: str) -> MilestonePlan:
+        milestones = self._ensure_five_milestones(self._milestones_from_payload(payload))
+        return MilestonePlan.model_construct(run_id=run_id, milestones=milestones, raw_response=content)
+
+    @staticmethod
+    def _summary_messages(cleaned: str) -> Tuple[str, List[Dict[str, str]]]:
+        user_prompt = SUMMARY_USER_TEMPLATE.format(blueprint=cleaned)
+        return user_prompt, [_SUMMARY_SYSTEM_MESSAGE, {"role": "user", "content": user_prompt}]
+
+    def _summary_from_payload(self, run_id: str, payload: Dict[str, Any]) -> BlueprintSummary:
+        metadata = payload.get("metadata")
+        return BlueprintSummary.model_construct(
+            run_id=run_id,
+            summary=str(payload.get("summary") or ""),
+            highlights=self._ensure_list(payload.get("highlights")),
+            risks=self._ensure_list(payload.get("risks")),
+            components=self._ensure_list(payload.get("components")),
+            metadata=metadata if isinstance(metadata, dict) else {},
+        )
+
+    @staticmethod
+    def _milestones_from_payload(payload: Dict[str, Any]) -> List[Milestone]:
+        """Coerce reply milestones by hand and build them without re-validation."""
+
+        raw_milestones: Iterable[Dict[str, Any]] = payload.get("milestones", [])
+        milestones: List[Milestone] = []
+        for idx, item in enumerate(raw_milestones):
+            milestone_id = int(item.get("milestoneID", idx + 1))
+            if milestone_id < 1:
+                raise ValueError(f"Milestone id must be positive, got {milestone_id}.")
+            milestones.append(
+                Milestone.model_construct(
+                    milestone_id=milestone_id,
                     details=str(item.get("MilestoneDetails", "")).strip(),
                     context=str(item.get("Context", "")).strip(),
                 )
-                for idx, item in enumerate(raw_milestones)
-            ]
-            milestones = self._ensure_five_milestones(milestones)
-            return MilestonePlan(run_id=run_id, milestones=milestones, raw_response=content)
-        except Exception:
-            LOGGER.exception(
-                "Milestone generation via GPT failed; using heuristics.",
-                extra={"event": "orchestrator.milestones.milestone_error", "run_id": run_id},
             )
-            return self._heuristic_milestones(run_id=run_id, summary=summary)
+        return milestones
 
     @staticmethod
-    def _compress_text(text: str) -> str:
+    def _truncate_text(text: str) -> str:
+        cleaned = (text or "").strip()
+        if len(cleaned) <= MAX_CONTEXT_CHARS:
+            return cleaned
+        return cleaned[:MAX_CONTEXT_CHARS]
+
+    @classmethod
+    def _compress_text(cls, text: str) -> str:
+        """Fit oversized blueprints into the context budget, compressing when LLMLingua is installed."""
+
         cleaned = (text or "").strip()
         if len(cleaned) <= MAX_CONTEXT_CHARS:
             return cleaned
+        compressor = _load_prompt_compressor()
+        if compressor is not None:
+            try:
+                result = compressor.compress_prompt(
+                    cleaned, rate=COMPRESSION_RATE, force_tokens=["\n", "."]
+                )
+                return cls._truncate_text(result["compressed_prompt"])
+            except Exception:
+                LOGGER.exception(
+                    "Blueprint compression failed; truncating instead.",
+                    extra={"event": "orchestrator.milestones.compression_error"},
+                )
         return cleaned[:MAX_CONTEXT_CHARS]
 
     @staticmethod
     def _parse_json(raw: str) -> Dict[str, Any]:
-        candidate = raw.strip()
-        if candidate.startswith("```"):
-            candidate = candidate.strip("`")
-            if candidate.lower().startswith("json"):
-                candidate = candidate[4:]
-        candidate = candidate.strip()
-        return json.loads(candidate) if candidate else {}
+        return parse_json(raw)
 
     @staticmethod
     def _ensure_list(value: Any) -> List[str]:
-        if isinstance(value, list):
-            return [str(item).strip() for item in value if str(item).strip()]
-        if isinstance(value, str) and value.strip():
-            return [value.strip()]
-        return []
+        return ensure_str_list(value)
 
     @staticmethod
     def _format_section(label: str, items: List[str]) -> str:
@@ -267,32 +579,29 @@ class MilestonesAgent:
         lines = "\n".join(f"- {item}" for item in items)
         return f"{label}:\n{lines}"
 
-    @staticmethod
-    def _extract_content(response: Any) -> str:
-        if hasattr(response, "choices") and response.choices:
-            return extract_message_content(response.choices[0].message)
-        if isinstance(response, dict):
-            choices = response.get("choices") or []
-            if choices:
-                message = choices[0].get("message")
-                return extract_message_content(message)
-        return ""
-
     def _heuristic_summary(self, *, run_id: str, blueprint_text: str) -> BlueprintSummary:
-        lines = [line.strip() for line in blueprint_text.splitlines() if line.strip()]
-        summary = " ".join(lines[:5])[:800]
+        lines: List[str] = []
+        risks: List[str] = []
+        components: List[str] = []
+        for raw_line in blueprint_text.splitlines():
+            line = raw_line.strip()
+            if not line:
+                continue
+            if len(lines) < 5:
+                lines.append(line)
+            if len(risks) < 3 and _RISK_RE.search(line):
+                risks.append(line)
+            if len(components) < 5 and _COMPONENT_RE.search(line):
+                components.append(line)
+            if len(lines) == 5 and len(risks) == 3 and len(components) == 5:
+                break
+        summary = " ".join(lines)[:800]
         highlights = lines[:3]
-        risks = [line for line in lines if "risk" in line.lower()][:3]
-        components = [
-            line
-            for line in lines
-            if any(keyword in line.lower() for keyword in ("api", "service", "database", "frontend"))
-        ][:5]
         LOGGER.info(
             "Heuristic summary generated",
             extra={"event": "orchestrator.milestones.heuristic_summary", "run_id": run_id},
         )
-        return BlueprintSummary(
+        return BlueprintSummary.model_construct(
             run_id=run_id,
             summary=summary or blueprint_text[:400],
             highlights=highlights,
@@ -313,7 +622,7 @@ class MilestonesAgent:
         for idx, title in enumerate(base_titles, start=1):
             context_bits = summary.highlights[idx - 1 : idx + 1]
             milestones.append(
-                Milestone(
+                Milestone.model_construct(
                     milestone_id=idx,
                     details=title,
                     context=" ".join(context_bits) if context_bits else summary.summary,
@@ -323,7 +632,7 @@ class MilestonesAgent:
             "Heuristic milestones generated",
             extra={"event": "orchestrator.milestones.heuristic_milestones", "run_id": run_id},
         )
-        return MilestonePlan(run_id=run_id, milestones=milestones)
+        return MilestonePlan.model_construct(run_id=run_id, milestones=milestones)
 
     def _ensure_five_milestones(self, milestones: List[Milestone]) -> List[Milestone]:
         filtered = [m for m in milestones if m.details]
@@ -333,7 +642,7 @@ class MilestonesAgent:
             while next_id in existing_ids:
                 next_id += 1
             filtered.append(
-                Milestone(
+                Milestone.model_construct(
                     milestone_id=next_id,
                     details=f"Milestone {next_id}: Expand coverage",
                     context="",
@@ -345,4 +654,11 @@ class MilestonesAgent:
         return filtered[:5]
 
 
-__all__ = ["MilestonesAgent"]
+@lru_cache(maxsize=1)
+def get_milestones_agent() -> MilestonesAgent:
+    """Return the shared MilestonesAgent instance reused across orchestrator sessions."""
+
+    return MilestonesAgent()
+
+
+__all__ = ["MilestonesAgent", "get_milestones_agent"]
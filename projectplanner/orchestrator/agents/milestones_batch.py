@@ -0,0 +1,196 @@
+"""OpenAI Batch API submission for non-interactive blueprint runs."""
+from __future__ import annotations
+
+import io
+import json
+import time
+from typing import Any, Callable, Dict, Iterable, Mapping, Optional, Sequence, Tuple, TypeVar
+
+from projectplanner.logging_utils import get_logger
+from projectplanner.orchestrator.agents.milestones_agent import MilestonesAgent, get_milestones_agent
+from projectplanner.orchestrator.models import BlueprintSummary, MilestonePlan
+
+LOGGER = get_logger(__name__)
+
+BATCH_ENDPOINT = "/v1/chat/completions"
+BATCH_COMPLETION_WINDOW = "24h"
+_TERMINAL_STATUSES = frozenset({"completed", "failed", "expired", "cancelled"})
+
+T = TypeVar("T")
+
+
+class MilestonesBatch:
+    """Summarize and plan many blueprints through the OpenAI Batch API.
+
+    Offline workloads (evaluations, backfills) trade latency for the Batch API's
+    lower per-request cost and separate rate limits. Summaries go out as one
+    batch and the collected summaries feed a second, milestone batch. Runs
+    without a usable client, or whose batch line failed, fall back to the
+    agent's synchronous path. Batch results are cached like synchronous ones.
+    """
+
+    def __init__(
+        self,
+        agent: Optional[MilestonesAgent] = None,
+        *,
+        poll_interval: float = 15.0,
+        timeout: float = 24 * 60 * 60,
+    ) -> None:
+        self._agent = agent or get_milestones_agent()
+        self._poll_interval = poll_interval
+        self._timeout = timeout
+
+    @property
+    def available(self) -> bool:
+        client = self._agent.client
+        return client is not None and hasattr(client, "batches") and hasattr(client, "files")
+
+    def build_requests(self, blueprints: Sequence[Tuple[str, str]]) -> bytes:
+        """Serialize `(run_id, blueprint_text)` pairs into summary Batch API JSONL."""
+
+        return self._serialize(
+            (run_id, self._agent.summary_request_body(blueprint_text)) for run_id, blueprint_text in blueprints
+        )
+
+    def build_milestone_requests(self, summaries: Mapping[str, BlueprintSummary]) -> bytes:
+        """Serialize summaries keyed by run id into milestone Batch API JSONL."""
+
+        return self._serialize(
+            (run_id, self._agent.milestone_request_body(summary)) for run_id, summary in summaries.items()
+        )
+
+    def submit_batch(self, blueprints: Sequence[Tuple[str, str]]) -> str:
+        """Upload the summary request file and create a batch job; returns the batch id."""
+
+        return self._submit("blueprints.jsonl", self.build_requests(blueprints), len(blueprints))
+
+    def submit_milestone_batch(self, summaries: Mapping[str, BlueprintSummary]) -> str:
+        """Upload the milestone request file and create a batch job; returns the batch id."""
+
+        return self._submit("milestones.jsonl", self.build_milestone_requests(summaries), len(summaries))
+
+    def wait_for_batch(self, batch_id: str) -> object:
+        """Poll the batch until it reaches a terminal status or the timeout elapses."""
+
+        client = self._agent.client
+        deadline = time.monotonic() + self._timeout
+        while True:
+            batch = client.batches.retrieve(batch_id)
+            if batch.status in _TERMINAL_STATUSES:
+                return batch
+            if time.monotonic() >= deadline:
+                raise TimeoutError(f"Batch {batch_id} did not complete within {self._timeout:.0f}s.")
+            time.sleep(self._poll_interval)
+
+    def collect_batch(self, batch: object) -> Dict[str, BlueprintSummary]:
+        """Parse the output file of a finished summary batch into summaries keyed by run id."""
+
+        return self._collect(batch, self._agent.summary_from_completion)
+
+    def collect_milestone_batch(self, batch: object) -> Dict[str, MilestonePlan]:
+        """Parse the output file of a finished milestone batch into plans keyed by run id."""
+
+        return self._collect(batch, self._agent.milestones_from_completion)
+
+    def run(self, blueprints: Sequence[Tuple[str, str]]) -> Dict[str, BlueprintSummary]:
+        """Submit, wait for, and collect a summary batch; missing runs are summarized synchronously."""
+
+        texts = dict(blueprints)
+        summaries: Dict[str, BlueprintSummary] = {}
+        if self.available and blueprints:
+            summaries = self._dispatch(self.submit_batch, blueprints, self.collect_batch)
+            for run_id, summary in summaries.items():
+                self._agent.remember_summary(texts[run_id], summary)
+        for run_id, blueprint_text in blueprints:
+            if run_id not in summaries:
+                summaries[run_id] = self._agent.summarize_blueprint(
+                    run_id=run_id, blueprint_text=blueprint_text
+                )
+        return summaries
+
+    def run_milestones(self, summaries: Mapping[str, BlueprintSummary]) -> Dict[str, MilestonePlan]:
+        """Submit, wait for, and collect a milestone batch; missing runs are planned synchronously."""
+
+        plans: Dict[str, MilestonePlan] = {}
+        if self.available and summaries:
+            plans = self._dispatch(self.submit_milestone_batch, summaries, self.collect_milestone_batch)
+            for run_id, plan in plans.items():
+                self._agent.remember_milestones(summaries[run_id], plan)
+        for run_id, summary in summaries.items():
+            if run_id not in plans:
+                plans[run_id] = self._agent.generate_milestones(run_id=run_id, summary=summary)
+        return plans
+
+    def process(
+        self, blueprints: Sequence[Tuple[str, str]]
+    ) -> Dict[str, Tuple[BlueprintSummary, MilestonePlan]]:
+        """Summarize, then plan, every blueprint with one batch per stage."""
+
+        summaries = self.run(blueprints)
+        plans = self.run_milestones(summaries)
+        return {run_id: (summary, plans[run_id]) for run_id, summary in summaries.items()}
+
+    @staticmethod
+    def _serialize(bodies: Iterable[Tuple[str, Dict[str, Any]]]) -> bytes:
+        lines = []
+        for run_id, body in bodies:
+            request = {"custom_id": run_id, "method": "POST", "url": BATCH_ENDPOINT, "body": body}
+            lines.append(json.dumps(request, ensure_ascii=False))
+        return ("\n".join(lines) + "\n").encode("utf-8")
+
+    def _submit(self, filename: str, content: bytes, count: int) -> str:
+        if not self.available:
+            raise RuntimeError("OpenAI client does not support the Batch API.")
+        client = self._agent.client
+        upload = client.files.create(file=(filename, io.BytesIO(content)), purpose="batch")
+        batch = client.batches.create(
+            input_file_id=upload.id,
+            endpoint=BATCH_ENDPOINT,
+            completion_window=BATCH_COMPLETION_WINDOW,
+        )
+        LOGGER.info(
+            "Blueprint batch submitted",
+            extra={
+                "event": "orchestrator.milestones.batch_submitted",
+                "payload": {"batch_id": batch.id, "file": filename, "requests": count},
+            },
+        )
+        return batch.id
+
+    def _dispatch(
+        self, submit: Callable[[Any], str], items: Any, collect: Callable[[object], Dict[str, T]]
+    ) -> Dict[str, T]:
+        try:
+            return collect(self.wait_for_batch(submit(items)))
+        except Exception:
+            LOGGER.exception(
+                "Blueprint batch failed; falling back to synchronous requests.",
+                extra={"event": "orchestrator.milestones.batch_error"},
+            )
+            return {}
+
+    def _collect(self, batch: object, parse: Callable[[str, Any], T]) -> Dict[str, T]:
+        output_file_id = getattr(batch, "output_file_id", None)
+        if not output_file_id:
+            return {}
+        content = self._agent.client.files.content(output_file_id)
+        results: Dict[str, T] = {}
+        for line in content.text.splitlines():
+            if not line.strip():
+                continue
+            record = json.loads(line)
+            run_id = record.get("custom_id")
+            response = record.get("response") or {}
+            if not run_id or record.get("error") or response.get("status_code") != 200:
+                continue
+            try:
+                results[run_id] = parse(run_id, response.get("body") or {})
+            except Exception:
+                LOGGER.exception(
+                    "Failed to parse batch output line",
+                    extra={"event": "orchestrator.milestones.batch_parse_error", "run_id": run_id},
+                )
+        return results
+
+
+__all__ = ["MilestonesBatch"]
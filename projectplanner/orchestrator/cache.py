@@ -0,0 +1,153 @@
+"""Persistent response cache for orchestrator agents."""
+from __future__ import annotations
+
+import hashlib
+import json
+import sqlite3
+import threading
+import time
+from functools import lru_cache
+from pathlib import Path
+from typing import Any, Optional, Type, TypeVar
+
+from pydantic import BaseModel
+
+from projectplanner.logging_utils import get_logger
+from projectplanner.orchestrator.config import get_summary_cache_path
+from projectplanner.orchestrator.models import BlueprintSummary
+
+LOGGER = get_logger(__name__)
+
+ModelT = TypeVar("ModelT", bound=BaseModel)
+
+
+# Bump when prompt-building code changes in ways `cache_scope` cannot see.
+CACHE_VERSION = 1
+
+
+def cache_scope(*parts: Any) -> str:
+    """Hash the model ids, prompts, and schemas that shape a cached response.
+
+    Agents pass the scope to `cache_key`/`fingerprint`, so changing any of
+    them (or `CACHE_VERSION`) stops old entries from matching.
+    """
+
+    payload = json.dumps([CACHE_VERSION, *parts], sort_keys=True, default=str)
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+def cache_key(text: str, scope: str = "") -> str:
+    """Hash text with whitespace normalized so re-flowed blueprints share a key."""
+
+    digest = hashlib.sha256(scope.encode("utf-8"))
+    digest.update(b"\x00")
+    digest.update(" ".join(text.split()).encode("utf-8"))
+    return digest.hexdigest()
+
+
+def fingerprint(*models: BaseModel, scope: str = "") -> str:
+    """Hash the content of planning artifacts, ignoring the run they belong to."""
+
+    digest = hashlib.sha256(scope.encode("utf-8"))
+    digest.update(b"\x00")
+    for model in models:
+        digest.update(model.model_dump_json(exclude={"run_id"}).encode("utf-8"))
+        digest.update(b"\n")
+    return digest.hexdigest()
+
+
+class SummaryCache:
+    """SQLite-backed store of GPT summaries and the plans derived from them.
+
+    Summaries are keyed by blueprint text; milestone plans and prompt bundles
+    live in a `plans` table keyed by a `kind` and the `fingerprint` of their inputs.
+    """
+
+    def __init__(self, path: str | Path) -> None:
+        self._path = Path(path)
+        self._lock = threading.Lock()
+        self._conn: Optional[sqlite3.Connection] = None
+
+    def _connection(self) -> sqlite3.Connection:
+        if self._conn is None:
+            self._path.parent.mkdir(parents=True, exist_ok=True)
+            conn = sqlite3.connect(self._path, check_same_thread=False)
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS summaries ("
+                "key TEXT PRIMARY KEY, payload TEXT NOT NULL, created_at REAL NOT NULL)"
+            )
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS plans ("
+                "kind TEXT NOT NULL, key TEXT NOT NULL, payload TEXT NOT NULL, "
+                "created_at REAL NOT NULL, PRIMARY KEY (kind, key))"
+            )
+            conn.commit()
+            self._conn = conn
+        return self._conn
+
+    def get(self, text: str, scope: str = "") -> Optional[BlueprintSummary]:
+        """Return the cached summary for the text under `scope`, if any."""
+
+        try:
+            with self._lock:
+                row = self._connection().execute(
+                    "SELECT payload FROM summaries WHERE key = ?", (cache_key(text, scope),)
+                ).fetchone()
+            return BlueprintSummary.model_validate_json(row[0]) if row else None
+        except Exception:
+            LOGGER.warning(
+                "Summary cache lookup failed; treating as a miss",
+                extra={"event": "orchestrator.cache.summary_lookup_error"},
+                exc_info=True,
+            )
+            return None
+
+    def put(self, text: str, summary: BlueprintSummary, scope: str = "") -> None:
+        """Store the summary for the text under `scope`, replacing any previous entry."""
+
+        with self._lock:
+            conn = self._connection()
+            conn.execute(
+                "INSERT OR REPLACE INTO summaries (key, payload, created_at) VALUES (?, ?, ?)",
+                (cache_key(text, scope), summary.model_dump_json(), time.time()),
+            )
+            conn.commit()
+
+    def get_plan(self, kind: str, key: str, model_cls: Type[ModelT]) -> Optional[ModelT]:
+        """Return the cached `kind` artifact stored under the fingerprint, if any."""
+
+        try:
+            with self._lock:
+                row = self._connection().execute(
+                    "SELECT payload FROM plans WHERE kind = ? AND key = ?", (kind, key)
+                ).fetchone()
+            return model_cls.model_validate_json(row[0]) if row else None
+        except Exception:
+            LOGGER.warning(
+                "Plan cache lookup failed; treating as a miss",
+                extra={"event": "orchestrator.cache.plan_lookup_error", "payload": {"kind": kind}},
+                exc_info=True,
+            )
+            return None
+
+    def put_plan(self, kind: str, key: str, model: BaseModel) -> None:
+        """Store a `kind` artifact under the fingerprint, replacing any previous entry."""
+
+        with self._lock:
+            conn = self._connection()
+            conn.execute(
+                "INSERT OR REPLACE INTO plans (kind, key, payload, created_at) VALUES (?, ?, ?, ?)",
+                (kind, key, model.model_dump_json(), time.time()),
+            )
+            conn.commit()
+
+
+@lru_cache(maxsize=1)
+def get_summary_cache() -> Optional[SummaryCache]:
+    """Return the shared summary cache, or None when caching is disabled."""
+
+    path = get_summary_cache_path()
+    return SummaryCache(path) if path else None
+
+
+__all__ = ["CACHE_VERSION", "SummaryCache", "cache_key", "cache_scope", "fingerprint", "get_summary_cache"]
@@ -3,7 +3,8 @@ from __future__ import annotations
 
 import logging
 import os
-from functools import lru_cache
+from dataclasses import dataclass
+from pathlib import Path
 from typing import Optional
 
 from projectplanner.config import MAX_COMPLETION_TOKENS as CONDUCTOR_MAX_COMPLETION_TOKENS
@@ -17,8 +18,12 @@ LEGACY_ENV_PREFIX = "CODING_ORCHESTRATOR"
 DEFAULT_SUMMARY_MODEL = "gpt-5"
 DEFAULT_MILESTONE_MODEL = "gpt-5"
 DEFAULT_PROMPT_MODEL = "gpt-5"
+DEFAULT_FAST_MODEL = "gpt-5-nano"
 DEFAULT_TEMPERATURE = 0.2
 DEFAULT_MAX_COMPLETION_TOKENS = CONDUCTOR_MAX_COMPLETION_TOKENS
+DEFAULT_MAX_CONCURRENT_REQUESTS = 4
+DEFAULT_SUMMARY_CACHE_PATH = Path(__file__).resolve().parent.parent / "data" / "orchestrator_cache.db"
+_DISABLED_VALUES = {"", "0", "false", "no", "off"}
 
 
 def _get_env(name: str, default: Optional[str] = None) -> Optional[str]:
@@ -37,21 +42,6 @@ def get_setting(name: str, default: Optional[str] = None) -> Optional[str]:
     return _get_env(name, default)
 
 
-@lru_cache()
-def get_summary_model() -> str:
-    return get_setting("SUMMARY_MODEL", DEFAULT_SUMMARY_MODEL) or DEFAULT_SUMMARY_MODEL
-
-
-@lru_cache()
-def get_milestone_model() -> str:
-    return get_setting("MILESTONE_MODEL", DEFAULT_MILESTONE_MODEL) or DEFAULT_MILESTONE_MODEL
-
-
-@lru_cache()
-def get_prompt_model() -> str:
-    return get_setting("PROMPT_MODEL", DEFAULT_PROMPT_MODEL) or DEFAULT_PROMPT_MODEL
-
-
 def _parse_float(value: Optional[str], fallback: float) -> float:
     if not value:
         return fallback
@@ -68,22 +58,18 @@ def _parse_float(value: Optional[str], fallback: float) -> float:
     return max(0.0, min(parsed, 1.0))
 
 
-@lru_cache()
-def get_temperature() -> float:
-    return _parse_float(get_setting("TEMPERATURE"), DEFAULT_TEMPERATURE)
-
-
-def _parse_int(value: Optional[str], fallback: int) -> int:
+def _parse_int(value: Optional[str], fallback: int, *, label: str = "max_tokens") -> int:
     if not value:
         return fallback
     try:
         parsed = int(value)
     except ValueError:
         LOGGER.warning(
-            "Invalid integer for %s max tokens; using fallback %d",
+            "Invalid integer for %s %s; using fallback %d",
             ENV_PREFIX,
+            label.replace("_", " "),
             fallback,
-            extra={"event": "orchestrator.config.invalid_max_tokens", "value": value},
+            extra={"event": f"orchestrator.config.invalid_{label}", "value": value},
         )
         return fallback
     if parsed <= 0:
@@ -91,16 +77,105 @@ def _parse_int(value: Optional[str], fallback: int) -> int:
     return parsed
 
 
-@lru_cache()
+def _parse_fast_model(value: Optional[str]) -> Optional[str]:
+    if value is None:
+        return DEFAULT_FAST_MODEL
+    if value.strip().lower() in _DISABLED_VALUES:
+        return None
+    return value.strip()
+
+
+def _parse_cache_path(value: Optional[str]) -> Optional[str]:
+    if value is None:
+        return str(DEFAULT_SUMMARY_CACHE_PATH)
+    if value.strip().lower() in _DISABLED_VALUES:
+        return None
+    return value
+
+
+@dataclass(frozen=True, slots=True)
+class OrchestratorConfig:
+    """Immutable snapshot of orchestrator settings, resolved once from the environment."""
+
+    summary_model: str
+    milestone_model: str
+    prompt_model: str
+    fast_model: Optional[str]
+    temperature: float
+    max_completion_tokens: int
+    max_concurrent_requests: int
+    summary_cache_path: Optional[str]
+
+
+def load_config() -> OrchestratorConfig:
+    """Resolve orchestrator settings from the environment."""
+
+    return OrchestratorConfig(
+        summary_model=get_setting("SUMMARY_MODEL", DEFAULT_SUMMARY_MODEL) or DEFAULT_SUMMARY_MODEL,
+        milestone_model=get_setting("MILESTONE_MODEL", DEFAULT_MILESTONE_MODEL) or DEFAULT_MILESTONE_MODEL,
+        prompt_model=get_setting("PROMPT_MODEL", DEFAULT_PROMPT_MODEL) or DEFAULT_PROMPT_MODEL,
+        fast_model=_parse_fast_model(get_setting("FAST_MODEL")),
+        temperature=_parse_float(get_setting("TEMPERATURE"), DEFAULT_TEMPERATURE),
+        max_completion_tokens=_parse_int(get_setting("MAX_COMPLETION_TOKENS"), DEFAULT_MAX_COMPLETION_TOKENS),
+        max_concurrent_requests=_parse_int(
+            get_setting("MAX_CONCURRENT_REQUESTS"),
+            DEFAULT_MAX_CONCURRENT_REQUESTS,
+            label="max_concurrent_requests",
+        ),
+        summary_cache_path=_parse_cache_path(get_setting("SUMMARY_CACHE")),
+    )
+
+
+CONFIG = load_config()
+
+
+def get_summary_model() -> str:
+    return CONFIG.summary_model
+
+
+def get_milestone_model() -> str:
+    return CONFIG.milestone_model
+
+
+def get_prompt_model() -> str:
+    return CONFIG.prompt_model
+
+
+def get_fast_model() -> Optional[str]:
+    """Return the cheaper model tried before the summary/milestone models, if enabled."""
+
+    return CONFIG.fast_model
+
+
+def get_temperature() -> float:
+    return CONFIG.temperature
+
+
 def get_max_completion_tokens() -> int:
-    return _parse_int(get_setting("MAX_COMPLETION_TOKENS"), DEFAULT_MAX_COMPLETION_TOKENS)
+    return CONFIG.max_completion_tokens
+
+
+def get_max_concurrent_requests() -> int:
+    return CONFIG.max_concurrent_requests
+
+
+def get_summary_cache_path() -> Optional[str]:
+    """Return the summary cache location, or None when caching is switched off."""
+
+    return CONFIG.summary_cache_path
 
 
 __all__ = [
+    "CONFIG",
+    "OrchestratorConfig",
+    "load_config",
     "get_setting",
     "get_summary_model",
     "get_milestone_model",
     "get_prompt_model",
+    "get_fast_model",
     "get_temperature",
     "get_max_completion_tokens",
+    "get_max_concurrent_requests",
+    "get_summary_cache_path",
 ]
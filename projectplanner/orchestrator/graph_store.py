@@ -1,26 +1,107 @@
 """In-memory graph store for orchestrator component coverage."""
 from __future__ import annotations
 
+import logging
 import re
-from typing import Dict, Iterable, List, Tuple
+from dataclasses import dataclass, field
+from functools import lru_cache
+from typing import Any, Dict, Iterable, List, Optional, Set, Tuple
 
 from projectplanner.logging_utils import get_logger
 from projectplanner.orchestrator.models import GraphCoverageSnapshot, GraphNode, Milestone
 
+try:  # pragma: no cover - optional dependency guard
+    import ahocorasick
+except Exception:  # pragma: no cover
+    ahocorasick = None  # type: ignore[assignment]
+
 LOGGER = get_logger(__name__)
 
+_SLUG_RE = re.compile(r"[^a-z0-9]+")
+
+
+@dataclass(slots=True)
+class _NodeRecord:
+    """Internal mutable node state; converted to `GraphNode` at the API boundary."""
+
+    id: str
+    name: str
+    description: Optional[str] = None
+    milestone_ids: List[int] = field(default_factory=list)
+    milestone_id_set: Set[int] = field(default_factory=set)
+
+    def add_milestone(self, milestone_id: int) -> bool:
+        """Link a milestone in O(1); returns False when it was already linked."""
+
+        if milestone_id in self.milestone_id_set:
+            return False
+        self.milestone_id_set.add(milestone_id)
+        self.milestone_ids.append(milestone_id)
+        return True
+
+    def to_model(self) -> GraphNode:
+        return GraphNode.model_construct(
+            id=self.id,
+            name=self.name,
+            description=self.description,
+            milestone_ids=list(self.milestone_ids),
+        )
+
+
+@lru_cache(maxsize=4096)
+def _slugify(value: str) -> str:
+    normalized = _SLUG_RE.sub("-", value.lower()).strip("-")
+    return normalized or "node"
+
 
 class GraphStore:
     """Tracks blueprint components and their milestone coverage."""
 
     def __init__(self, run_id: str) -> None:
         self.run_id = run_id
-        self._nodes: Dict[str, GraphNode] = {}
-
-    @staticmethod
-    def _slugify(value: str) -> str:
-        normalized = re.sub(r"[^a-z0-9]+", "-", value.lower()).strip("-")
-        return normalized or "node"
+        self._nodes: Dict[str, _NodeRecord] = {}
+        self._sort_keys: Dict[str, str] = {}
+        self._match_terms: Dict[str, str] = {}
+        self._matcher: Any = None
+        self._revision = 0
+        self._listing_cache: Optional[Tuple[int, str]] = None
+        self._coverage_cache: Optional[Tuple[int, Tuple[str, ...], Tuple[str, ...]]] = None
+
+    def _add_node(self, node: _NodeRecord) -> None:
+        self._nodes[node.id] = node
+        self._sort_keys[node.id] = node.name.casefold()
+        self._match_terms[node.id] = node.name.lower()
+        self._matcher = None
+        self._revision += 1
+
+    def _build_matcher(self) -> Any:
+        automaton = ahocorasick.Automaton()
+        for slug, term in self._match_terms.items():
+            if term:
+                automaton.add_word(term, slug)
+        if len(automaton):
+            automaton.make_automaton()
+            return automaton
+        return False
+
+    def _matching_node_ids(self, text: str, milestone_id: int) -> Iterable[str]:
+        """Yield ids of nodes not yet linked to `milestone_id` whose name occurs in `text`."""
+
+        if ahocorasick is None:
+            nodes = self._nodes
+            # Cheap set probe first so linked nodes skip the substring scan.
+            return [
+                slug
+                for slug, term in self._match_terms.items()
+                if milestone_id not in nodes[slug].milestone_id_set and term in text
+            ]
+        if self._matcher is None:
+            self._matcher = self._build_matcher()
+        # Empty names match every text, mirroring the substring semantics.
+        matches = [slug for slug, term in self._match_terms.items() if not term]
+        if self._matcher:
+            matches.extend(slug for _, slug in self._matcher.iter(text))
+        return dict.fromkeys(matches)
 
     def load_components(self, components: Iterable[str]) -> None:
         """Seed the graph with top-level components from the blueprint."""
@@ -29,47 +110,50 @@ class GraphStore:
             name = (raw or "").strip()
             if not name:
                 continue
-            slug = self._slugify(name)
+            slug = _slugify(name)
             if slug in self._nodes:
                 continue
-            self._nodes[slug] = GraphNode(id=slug, name=name)
-            LOGGER.debug(
-                "Graph node registered",
-                extra={
-                    "event": "orchestrator.graph.node_registered",
-                    "run_id": self.run_id,
-                    "payload": {"id": slug, "name": name},
-                },
-            )
+            self._add_node(_NodeRecord(id=slug, name=name))
+            if LOGGER.isEnabledFor(logging.DEBUG):
+                LOGGER.debug(
+                    "Graph node registered",
+                    extra={
+                        "event": "orchestrator.graph.node_registered",
+                        "run_id": self.run_id,
+                        "payload": {"id": slug, "name": name},
+                    },
+                )
 
     def upsert_node(self, name: str, *, description: str | None = None) -> GraphNode:
-        slug = self._slugify(name)
+        slug = _slugify(name)
         node = self._nodes.get(slug)
         if node:
             if description and not node.description:
                 node.description = description
-            return node
-        node = GraphNode(id=slug, name=name.strip(), description=description)
-        self._nodes[slug] = node
-        LOGGER.debug(
-            "Graph node upserted",
-            extra={
-                "event": "orchestrator.graph.node_upserted",
-                "run_id": self.run_id,
-                "payload": {"id": slug, "name": node.name},
-            },
-        )
-        return node
+            return node.to_model()
+        node = _NodeRecord(id=slug, name=name.strip(), description=description)
+        self._add_node(node)
+        if LOGGER.isEnabledFor(logging.DEBUG):
+            LOGGER.debug(
+                "Graph node upserted",
+                extra={
+                    "event": "orchestrator.graph.node_upserted",
+                    "run_id": self.run_id,
+                    "payload": {"id": slug, "name": node.name},
+                },
+            )
+        return node.to_model()
 
     def assign_milestones(self, milestones: Iterable[Milestone]) -> None:
         """Associate nodes with any milestone mentioning them by name."""
 
         for milestone in milestones:
             text = f"{milestone.details} {milestone.context}".lower()
-            for node in self._nodes.values():
-                if node.name.lower() in text:
-                    if milestone.milestone_id not in node.milestone_ids:
-                        node.milestone_ids.append(milestone.milestone_id)
+            for node_id in self._matching_node_ids(text, milestone.milestone_id):
+                node = self._nodes[node_id]
+                if node.add_milestone(milestone.milestone_id):
+                    self._revision += 1
+                    if LOGGER.isEnabledFor(logging.DEBUG):
                         LOGGER.debug(
                             "Graph node linked to milestone",
                             extra={
@@ -94,36 +178,60 @@ class GraphStore:
                 },
             )
             return
-        if milestone_id not in node.milestone_ids:
-            node.milestone_ids.append(milestone_id)
-            LOGGER.debug(
-                "Manual assignment applied",
-                extra={
-                    "event": "orchestrator.graph.manual_assignment",
-                    "run_id": self.run_id,
-                    "payload": {"node": node.id, "milestone_id": milestone_id},
-                },
-            )
+        if node.add_milestone(milestone_id):
+            self._revision += 1
+            if LOGGER.isEnabledFor(logging.DEBUG):
+                LOGGER.debug(
+                    "Manual assignment applied",
+                    extra={
+                        "event": "orchestrator.graph.manual_assignment",
+                        "run_id": self.run_id,
+                        "payload": {"node": node.id, "milestone_id": milestone_id},
+                    },
+                )
 
     def nodes(self) -> List[GraphNode]:
-        return list(self._nodes.values())
+        return [node.to_model() for node in self._nodes.values()]
+
+    def formatted_node_listing(self) -> str:
+        """Return the node-to-milestone listing used in audit prompts, sorted by name."""
+
+        cached = self._listing_cache
+        if cached is not None and cached[0] == self._revision:
+            return cached[1]
+        ordered = sorted(self._nodes, key=self._sort_keys.__getitem__)
+        listing = "\n".join(
+            f"- {node.name} :: milestones {', '.join(map(str, node.milestone_ids)) or 'none'}"
+            for node in map(self._nodes.__getitem__, ordered)
+        )
+        self._listing_cache = (self._revision, listing)
+        return listing
 
-    def coverage(self) -> Tuple[List[str], List[str]]:
+    def _sorted_coverage(self) -> Tuple[Tuple[str, ...], Tuple[str, ...]]:
+        cached = self._coverage_cache
+        if cached is not None and cached[0] == self._revision:
+            return cached[1], cached[2]
         covered: List[str] = []
         uncovered: List[str] = []
         for node in self._nodes.values():
-            if node.milestone_ids:
-                covered.append(node.name)
-            else:
-                uncovered.append(node.name)
-        return covered, uncovered
+            (covered if node.milestone_ids else uncovered).append(node.name)
+        covered.sort()
+        uncovered.sort()
+        self._coverage_cache = (self._revision, tuple(covered), tuple(uncovered))
+        return self._coverage_cache[1], self._coverage_cache[2]
+
+    def coverage(self) -> Tuple[List[str], List[str]]:
+        """Return covered and uncovered node names, each sorted."""
+
+        covered, uncovered = self._sorted_coverage()
+        return list(covered), list(uncovered)
 
     def snapshot(self, notes: str | None = None) -> GraphCoverageSnapshot:
-        covered, uncovered = self.coverage()
-        return GraphCoverageSnapshot(
+        covered, uncovered = self._sorted_coverage()
+        return GraphCoverageSnapshot.model_construct(
             run_id=self.run_id,
-            covered_nodes=sorted(covered),
-            uncovered_nodes=sorted(uncovered),
+            covered_nodes=list(covered),
+            uncovered_nodes=list(uncovered),
             notes=notes,
         )
 
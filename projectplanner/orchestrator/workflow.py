@@ -6,7 +6,14 @@ from pathlib import Path
 from typing import Optional, Tuple
 
 from projectplanner.logging_utils import get_logger
-from projectplanner.orchestrator.agents import AgentPlanner, GraphAuditAgent, MilestonesAgent
+from projectplanner.orchestrator.agents import (
+    AgentPlanner,
+    GraphAuditAgent,
+    MilestonesAgent,
+    get_agent_planner,
+    get_graph_audit_agent,
+    get_milestones_agent,
+)
 from projectplanner.orchestrator.graph_store import GraphStore
 from projectplanner.orchestrator.models import (
     BlueprintSummary,
@@ -19,6 +26,7 @@ from projectplanner.orchestrator.models import (
 LOGGER = get_logger(__name__)
 
 MAX_CANDIDATE_PATH_CHARS = 512
+_INLINE_LEADING_CHARS = frozenset("#<{[\"'")
 
 
 class CodingOrchestrator:
@@ -33,9 +41,9 @@ class CodingOrchestrator:
         graph_audit_agent: Optional[GraphAuditAgent] = None,
     ) -> None:
         self.run_id = run_id or f"orch-{uuid.uuid4()}"
-        self._milestones_agent = milestones_agent or MilestonesAgent()
-        self._agent_planner = agent_planner or AgentPlanner()
-        self._graph_audit_agent = graph_audit_agent or GraphAuditAgent()
+        self._milestones_agent = milestones_agent or get_milestones_agent()
+        self._agent_planner = agent_planner or get_agent_planner()
+        self._graph_audit_agent = graph_audit_agent or get_graph_audit_agent()
         self._graph_store = GraphStore(self.run_id)
         self._blueprint_text: Optional[str] = None
         self._summary: Optional[BlueprintSummary] = None
@@ -45,7 +53,7 @@ class CodingOrchestrator:
         self._graph_snapshot: Optional[GraphCoverageSnapshot] = None
         self._prompts: Optional[PromptBundle] = None
 
-    def ingest_blueprint(self, blueprint_source: str | Path) -> BlueprintSummary:
+    def ingest_blueprint(self, blueprint_source: str | Path, *, use_cache: bool = True) -> BlueprintSummary:
         """Ingest a blueprint file or inline text and synthesize the summary."""
 
         text = self._read_blueprint(blueprint_source)
@@ -58,7 +66,9 @@ class CodingOrchestrator:
             "Summary synthesis starting",
             extra={"event": "orchestrator.summary.start", "run_id": self.run_id},
         )
-        summary = self._milestones_agent.summarize_blueprint(run_id=self.run_id, blueprint_text=text)
+        summary = self._milestones_agent.summarize_blueprint(
+            run_id=self.run_id, blueprint_text=text, use_cache=use_cache
+        )
         self._summary = summary
         self._summary_approved = False
         self._milestones = None
@@ -104,7 +114,11 @@ class CodingOrchestrator:
             "Milestone synthesis starting",
             extra={"event": "orchestrator.milestones.start", "run_id": self.run_id},
         )
-        plan = self._milestones_agent.generate_milestones(run_id=self.run_id, summary=self._summary)
+        plan = self._milestones_agent.generate_milestones(
+            run_id=self.run_id,
+            summary=self._summary,
+            use_cache=self._milestones is None,
+        )
         self._milestones = plan
         self._graph_store.assign_milestones(plan.milestones)
         snapshot = self._graph_audit_agent.audit(
@@ -159,6 +173,7 @@ class CodingOrchestrator:
             summary=self._summary,
             milestones=self._milestones.milestones,
             graph_snapshot=snapshot,
+            use_cache=self._prompts is None,
         )
         self._prompts = prompts
         LOGGER.info(
@@ -195,7 +210,7 @@ class CodingOrchestrator:
 
         if not self._blueprint_text:
             raise RuntimeError("No blueprint available to regenerate summary.")
-        return self.ingest_blueprint(self._blueprint_text)
+        return self.ingest_blueprint(self._blueprint_text, use_cache=False)
 
     def get_summary(self) -> Optional[BlueprintSummary]:
         return self._summary
@@ -238,14 +253,14 @@ class CodingOrchestrator:
     def _read_blueprint(source: str | Path) -> str:
         if isinstance(source, Path):
             try:
-                if source.exists():
-                    text = source.read_text(encoding="utf-8")
-                    if not text.strip():
-                        raise ValueError(f"Blueprint file {source} is empty.")
-                    return text
+                text = source.read_text(encoding="utf-8")
+            except FileNotFoundError:
+                raise FileNotFoundError(f"Blueprint file not found: {source}") from None
             except OSError as exc:
                 raise ValueError(f"Unable to read blueprint file {source}: {exc}") from exc
-            raise FileNotFoundError(f"Blueprint file not found: {source}")
+            if not text.strip():
+                raise ValueError(f"Blueprint file {source} is empty.")
+            return text
 
         if isinstance(source, str):
             inline_text = source
@@ -253,25 +268,29 @@ class CodingOrchestrator:
             if not stripped:
                 raise ValueError("Blueprint text cannot be empty.")
 
+            # Markdown, markup, JSON, quoted text and URLs are never treated as
+            # paths, so the common inline blueprint skips the filesystem entirely.
             looks_like_path = (
                 len(stripped) <= MAX_CANDIDATE_PATH_CHARS
+                and stripped[0] not in _INLINE_LEADING_CHARS
                 and "\n" not in inline_text
                 and "\r" not in inline_text
+                and "\x00" not in stripped
+                and "://" not in stripped[:32]
             )
             if looks_like_path:
+                candidate_path = Path(stripped)
+                # EAFP: one open() instead of a stat() followed by open().
                 try:
-                    candidate_path = Path(stripped)
-                except (TypeError, ValueError, OSError):
-                    candidate_path = None
-                else:
-                    try:
-                        if candidate_path.exists():
-                            text = candidate_path.read_text(encoding="utf-8")
-                            if not text.strip():
-                                raise ValueError(f"Blueprint file {candidate_path} is empty.")
-                            return text
-                    except OSError:
-                        candidate_path = None
+                    text = candidate_path.read_text(encoding="utf-8")
+                except UnicodeDecodeError:
+                    raise
+                except (OSError, ValueError):
+                    text = None
+                if text is not None:
+                    if not text.strip():
+                        raise ValueError(f"Blueprint file {candidate_path} is empty.")
+                    return text
             return inline_text
 
         text = str(source)
@@ -1,13 +1,17 @@
 ﻿"""Document ingestion utilities."""
 from __future__ import annotations
 
-import base64
-import hashlib
-import re
+import asyncio
+import binascii
+import logging
+import multiprocessing
+import os
 import uuid
+from concurrent.futures import ProcessPoolExecutor
 from dataclasses import dataclass
+from functools import lru_cache
 from io import BytesIO
-from typing import List, Optional, Sequence, Tuple
+from typing import Dict, Iterator, List, Optional, Sequence, Tuple
 
 
 from projectplanner.models import DocumentStats, IngestionRequest, IngestionResponse
@@ -17,22 +21,33 @@ from projectplanner.logging_utils import get_logger
 
 CHUNK_CHAR_LIMIT = 1200
 CHUNK_OVERLAP = 200
+_CHUNK_STEP = CHUNK_CHAR_LIMIT - CHUNK_OVERLAP
+# pypdf and python-docx parse in pure Python while holding the GIL, so large
+# documents are parsed in worker processes instead of the decoding thread.
+PROCESS_PARSE_MIN_BYTES = 256 * 1024
+_PROCESS_PARSED_SUFFIXES = frozenset({"pdf", "docx"})
 
 
 LOGGER = get_logger(__name__)
 
 
-_EXTRA_WHITESPACE_TRANSLATION = {
-    ord('\u200b'): ' ',  # zero-width space
-    ord('\u200c'): ' ',  # zero-width non-joiner
-    ord('\u200d'): ' ',  # zero-width joiner
-    ord('\u2060'): ' ',  # word joiner
-    ord('\ufeff'): ' ',  # byte-order mark
-    0: ' ',                # NULL bytes from malformed PDFs
+# Zero-width space, zero-width non-joiner, zero-width joiner, word joiner,
+# byte-order mark, and NULL bytes from malformed PDFs all become spaces. A
+# two-string maketrans maps ordinals to ordinals, the cheapest entries for
+# str.translate to apply.
+_EXTRA_WHITESPACE_TRANSLATION = str.maketrans("\u200b\u200c\u200d\u2060\ufeff\x00", " " * 6)
+_BASE64_PREFIX = "base64:"
+_MIME_TO_SUFFIX = {
+    "application/pdf": "pdf",
+    "text/markdown": "md",
+    "text/x-markdown": "md",
+    "application/vnd.openxmlformats-officedocument.wordprocessingml.document": "docx",
+    "application/msword": "docx",
+    "text/plain": "txt",
 }
 
 
-@dataclass
+@dataclass(slots=True)
 class IngestionResult:
     run_id: str
     stats: DocumentStats
@@ -59,11 +74,12 @@ async def ingest_document(payload: IngestionRequest, *, store: ProjectPlannerSto
             "payload": {
                 "filename": payload.filename,
                 "format_hint": payload.format_hint,
-                "encoded": payload.blueprint.startswith("base64:"),
+                "encoded": payload.blueprint.startswith(_BASE64_PREFIX),
             },
         },
     )
-    raw_text, source = decode_blueprint_payload(payload)
+    # PDF/DOCX extraction is CPU-bound; keep it off the event loop.
+    raw_text, source = await asyncio.to_thread(decode_blueprint_payload, payload)
     LOGGER.info(
         "Loaded blueprint for run %s from %s",
         run_id,
@@ -74,33 +90,35 @@ async def ingest_document(payload: IngestionRequest, *, store: ProjectPlannerSto
             "payload": {"source": source, "raw_chars": len(raw_text)},
         },
     )
-    normalized_text = _normalize_text(raw_text)
-    chunks = _chunk_text(normalized_text)
-    unique_chunks = _dedupe_chunks(chunks)
-    LOGGER.debug(
-        "Chunked document into %s unique segments (from %s chunks)",
-        len(unique_chunks),
-        len(chunks),
-        extra={
-            "event": "ingest.chunking",
-            "run_id": run_id,
-            "payload": {"chunk_count": len(chunks), "unique_count": len(unique_chunks)},
-        },
-    )
+    unique_chunks, chunk_count, word_count, char_count = _process_text(raw_text)
+    if LOGGER.isEnabledFor(logging.DEBUG):
+        LOGGER.debug(
+            "Chunked document into %s unique segments (from %s chunks)",
+            len(unique_chunks),
+            chunk_count,
+            extra={
+                "event": "ingest.chunking",
+                "run_id": run_id,
+                "payload": {"chunk_count": chunk_count, "unique_count": len(unique_chunks)},
+            },
+        )
 
+    # Every chunk shares one read-only metadata dict instead of allocating its own.
+    chunk_metadata = {"source": source}
     stored_chunks = [
-        StoredChunk(idx=i, text=chunk, metadata={"source": source})
+        StoredChunk(idx=i, text=chunk, metadata=chunk_metadata)
         for i, chunk in enumerate(unique_chunks)
     ]
 
     stats = DocumentStats(
-        word_count=_count_words(normalized_text),
-        char_count=len(normalized_text),
+        word_count=word_count,
+        char_count=char_count,
         chunk_count=len(stored_chunks),
     )
 
     store.register_run(run_id, source=source, stats=stats.dict())
-    store.add_chunks(run_id, stored_chunks)
+    # The response only carries stats, so chunk rows are written in the background.
+    store.add_chunks_background(run_id, stored_chunks)
     LOGGER.info(
         "Completed ingestion run %s",
         run_id,
@@ -122,7 +140,7 @@ def _decode_blueprint(payload: IngestionRequest) -> Tuple[str, str]:
 
     blueprint = payload.blueprint
     decoded = _decode_blueprint_text(blueprint, payload.format_hint)
-    if blueprint.startswith("base64:"):
+    if blueprint.startswith(_BASE64_PREFIX):
         source = payload.filename or "uploaded-blueprint"
     else:
         source = payload.filename or "inline-blueprint"
@@ -131,28 +149,39 @@ def _decode_blueprint(payload: IngestionRequest) -> Tuple[str, str]:
 
 
 def _decode_blueprint_text(text: str, format_hint: Optional[str]) -> str:
-    if text.startswith("base64:"):
-        _, meta, encoded = text.split(":", 2)
-        data = base64.b64decode(encoded)
+    if text.startswith(_BASE64_PREFIX):
+        # Slice around the meta separator instead of splitting, which would copy
+        # a multi-MB payload into intermediate substrings.
+        separator = text.index(":", len(_BASE64_PREFIX))
+        meta = text[len(_BASE64_PREFIX):separator]
+        data = binascii.a2b_base64(text[separator + 1:])
         suffix = _infer_suffix_from_content_type(meta) or format_hint or "txt"
+        if LOGGER.isEnabledFor(logging.DEBUG):
+            LOGGER.debug(
+                "Decoded base64 payload (%s bytes) with suffix %s",
+                len(data),
+                suffix,
+                extra={"event": "ingest.inline.decode", "payload": {"bytes": len(data), "suffix": suffix}},
+            )
+        if suffix in _PROCESS_PARSED_SUFFIXES and len(data) >= PROCESS_PARSE_MIN_BYTES:
+            return _document_parser_pool().submit(_parse_by_format, data, suffix).result()
+        return _parse_by_format(data, suffix)
+    if LOGGER.isEnabledFor(logging.DEBUG):
         LOGGER.debug(
-            "Decoded base64 payload (%s bytes) with suffix %s",
-            len(data),
-            suffix,
-            extra={"event": "ingest.inline.decode", "payload": {"bytes": len(data), "suffix": suffix}},
+            "Using inline text payload (%s chars)",
+            len(text),
+            extra={"event": "ingest.inline.text", "payload": {"chars": len(text)}},
         )
-        return _parse_by_format(data, suffix)
-    LOGGER.debug(
-        "Using inline text payload (%s chars)",
-        len(text),
-        extra={"event": "ingest.inline.text", "payload": {"chars": len(text)}},
-    )
     return text
 
 
 
 def _infer_suffix_from_content_type(content_type: str) -> Optional[str]:
     content_type = content_type.lower()
+    suffix = _MIME_TO_SUFFIX.get(content_type.split(";", 1)[0].strip())
+    if suffix is not None:
+        return suffix
+    # Loose hints such as "markdown" or "word" still resolve by substring.
     if "pdf" in content_type:
         return "pdf"
     if "markdown" in content_type or "md" in content_type:
@@ -164,6 +193,15 @@ def _infer_suffix_from_content_type(content_type: str) -> Optional[str]:
     return None
 
 
+@lru_cache(maxsize=1)
+def _document_parser_pool() -> ProcessPoolExecutor:
+    # "spawn" avoids forking a process that already runs server and writer threads.
+    return ProcessPoolExecutor(
+        max_workers=min(4, os.cpu_count() or 1),
+        mp_context=multiprocessing.get_context("spawn"),
+    )
+
+
 def _parse_by_format(data: bytes, format_hint: str) -> str:
     suffix = (format_hint or "txt").lower().lstrip(".")
     if suffix == "pdf":
@@ -184,13 +222,14 @@ def _parse_by_format(data: bytes, format_hint: str) -> str:
         parsed = "\n".join(p.text for p in document.paragraphs)
     else:
         parsed = data.decode("utf-8", errors="ignore")
-    LOGGER.debug(
-        "Parsed %s bytes as %s (%s chars)",
-        len(data),
-        suffix,
-        len(parsed),
-        extra={"event": "ingest.parse", "payload": {"suffix": suffix, "chars": len(parsed)}},
-    )
+    if LOGGER.isEnabledFor(logging.DEBUG):
+        LOGGER.debug(
+            "Parsed %s bytes as %s (%s chars)",
+            len(data),
+            suffix,
+            len(parsed),
+            extra={"event": "ingest.parse", "payload": {"suffix": suffix, "chars": len(parsed)}},
+        )
     return parsed
 
 
@@ -198,70 +237,74 @@ def _normalize_text(text: str) -> str:
     if not text:
         return ""
 
-    sanitized = text.translate(_EXTRA_WHITESPACE_TRANSLATION)
-    collapsed = re.sub(r"\s+", " ", sanitized).strip()
-    LOGGER.debug(
-        "Normalized text from %s to %s chars",
-        len(text),
-        len(collapsed),
-        extra={"event": "ingest.normalize", "payload": {"input_chars": len(text), "output_chars": len(collapsed)}},
-    )
+    # NULL is the only ASCII entry in the translation table, so pure-ASCII text
+    # (most blueprints) takes a single memchr-backed replace instead.
+    if text.isascii():
+        sanitized = text.replace("\x00", " ")
+    else:
+        sanitized = text.translate(_EXTRA_WHITESPACE_TRANSLATION)
+    # str.split() with no separator is a single C scan over Unicode whitespace
+    # (the same class as regex \s), so no regex engine is involved.
+    collapsed = " ".join(sanitized.split())
+    if LOGGER.isEnabledFor(logging.DEBUG):
+        LOGGER.debug(
+            "Normalized text from %s to %s chars",
+            len(text),
+            len(collapsed),
+            extra={"event": "ingest.normalize", "payload": {"input_chars": len(text), "output_chars": len(collapsed)}},
+        )
     return collapsed
 
 
-def _chunk_text(text: str) -> List[str]:
-    if not text:
-        return []
-    chunks: List[str] = []
-    start = 0
-    length = len(text)
-    while start < length:
-        end = min(start + CHUNK_CHAR_LIMIT, length)
-        chunk = text[start:end]
-        chunks.append(chunk.strip())
-        if end == length:
-            break
-        start = max(end - CHUNK_OVERLAP, 0)
-        if start == end:
-            break
-    filtered = [chunk for chunk in chunks if chunk]
-    LOGGER.debug(
-        "Chunked text into %s segments",
-        len(filtered),
-        extra={"event": "ingest.chunk.create", "payload": {"chunk_count": len(filtered)}},
-    )
-    return filtered
-
-
-def _dedupe_chunks(chunks: Sequence[str]) -> List[str]:
-    seen = set()
-    unique: List[str] = []
-    for chunk in chunks:
-        fingerprint = hashlib.sha1(chunk.encode("utf-8")).hexdigest()
-        if fingerprint not in seen:
-            seen.add(fingerprint)
-            unique.append(chunk)
-    LOGGER.debug(
-        "Deduplicated %s chunks down to %s",
-        len(chunks),
-        len(unique),
-        extra={"event": "ingest.chunk.dedupe", "payload": {"input": len(chunks), "output": len(unique)}},
-    )
-    return unique
+def _iter_chunk_spans(length: int) -> Iterator[Tuple[int, int]]:
+    """Yield overlapping `(start, end)` windows covering a text of `length` chars."""
+
+    if length <= 0:
+        return
+    # Windows start every `step` chars; the last one is the first to reach `length`,
+    # so only it needs clamping and every other window is exactly `limit` long.
+    limit = CHUNK_CHAR_LIMIT
+    starts = range(0, max(length - limit, 0) + _CHUNK_STEP, _CHUNK_STEP)
+    for start in starts[:-1]:
+        yield start, start + limit
+    yield starts[-1], length
+
+
+def _process_text(raw_text: str) -> Tuple[List[str], int, int, int]:
+    """Normalize, chunk, and dedupe a blueprint in one walk over its windows.
+
+    Returns `(unique_chunks, chunk_count, word_count, char_count)`. Windows are
+    deduplicated as they are cut, so no intermediate list of every chunk is built.
+    """
+
+    text = _normalize_text(raw_text)
+    # Exact string keys: str hashes are cached on the object, so this avoids
+    # encoding and digesting every chunk while keeping first-seen order.
+    # Normalized text is trimmed and single-spaced, so no window strips to empty.
+    unique: Dict[str, None] = {}
+    chunk_count = 0
+    for start, end in _iter_chunk_spans(len(text)):
+        chunk_count += 1
+        unique[text[start:end].strip()] = None
+    return list(unique), chunk_count, _count_words(text), len(text)
 
 
 def _count_words(text: str) -> int:
+    # Expects `_normalize_text` output, where words are separated by exactly one
+    # space, so counting separators avoids materializing a list of every token.
     if not text:
+        if LOGGER.isEnabledFor(logging.DEBUG):
+            LOGGER.debug(
+                "Word count requested for empty text",
+                extra={"event": "ingest.wordcount", "payload": {"words": 0}},
+            )
+        return 0
+    words = text.count(" ") + 1
+    if LOGGER.isEnabledFor(logging.DEBUG):
         LOGGER.debug(
-            "Word count requested for empty text",
-            extra={"event": "ingest.wordcount", "payload": {"words": 0}},
+            "Computed word count",
+            extra={"event": "ingest.wordcount", "payload": {"words": words}},
         )
-        return 0
-    words = len(text.split())
-    LOGGER.debug(
-        "Computed word count",
-        extra={"event": "ingest.wordcount", "payload": {"words": words}},
-    )
     return words
 
 
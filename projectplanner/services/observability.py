@@ -1,10 +1,14 @@
 """Observability snapshot utilities for the coding conductor workflow."""
 from __future__ import annotations
 
+import heapq
 import math
 from dataclasses import dataclass
+from functools import lru_cache
+from operator import attrgetter, itemgetter
+from statistics import fmean
 from datetime import datetime, timezone
-from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple
+from typing import Any, Dict, List, Optional, Sequence, Tuple
 
 from projectplanner.logging_utils import get_log_manager
 from projectplanner.models import (
@@ -17,6 +21,11 @@ from projectplanner.models import (
 MAX_LOGS_PER_STREAM = 400
 MAX_CALLS = 150
 
+# Levels seen per module are tracked as a bitmask; unknown levels share one bit.
+_LEVEL_BITS = {"DEBUG": 1, "INFO": 2, "WARNING": 4, "ERROR": 8, "CRITICAL": 16}
+_OTHER_LEVEL_BIT = 32
+_ERROR_LEVEL_MASK = _LEVEL_BITS["ERROR"] | _LEVEL_BITS["CRITICAL"]
+
 
 @dataclass(frozen=True)
 class ModuleDefinition:
@@ -144,6 +153,20 @@ MODULE_DEFINITIONS: Sequence[ModuleDefinition] = (
     ),
 )
 
+# Flattened lookup tables in definition order, so earlier modules keep precedence.
+_EVENT_TO_MODULE: Dict[str, str] = {
+    event: definition.id for definition in reversed(MODULE_DEFINITIONS) for event in definition.event_names
+}
+_EVENT_PREFIX_TO_MODULE: Tuple[Tuple[str, str], ...] = tuple(
+    (prefix, definition.id) for definition in MODULE_DEFINITIONS for prefix in definition.event_prefixes
+)
+_LOGGER_PREFIX_TO_MODULE: Tuple[Tuple[str, str], ...] = tuple(
+    (prefix, definition.id) for definition in MODULE_DEFINITIONS for prefix in definition.logger_prefixes
+)
+_AGENT_PREFIX_TO_MODULE: Tuple[Tuple[str, str], ...] = tuple(
+    (agent.lower(), definition.id) for definition in MODULE_DEFINITIONS for agent in definition.prompt_agents
+)
+
 EDGE_DEFINITIONS: Sequence[Tuple[str, str, Optional[str]]] = (
     ("api_ingest", "ingestion_pipeline", "Document intake"),
     ("ingestion_pipeline", "document_store", "Persist context"),
@@ -178,12 +201,14 @@ def build_observability_snapshot(
     runtime_logs = manager.get_logs(limit=effective_limit, log_type="runtime", start=start, end=end)
     prompt_logs = manager.get_logs(limit=effective_limit, log_type="prompts", start=start, end=end)
 
-    records: List[Tuple[datetime, str, Dict[str, Any]]] = []
-    for entry in runtime_logs:
-        records.append((_parse_timestamp(entry.get("timestamp")), "runtime", entry))
-    for entry in prompt_logs:
-        records.append((_parse_timestamp(entry.get("timestamp")), "prompts", entry))
-    records.sort(key=lambda item: item[0])
+    now = datetime.now(timezone.utc)
+    records: List[Tuple[datetime, str, Dict[str, Any]]] = [
+        (_parse_timestamp(entry.get("timestamp"), now), "runtime", entry) for entry in runtime_logs
+    ]
+    records.extend(
+        (_parse_timestamp(entry.get("timestamp"), now), "prompts", entry) for entry in prompt_logs
+    )
+    records.sort(key=itemgetter(0))
 
     stats_map = _initial_stats()
     active_durations: Dict[Tuple[str, int, str], datetime] = {}
@@ -196,7 +221,7 @@ def build_observability_snapshot(
         stats = stats_map[module_id]
         stats["event_count"] += 1
         level = (record.get("level") or "INFO").upper()
-        stats["levels"].add(level)
+        stats["level_mask"] |= _LEVEL_BITS.get(level, _OTHER_LEVEL_BIT)
         if level in {"ERROR", "CRITICAL"}:
             stats["error_count"] += 1
         elif level == "WARNING":
@@ -227,22 +252,20 @@ def build_observability_snapshot(
             )
         )
 
-    calls.sort(key=lambda call: call.timestamp, reverse=True)
-    if len(calls) > call_limit:
-        calls = calls[:call_limit]
+    # Only the newest `call_limit` calls are returned, so select them instead of sorting all.
+    calls = heapq.nlargest(call_limit, calls, key=attrgetter("timestamp"))
 
     nodes: List[ObservabilityNode] = []
     for definition in MODULE_DEFINITIONS:
         stats = stats_map[definition.id]
-        status = _derive_status(stats["levels"])
+        status = _derive_status(stats["level_mask"])
         metrics: Dict[str, Any] = {
             "total_runs": len(stats["run_ids"]),
             "warning_count": stats["warning_count"],
             "error_count": stats["error_count"],
         }
         if stats["latencies"]:
-            avg = sum(stats["latencies"]) / len(stats["latencies"])
-            metrics["avg_latency_ms"] = round(avg, 2)
+            metrics["avg_latency_ms"] = round(fmean(stats["latencies"]), 2)
             metrics["p95_latency_ms"] = round(_percentile(stats["latencies"], 0.95), 2)
             metrics["last_latency_ms"] = round(stats["last_latency"] or stats["latencies"][-1], 2)
         if stats["last_message"]:
@@ -282,7 +305,7 @@ def _initial_stats() -> Dict[str, Dict[str, Any]]:
         stats[definition.id] = {
             "definition": definition,
             "event_count": 0,
-            "levels": set(),
+            "level_mask": 0,
             "run_ids": set(),
             "last_event": None,
             "last_timestamp": None,
@@ -295,46 +318,61 @@ def _initial_stats() -> Dict[str, Dict[str, Any]]:
     return stats
 
 
-def _parse_timestamp(value: Optional[str]) -> datetime:
-    if not value:
-        return datetime.now(timezone.utc)
-    normalized = value.replace("Z", "+00:00")
-    try:
-        return datetime.fromisoformat(normalized)
-    except ValueError:
-        return datetime.now(timezone.utc)
+def _parse_timestamp(value: Optional[str], fallback: Optional[datetime] = None) -> datetime:
+    # Log records carry `isoformat()` output, so the direct parse is the common
+    # path; only a Zulu suffix (rejected by fromisoformat before 3.11) is rewritten.
+    if value:
+        try:
+            return datetime.fromisoformat(value)
+        except ValueError:
+            if value.endswith("Z"):
+                try:
+                    return datetime.fromisoformat(value[:-1] + "+00:00")
+                except ValueError:
+                    pass
+    return fallback or datetime.now(timezone.utc)
 
 
 def _match_module(record: Dict[str, Any], log_type: str) -> Optional[str]:
-    event = record.get("event") or ""
-    logger_name = record.get("logger") or ""
-    payload = record.get("payload")
-
-    for definition in MODULE_DEFINITIONS:
-        if event and event in definition.event_names:
-            return definition.id
-    for definition in MODULE_DEFINITIONS:
-        if event and any(event.startswith(prefix) for prefix in definition.event_prefixes):
-            return definition.id
-    for definition in MODULE_DEFINITIONS:
-        if any(logger_name.startswith(prefix) for prefix in definition.logger_prefixes):
-            return definition.id
-    if log_type == "prompts" and isinstance(payload, dict):
-        agent = str(payload.get("agent") or "").lower()
-        if agent:
-            for definition in MODULE_DEFINITIONS:
-                if any(agent.startswith(candidate.lower()) for candidate in definition.prompt_agents):
-                    return definition.id
+    agent = ""
+    if log_type == "prompts":
+        payload = record.get("payload")
+        if isinstance(payload, dict):
+            agent = str(payload.get("agent") or "").lower()
+    return _resolve_module(record.get("event") or "", record.get("logger") or "", agent)
+
+
+@lru_cache(maxsize=1024)
+def _resolve_module(event: str, logger_name: str, agent: str) -> Optional[str]:
+    """Map an (event, logger, prompt agent) triple to a module id.
+
+    Log streams repeat a small vocabulary of events and loggers, so memoizing
+    the lookup makes most records a single cache hit.
+    """
+
+    if event:
+        module_id = _EVENT_TO_MODULE.get(event)
+        if module_id is not None:
+            return module_id
+        for prefix, module_id in _EVENT_PREFIX_TO_MODULE:
+            if event.startswith(prefix):
+                return module_id
+    for prefix, module_id in _LOGGER_PREFIX_TO_MODULE:
+        if logger_name.startswith(prefix):
+            return module_id
+    if agent:
+        for prefix, module_id in _AGENT_PREFIX_TO_MODULE:
+            if agent.startswith(prefix):
+                return module_id
     return None
 
 
-def _derive_status(levels: Iterable[str]) -> str:
-    normalized = {level for level in levels if level}
-    if not normalized:
+def _derive_status(level_mask: int) -> str:
+    if not level_mask:
         return "idle"
-    if any(level in {"ERROR", "CRITICAL"} for level in normalized):
+    if level_mask & _ERROR_LEVEL_MASK:
         return "error"
-    if "WARNING" in normalized:
+    if level_mask & _LEVEL_BITS["WARNING"]:
         return "degraded"
     return "healthy"
 
@@ -342,16 +380,17 @@ def _derive_status(levels: Iterable[str]) -> str:
 def _percentile(values: Sequence[float], percentile: float) -> float:
     if not values:
         return 0.0
-    ordered = sorted(values)
-    if len(ordered) == 1:
-        return ordered[0]
-    rank = percentile * (len(ordered) - 1)
+    if len(values) == 1:
+        return values[0]
+    rank = percentile * (len(values) - 1)
     lower = math.floor(rank)
     upper = math.ceil(rank)
+    # Only ranks from `lower` up matter, so select that tail instead of sorting everything.
+    tail = heapq.nlargest(len(values) - lower, values)
     if lower == upper:
-        return ordered[int(rank)]
+        return tail[-1]
     fraction = rank - lower
-    return ordered[lower] + (ordered[upper] - ordered[lower]) * fraction
+    return tail[-1] + (tail[-2] - tail[-1]) * fraction
 
 
 def _sanitize_payload(payload: Any) -> Optional[Dict[str, Any]]:
@@ -3,7 +3,7 @@ from __future__ import annotations
 
 from dataclasses import dataclass
 from datetime import datetime, timezone
-from threading import RLock
+from threading import Lock
 from typing import Dict, List, Tuple
 
 from projectplanner.logging_utils import get_logger
@@ -28,10 +28,13 @@ class _OrchestratorSession:
     source: str | None
     created_at: datetime
     updated_at: datetime
+    cached_status: OrchestratorSessionStatus | None = None
 
 
+# Reads rely on dict lookups being atomic under the GIL; `_LOCK` only
+# serializes structural changes (registering and discarding sessions).
 _SESSIONS: Dict[str, _OrchestratorSession] = {}
-_LOCK = RLock()
+_LOCK = Lock()
 
 
 class OrchestratorSessionNotFound(KeyError):
@@ -47,16 +50,15 @@ def _now() -> datetime:
 
 
 def _get_session(run_id: str) -> _OrchestratorSession:
-    with _LOCK:
-        session = _SESSIONS.get(run_id)
+    session = _SESSIONS.get(run_id)
     if not session:
         raise OrchestratorSessionNotFound(run_id)
     return session
 
 
 def _touch(session: _OrchestratorSession) -> None:
-    with _LOCK:
-        session.updated_at = _now()
+    session.updated_at = _now()
+    session.cached_status = None
 
 
 def create_session(payload: IngestionRequest) -> Tuple[str, BlueprintSummary, str | None]:
@@ -180,9 +182,17 @@ def finalize(run_id: str) -> OrchestratorResult:
 
 
 def describe_session(run_id: str) -> OrchestratorSessionStatus:
-    session = _get_session(run_id)
+    return _describe(run_id, _get_session(run_id))
+
+
+def _describe(run_id: str, session: _OrchestratorSession) -> OrchestratorSessionStatus:
+    # Every workflow transition goes through `_touch`, which drops the cached status.
+    cached = session.cached_status
+    if cached is not None:
+        return cached
     orchestrator = session.orchestrator
-    return OrchestratorSessionStatus(
+    updated_at = session.updated_at
+    status = OrchestratorSessionStatus(
         run_id=run_id,
         source=session.source,
         summary_ready=orchestrator.summary_ready,
@@ -191,14 +201,18 @@ def describe_session(run_id: str) -> OrchestratorSessionStatus:
         milestones_approved=orchestrator.milestones_approved,
         prompts_ready=orchestrator.prompts_ready,
         created_at=session.created_at,
-        updated_at=session.updated_at,
+        updated_at=updated_at,
     )
+    # Skip caching if a transition landed while the status was being built.
+    if session.updated_at is updated_at:
+        session.cached_status = status
+    return status
 
 
 def list_sessions() -> List[OrchestratorSessionStatus]:
-    with _LOCK:
-        run_ids = list(_SESSIONS.keys())
-    return [describe_session(run_id) for run_id in run_ids]
+    # list(dict.items()) is a single atomic copy, so sessions discarded
+    # concurrently cannot make this raise.
+    return [_describe(run_id, session) for run_id, session in list(_SESSIONS.items())]
 
 
 def discard_session(run_id: str) -> bool:
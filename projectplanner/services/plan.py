@@ -1,15 +1,23 @@
 """Planning workflow orchestration."""
 from __future__ import annotations
 
+import asyncio
+import hashlib
+import itertools
 import json
-from datetime import datetime
-from typing import Any, Dict, Iterator, List, Tuple
-
+import re
+import threading
+from collections import OrderedDict, deque
+from datetime import datetime, timezone
+from operator import attrgetter
+from typing import Any, Callable, Dict, Generator, Iterator, List, Optional, Tuple
+
+import yaml
 from fastapi import HTTPException
 
-from projectplanner.agents.coordinator_agent import CoordinatorAgent
-from projectplanner.agents.decomposer_agent import DecomposerAgent
-from projectplanner.agents.planner_agent import PlannerAgent
+from projectplanner.agents.coordinator_agent import CoordinatorAgent, resolve_coordinator_model
+from projectplanner.agents.decomposer_agent import DecomposerAgent, resolve_decomposer_model
+from projectplanner.agents.planner_agent import PlannerAgent, resolve_planner_model
 from projectplanner.agents.reviewer_agent import ReviewerAgent
 from projectplanner.agents.schemas import (
     CoordinatorAgentInput,
@@ -23,25 +31,62 @@ from projectplanner.models import (
     ExportMetadata,
     ExportRequest,
     ExportResponse,
+    MilestoneObjective,
     PlanRequest,
     PlanResponse,
     PromptPlan,
     PromptStep,
 )
-from projectplanner.services.store import ProjectPlannerStore
+from projectplanner.services.store import CachedPlan, ChunkWriteError, ProjectPlannerStore
+
+try:  # pragma: no cover - optional dependency guard
+    import orjson
+except Exception:  # pragma: no cover
+    orjson = None  # type: ignore[assignment]
+
+_PLAN_LIST_FIELDS = ("goals", "assumptions", "non_goals", "risks", "milestones")
+_PLAN_LIST_HEADINGS = tuple(field.replace("_", " ").title() for field in _PLAN_LIST_FIELDS)
+_plan_lists = attrgetter(*_PLAN_LIST_FIELDS)
+# Wide enough that libyaml never folds a prompt line.
+_YAML_LINE_WIDTH = 1_000_000
+_BACKTICK_RUN = re.compile(r"`{3,}")
+
+
+class _BlockStyleDumper(getattr(yaml, "CSafeDumper", yaml.SafeDumper)):  # type: ignore[misc]
+    """Safe dumper (libyaml-backed when available) that keeps multiline text as `|` blocks."""
+
+
+def _represent_str(dumper: yaml.SafeDumper, value: str) -> yaml.ScalarNode:
+    style = "|" if "\n" in value else None
+    return dumper.represent_scalar("tag:yaml.org,2002:str", value, style=style)
+
+
+_BlockStyleDumper.add_representer(str, _represent_str)
 
 PlanningEvent = Tuple[str, Dict[str, Any]]
+# Artifacts plus their JSON-ready forms, serialized once and shared by every event,
+# and whether every agent stage was answered by a model rather than a heuristic.
+PlanArtifacts = Tuple[List[MilestoneObjective], PromptPlan, List[PromptStep], AgentReport, Dict[str, Any], bool]
+
+# Bump when agent prompts or output schemas change so cached plans are not reused.
+PLAN_CACHE_VERSION = 1
 
 
 LOGGER = get_logger(__name__)
 
+EXPORT_CACHE_SIZE = 64
+# (database url, run_id, format, persisted artifact revision) -> rendered export text,
+# most recently used last. The revision is stored in the database, so writes from
+# any process or store instance change the key.
+ExportCacheKey = Tuple[str, str, str, str]
+_EXPORT_CACHE: OrderedDict[ExportCacheKey, str] = OrderedDict()
+_EXPORT_CACHE_LOCK = threading.Lock()
+
 
 def _serialize_report(report: AgentReport) -> Dict[str, Any]:
     """Convert the reviewer report into a JSON safe payload."""
 
-    data = report.dict()
-    data["generated_at"] = report.generated_at.isoformat()
-    return data
+    return report.model_dump(mode="json")
 
 
 def _planning_generator(
@@ -66,7 +111,17 @@ def _planning_generator(
         )
         raise HTTPException(status_code=404, detail="Run not found. Ingest a document first.")
 
-    chunks = store.get_chunks(payload.run_id)
+    try:
+        chunks = store.get_chunks(payload.run_id)
+    except ChunkWriteError as error:
+        LOGGER.error(
+            "Chunks for run %s failed to persist",
+            payload.run_id,
+            extra={"event": "planning.chunks_failed", "run_id": payload.run_id},
+        )
+        raise HTTPException(
+            status_code=500, detail="Run chunks failed to persist. Ingest the document again."
+        ) from error
     if not chunks:
         LOGGER.warning(
             "Run %s has no chunks available for planning",
@@ -88,6 +143,79 @@ def _planning_generator(
     )
     yield ("coordinator_started", coordinator_started)
 
+    fingerprint = _plan_fingerprint(text_chunks, payload)
+    cached = store.get_cached_plan(fingerprint) if payload.use_cache else None
+    if cached is None:
+        objectives, plan, reviewed_steps, report, serialized, from_model = yield from _run_agent_stages(
+            payload, text_chunks, store=store
+        )
+    else:
+        objectives, plan, reviewed_steps, report, serialized, from_model = yield from _replay_cached_stages(
+            payload, text_chunks, cached, store=store
+        )
+
+    with store.transaction():
+        store.attach_plan_context(
+            payload.run_id,
+            target_stack=payload.target_stack.dict(),
+            style=payload.style,
+        )
+        store.upsert_plan(payload.run_id, plan)
+        store.upsert_steps(payload.run_id, reviewed_steps)
+        store.upsert_report(payload.run_id, report)
+    LOGGER.debug(
+        "Persisted plan artifacts for run %s",
+        payload.run_id,
+        extra={"event": "planning.persisted", "run_id": payload.run_id},
+    )
+    # Heuristic fallbacks (no client, or a failed GPT call) are never cached, so a
+    # transient OpenAI error does not pin these inputs to the fallback plan.
+    if from_model:
+        try:
+            store.cache_plan(fingerprint, objectives=objectives, plan=plan, steps=reviewed_steps, report=report)
+        except Exception:
+            LOGGER.exception(
+                "Failed to cache plan artifacts for run %s",
+                payload.run_id,
+                extra={"event": "planning.cache.error", "run_id": payload.run_id},
+            )
+
+    final_payload: Dict[str, Any] = {"run_id": payload.run_id, **serialized}
+    LOGGER.info(
+        "Planning workflow complete for run %s",
+        payload.run_id,
+        extra={
+            "event": "planning.complete",
+            "run_id": payload.run_id,
+            "payload": {"step_count": len(reviewed_steps)},
+        },
+    )
+    yield ("final_plan", final_payload)
+    return PlanResponse(plan=plan, steps=reviewed_steps, report=report, objectives=objectives)
+
+
+def _plan_fingerprint(text_chunks: List[str], payload: PlanRequest) -> str:
+    """Hash the planning inputs so repeated requests can reuse a cached plan."""
+
+    digest = hashlib.sha256(usedforsecurity=False)
+    options = {
+        "version": PLAN_CACHE_VERSION,
+        "models": [resolve_coordinator_model(), resolve_planner_model(), resolve_decomposer_model()],
+        "target_stack": payload.target_stack.dict(),
+        "style": payload.style,
+    }
+    digest.update(json.dumps(options, sort_keys=True).encode("utf-8"))
+    for chunk in text_chunks:
+        digest.update(b"\x00")
+        digest.update(chunk.encode("utf-8"))
+    return digest.hexdigest()
+
+
+def _run_agent_stages(
+    payload: PlanRequest, text_chunks: List[str], *, store: ProjectPlannerStore
+) -> Generator[PlanningEvent, None, PlanArtifacts]:
+    """Run the coordinator, planner, decomposer, and reviewer agents in order."""
+
     coordinator_input = CoordinatorAgentInput(
         run_id=payload.run_id,
         chunks=text_chunks,
@@ -96,15 +224,17 @@ def _planning_generator(
     )
     coordinator = CoordinatorAgent()
     coordinator_output = coordinator.synthesize_objectives(coordinator_input)
+    from_model = coordinator_output.from_model
     objectives = sorted(
         coordinator_output.objectives,
         key=lambda objective: objective.order,
     )
     store.upsert_objectives(payload.run_id, objectives)
+    objective_dicts = [objective.model_dump(mode="json") for objective in objectives]
     coordinator_completed = {
         "run_id": payload.run_id,
         "objective_count": len(objectives),
-        "objectives": [objective.dict() for objective in objectives],
+        "objectives": objective_dicts,
     }
     LOGGER.info(
         "Coordinator produced %s objectives",
@@ -112,7 +242,11 @@ def _planning_generator(
         extra={
             "event": "planning.coordinator.complete",
             "run_id": payload.run_id,
-            "payload": coordinator_completed,
+            # Counts and ids only; the full objectives travel in the stream event.
+            "payload": {
+                "objective_count": len(objectives),
+                "objective_ids": [objective.id for objective in objectives],
+            },
         },
     )
     yield ("coordinator_completed", coordinator_completed)
@@ -141,8 +275,10 @@ def _planning_generator(
     )
     planner = PlannerAgent()
     plan_output = planner.generate_plan(planner_input)
+    from_model = from_model and plan_output.from_model
     plan = plan_output.plan
-    planner_completed = {"plan": plan.dict()}
+    plan_dict = plan.model_dump(mode="json")
+    planner_completed = {"plan": plan_dict}
     LOGGER.info(
         "Planner completed",
         extra={
@@ -161,8 +297,9 @@ def _planning_generator(
     )
     decomposer = DecomposerAgent()
     steps_output = decomposer.decompose(decomposer_input)
+    from_model = from_model and steps_output.from_model
     steps = steps_output.steps
-    decomposer_completed = {"steps": [step.dict() for step in steps]}
+    decomposer_completed = {"steps": [step.model_dump(mode="json") for step in steps]}
     LOGGER.info(
         "Decomposer produced %s steps",
         len(steps),
@@ -179,10 +316,9 @@ def _planning_generator(
     review_output = reviewer.review(reviewer_input)
     reviewed_steps = review_output.steps
     report = review_output.report
-    reviewer_completed = {
-        "report": _serialize_report(report),
-        "steps": [step.dict() for step in reviewed_steps],
-    }
+    report_dict = _serialize_report(report)
+    step_dicts = [step.model_dump(mode="json") for step in reviewed_steps]
+    reviewer_completed = {"report": report_dict, "steps": step_dicts}
     LOGGER.info(
         "Reviewer completed with overall score %.2f",
         report.overall_score,
@@ -193,39 +329,53 @@ def _planning_generator(
         },
     )
     yield ("reviewer_completed", reviewer_completed)
+    serialized = {"plan": plan_dict, "steps": step_dicts, "report": report_dict, "objectives": objective_dicts}
+    return objectives, plan, reviewed_steps, report, serialized, from_model
 
-    store.attach_plan_context(
-        payload.run_id,
-        target_stack=payload.target_stack.dict(),
-        style=payload.style,
-    )
-    store.upsert_plan(payload.run_id, plan)
-    store.upsert_steps(payload.run_id, reviewed_steps)
-    store.upsert_report(payload.run_id, report)
-    LOGGER.debug(
-        "Persisted plan artifacts for run %s",
-        payload.run_id,
-        extra={"event": "planning.persisted", "run_id": payload.run_id},
-    )
 
-    final_payload: Dict[str, Any] = {
-        "run_id": payload.run_id,
-        "plan": plan.dict(),
-        "steps": [step.dict() for step in reviewed_steps],
-        "report": _serialize_report(report),
-        "objectives": [objective.dict() for objective in objectives],
-    }
+def _replay_cached_stages(
+    payload: PlanRequest, text_chunks: List[str], cached: CachedPlan, *, store: ProjectPlannerStore
+) -> Generator[PlanningEvent, None, PlanArtifacts]:
+    """Emit stage events for a cached plan without calling any agent."""
+
     LOGGER.info(
-        "Planning workflow complete for run %s",
+        "Planning served from plan cache for run %s",
         payload.run_id,
-        extra={
-            "event": "planning.complete",
-            "run_id": payload.run_id,
-            "payload": {"step_count": len(reviewed_steps)},
-        },
+        extra={"event": "planning.cache.hit", "run_id": payload.run_id},
     )
-    yield ("final_plan", final_payload)
-    return PlanResponse(plan=plan, steps=reviewed_steps, report=report, objectives=objectives)
+    objectives = cached.objectives
+    report = cached.report.model_copy(update={"run_id": payload.run_id, "generated_at": datetime.utcnow()})
+    store.upsert_objectives(payload.run_id, objectives)
+    objective_dicts = [objective.model_dump(mode="json") for objective in objectives]
+    yield (
+        "coordinator_completed",
+        {"run_id": payload.run_id, "objective_count": len(objectives), "objectives": objective_dicts},
+    )
+    yield (
+        "planner_started",
+        {"run_id": payload.run_id, "chunk_count": len(text_chunks), "objective_count": len(objectives)},
+    )
+    plan_dict = cached.plan.model_dump(mode="json")
+    yield ("planner_completed", {"plan": plan_dict})
+    # Only reviewed steps are cached, so they stand in for the decomposer draft.
+    step_dicts = [step.model_dump(mode="json") for step in cached.steps]
+    yield ("decomposer_completed", {"steps": step_dicts})
+    report_dict = _serialize_report(report)
+    yield ("reviewer_completed", {"report": report_dict, "steps": step_dicts})
+    serialized = {"plan": plan_dict, "steps": step_dicts, "report": report_dict, "objectives": objective_dicts}
+    # Already cached, so there is nothing new to store.
+    return objectives, cached.plan, cached.steps, report, serialized, False
+
+
+def _drain_planning(payload: PlanRequest, store: ProjectPlannerStore) -> PlanResponse | None:
+    result: List[PlanResponse | None] = [None]
+
+    def capture() -> Generator[PlanningEvent, None, None]:
+        result[0] = yield from _planning_generator(payload, store=store)
+
+    # deque(maxlen=0) discards the events in C; `capture` keeps the return value.
+    deque(capture(), maxlen=0)
+    return result[0]
 
 
 async def run_planning_workflow(payload: PlanRequest, *, store: ProjectPlannerStore) -> PlanResponse:
@@ -236,14 +386,9 @@ async def run_planning_workflow(payload: PlanRequest, *, store: ProjectPlannerSt
         payload.run_id,
         extra={"event": "planning.run.execute", "run_id": payload.run_id, "payload": {"mode": "coroutine"}},
     )
-    generator = _planning_generator(payload, store=store)
-    final_response: PlanResponse | None = None
-    while True:
-        try:
-            next(generator)
-        except StopIteration as stop:
-            final_response = stop.value
-            break
+    # The agents and store calls block, so the workflow runs on a worker thread
+    # instead of stalling the event loop for the length of the LLM chain.
+    final_response = await asyncio.to_thread(_drain_planning, payload, store)
     if final_response is None:
         raise RuntimeError("Planning did not produce a final response.")
     LOGGER.debug(
@@ -267,7 +412,13 @@ def planning_event_stream(
     return _planning_generator(payload, store=store)
 
 
-async def export_prompts(payload: ExportRequest, *, store: ProjectPlannerStore) -> ExportResponse:
+def stream_export(payload: ExportRequest, *, store: ProjectPlannerStore) -> Tuple[ExportMetadata, Iterator[str]]:
+    """Load a run's artifacts and return export metadata plus a lazy iterator of text chunks.
+
+    Chunks are produced one section or step at a time, so callers streaming the
+    export never hold the whole document in memory.
+    """
+
     LOGGER.info(
         "Exporting prompts for run %s",
         payload.run_id,
@@ -277,6 +428,30 @@ async def export_prompts(payload: ExportRequest, *, store: ProjectPlannerStore)
             "payload": {"format": payload.format},
         },
     )
+    formatter, extension, content_type = _EXPORT_FORMATS[payload.format]
+    revision = store.artifact_revision(payload.run_id)
+    cache_key: Optional[ExportCacheKey] = None
+    cached: Optional[str] = None
+    if revision is not None:
+        cache_key = (str(store.engine.url), payload.run_id, payload.format, revision)
+        with _EXPORT_CACHE_LOCK:
+            cached = _EXPORT_CACHE.get(cache_key)
+            if cached is not None:
+                _EXPORT_CACHE.move_to_end(cache_key)
+    if cached is not None:
+        metadata = _export_metadata(payload.run_id, extension, content_type)
+        LOGGER.info(
+            "Serving cached %s export for run %s",
+            payload.format,
+            payload.run_id,
+            extra={
+                "event": "planning.export.cache_hit",
+                "run_id": payload.run_id,
+                "payload": {"filename": metadata.filename},
+            },
+        )
+        return metadata, iter((cached,))
+
     plan = store.get_plan(payload.run_id)
     steps = store.get_steps(payload.run_id)
     report = store.get_report(payload.run_id)
@@ -289,25 +464,7 @@ async def export_prompts(payload: ExportRequest, *, store: ProjectPlannerStore)
         )
         raise HTTPException(status_code=404, detail="Plan or steps not found for run.")
 
-    formatter = {
-        "yaml": _to_yaml,
-        "jsonl": _to_jsonl,
-        "md": _to_markdown,
-    }[payload.format]
-    content = formatter(plan, steps, report)
-    timestamp = datetime.utcnow().strftime("%Y%m%d%H%M%S")
-    filename, content_type = {
-        "yaml": (f"coding-conductor-prompts-{payload.run_id}-{timestamp}.yaml", "application/yaml"),
-        "jsonl": (f"coding-conductor-prompts-{payload.run_id}-{timestamp}.jsonl", "application/json"),
-        "md": (f"coding-conductor-prompts-{payload.run_id}-{timestamp}.md", "text/markdown"),
-    }[payload.format]
-
-    metadata = ExportMetadata(
-        filename=filename,
-        content_type=content_type,
-        generated_at=datetime.utcnow(),
-    )
-    export_response = ExportResponse(metadata=metadata, content=content)
+    metadata = _export_metadata(payload.run_id, extension, content_type)
     LOGGER.info(
         "Prepared %s export for run %s",
         payload.format,
@@ -315,80 +472,132 @@ async def export_prompts(payload: ExportRequest, *, store: ProjectPlannerStore)
         extra={
             "event": "planning.export.complete",
             "run_id": payload.run_id,
-            "payload": {"filename": filename},
+            "payload": {"filename": metadata.filename},
         },
     )
-    return export_response
+    chunks = formatter(plan, steps, report)
+    if cache_key is not None:
+        chunks = _cache_export(cache_key, chunks)
+    return metadata, chunks
 
 
-def _to_yaml(plan: PromptPlan, steps: List[PromptStep], report: AgentReport | None) -> str:
-    lines: List[str] = ["plan:", "  context: |"]
-    lines.extend(f"    {line}" for line in plan.context.splitlines())
-    for field in ("goals", "assumptions", "non_goals", "risks", "milestones"):
-        lines.append(f"  {field}:")
-        for item in getattr(plan, field):
-            lines.append(f"    - {item}")
-    lines.append("steps:")
-    for step in steps:
-        lines.append(f"  - id: {step.id}")
-        lines.append(f"    title: {step.title}")
-        lines.append("    system_prompt: |")
-        for line in step.system_prompt.splitlines():
-            lines.append(f"      {line}")
-        lines.append("    user_prompt: |")
-        for line in step.user_prompt.splitlines():
-            lines.append(f"      {line}")
-        lines.append("    expected_artifacts:")
-        for artifact in step.expected_artifacts:
-            lines.append(f"      - {artifact}")
-        lines.append("    acceptance_criteria:")
-        for criterion in step.acceptance_criteria:
-            lines.append(f"      - {criterion}")
-        lines.append("    inputs:")
-        for item in step.inputs:
-            lines.append(f"      - {item}")
-        lines.append("    outputs:")
-        for item in step.outputs:
-            lines.append(f"      - {item}")
-    if report:
-        lines.append("report:")
-        lines.append(f"  overall_score: {report.overall_score}")
-        lines.append("  strengths:")
-        for item in report.strengths:
-            lines.append(f"    - {item}")
-        lines.append("  concerns:")
-        for item in report.concerns:
-            lines.append(f"    - {item}")
-    return "\n".join(lines)
-
-
-def _to_jsonl(plan: PromptPlan, steps: List[PromptStep], report: AgentReport | None) -> str:
-    bundle: List[dict] = [{"type": "plan", "payload": plan.dict()}]
+def _export_metadata(run_id: str, extension: str, content_type: str) -> ExportMetadata:
+    generated_at = datetime.now(timezone.utc)
+    return ExportMetadata(
+        filename=f"coding-conductor-prompts-{run_id}-{generated_at:%Y%m%d%H%M%S}.{extension}",
+        content_type=content_type,
+        generated_at=generated_at,
+    )
+
+
+def _cache_export(cache_key: ExportCacheKey, chunks: Iterator[str]) -> Iterator[str]:
+    """Pass the chunks through and remember the full export once they are exhausted."""
+
+    parts: List[str] = []
+    for chunk in chunks:
+        parts.append(chunk)
+        yield chunk
+    with _EXPORT_CACHE_LOCK:
+        _EXPORT_CACHE[cache_key] = "".join(parts)
+        _EXPORT_CACHE.move_to_end(cache_key)
+        while len(_EXPORT_CACHE) > EXPORT_CACHE_SIZE:
+            _EXPORT_CACHE.popitem(last=False)
+
+
+async def export_prompts(payload: ExportRequest, *, store: ProjectPlannerStore) -> ExportResponse:
+    metadata, chunks = stream_export(payload, store=store)
+    return ExportResponse(metadata=metadata, content="".join(chunks))
+
+
+def _dump_yaml(data: Any) -> str:
+    return yaml.dump(
+        data,
+        Dumper=_BlockStyleDumper,
+        sort_keys=False,
+        allow_unicode=True,
+        width=_YAML_LINE_WIDTH,
+    )
+
+
+def _iter_yaml(plan: PromptPlan, steps: List[PromptStep], report: AgentReport | None) -> Iterator[str]:
+    yield _dump_yaml(
+        {
+            "plan": {
+                "context": plan.context,
+                **{field: list(section) for field, section in zip(_PLAN_LIST_FIELDS, _plan_lists(plan))},
+            }
+        }
+    )
+    yield "steps:\n"
     for step in steps:
-        bundle.append({"type": "step", "payload": step.dict()})
+        # A one-item list dumps as a top-level `- ` entry of the `steps` sequence.
+        yield _dump_yaml(
+            [
+                {
+                    "id": step.id,
+                    "title": step.title,
+                    "system_prompt": step.system_prompt,
+                    "user_prompt": step.user_prompt,
+                    "expected_artifacts": list(step.expected_artifacts),
+                    "acceptance_criteria": list(step.acceptance_criteria),
+                    "inputs": list(step.inputs),
+                    "outputs": list(step.outputs),
+                }
+            ]
+        )
     if report:
-        bundle.append({"type": "report", "payload": report.dict()})
-    return "\n".join(json.dumps(item) for item in bundle)
+        yield _dump_yaml(
+            {
+                "report": {
+                    "overall_score": report.overall_score,
+                    "strengths": list(report.strengths),
+                    "concerns": list(report.concerns),
+                }
+            }
+        )
+
 
+def _iter_jsonl(plan: PromptPlan, steps: List[PromptStep], report: AgentReport | None) -> Iterator[str]:
+    records: Iterator[dict] = itertools.chain(
+        ({"type": "plan", "payload": plan.model_dump(mode="json")},),
+        ({"type": "step", "payload": step.model_dump(mode="json")} for step in steps),
+        ({"type": "report", "payload": report.model_dump(mode="json")},) if report else (),
+    )
+    for record in records:
+        if orjson is not None:
+            yield orjson.dumps(record).decode("utf-8") + "\n"
+        else:
+            yield json.dumps(record) + "\n"
 
-def _to_markdown(plan: PromptPlan, steps: List[PromptStep], report: AgentReport | None) -> str:
+
+def _fenced(text: str) -> str:
+    """Wrap a prompt in a code fence longer than any backtick run it contains.
+
+    The prompt is emitted verbatim apart from trailing line breaks, which are
+    trimmed so the closing fence sits directly under the text.
+    """
+
+    fence = "`" * (max(map(len, _BACKTICK_RUN.findall(text)), default=2) + 1)
+    return "\n".join((fence, text.rstrip("\r\n"), fence))
+
+
+def _iter_markdown(plan: PromptPlan, steps: List[PromptStep], report: AgentReport | None) -> Iterator[str]:
     lines = ["# Prompt Blueprint", "", f"**Context**: {plan.context}"]
-    for heading in ("goals", "assumptions", "non_goals", "risks", "milestones"):
-        section = getattr(plan, heading)
+    for heading, section in zip(_PLAN_LIST_HEADINGS, _plan_lists(plan)):
         if section:
-            lines.append(f"## {heading.replace('_', ' ').title()}")
+            lines.append(f"## {heading}")
             for item in section:
                 lines.append(f"- {item}")
             lines.append("")
     lines.append("## Steps")
+    yield "\n".join(lines) + "\n"
     for index, step in enumerate(steps, start=1):
-        lines.append(f"### Step {index}: {step.title}")
-        lines.append("")
+        lines = [f"### Step {index}: {step.title}", ""]
         lines.append("**System Prompt**")
-        lines.extend(step.system_prompt.splitlines())
+        lines.append(_fenced(step.system_prompt))
         lines.append("")
         lines.append("**User Prompt**")
-        lines.extend(step.user_prompt.splitlines())
+        lines.append(_fenced(step.user_prompt))
         lines.append("")
         if step.expected_artifacts:
             lines.append("**Expected Artifacts**")
@@ -398,15 +607,20 @@ def _to_markdown(plan: PromptPlan, steps: List[PromptStep], report: AgentReport
             lines.append("**Acceptance Criteria**")
             lines.extend(f"- {criterion}" for criterion in step.acceptance_criteria)
             lines.append("")
+        yield "\n".join(lines) + "\n"
     if report:
-        lines.append("## Reviewer Report")
-        lines.append(f"Overall score: {report.overall_score:.2f}")
+        lines = ["## Reviewer Report", f"Overall score: {report.overall_score:.2f}"]
         if report.strengths:
             lines.append("**Strengths**")
             lines.extend(f"- {item}" for item in report.strengths)
         if report.concerns:
             lines.append("**Concerns**")
             lines.extend(f"- {item}" for item in report.concerns)
-    return "\n".join(lines)
+        yield "\n".join(lines) + "\n"
 
 
+_EXPORT_FORMATS: Dict[str, Tuple[Callable[..., Iterator[str]], str, str]] = {
+    "yaml": (_iter_yaml, "yaml", "application/yaml"),
+    "jsonl": (_iter_jsonl, "jsonl", "application/json"),
+    "md": (_iter_markdown, "md", "text/markdown"),
+}
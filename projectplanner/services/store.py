@@ -1,14 +1,19 @@
 ﻿"""Persistence layer for the coding conductor module."""
 from __future__ import annotations
 
+import logging
 import os
+import threading
+import uuid
+from concurrent.futures import Future, ThreadPoolExecutor
 from contextlib import contextmanager
 from dataclasses import dataclass
 from datetime import datetime
 from pathlib import Path
-from typing import Generator, Iterable, List, Optional
+from typing import Dict, Generator, Iterable, List, Optional
 
-from sqlalchemy import JSON, Column, DateTime, ForeignKey, Integer, String, Text, create_engine
+from pydantic import TypeAdapter
+from sqlalchemy import JSON, Column, DateTime, ForeignKey, Integer, String, Text, create_engine, delete, insert
 from sqlalchemy.engine import Engine
 from sqlalchemy.orm import Session, declarative_base, relationship, sessionmaker
 
@@ -19,6 +24,9 @@ Base = declarative_base()
 
 LOGGER = get_logger(__name__)
 
+_STEP_LIST_ADAPTER = TypeAdapter(List[PromptStep])
+_OBJECTIVE_LIST_ADAPTER = TypeAdapter(List[MilestoneObjective])
+
 
 class RunRecord(Base):
     __tablename__ = "runs"
@@ -95,7 +103,34 @@ class ReportRecord(Base):
     run = relationship("RunRecord", back_populates="report")
 
 
-@dataclass
+class ArtifactRevisionRecord(Base):
+    """Random token rewritten with a run's plan, steps or report, used to key export caches."""
+
+    __tablename__ = "artifact_revisions"
+
+    run_id = Column(String, ForeignKey("runs.id", ondelete="CASCADE"), primary_key=True)
+    revision = Column(String, nullable=False)
+    updated_at = Column(DateTime, default=datetime.utcnow, nullable=False)
+
+
+class PlanCacheRecord(Base):
+    """Planning artifacts keyed by a fingerprint of the planning inputs."""
+
+    __tablename__ = "plan_cache"
+
+    fingerprint = Column(String, primary_key=True)
+    created_at = Column(DateTime, default=datetime.utcnow, nullable=False)
+    objectives_json = Column(JSON, nullable=False)
+    plan_json = Column(JSON, nullable=False)
+    steps_json = Column(JSON, nullable=False)
+    report_json = Column(JSON, nullable=False)
+
+
+class ChunkWriteError(RuntimeError):
+    """Raised when a run's background chunk write failed, so its chunks are missing."""
+
+
+@dataclass(slots=True, frozen=True)
 class StoredChunk:
     """Lightweight representation of a document chunk."""
 
@@ -104,12 +139,27 @@ class StoredChunk:
     metadata: Optional[dict]
 
 
+@dataclass(slots=True, frozen=True)
+class CachedPlan:
+    """Planning artifacts restored from the plan cache."""
+
+    objectives: List[MilestoneObjective]
+    plan: PromptPlan
+    steps: List[PromptStep]
+    report: AgentReport
+
+
 class ProjectPlannerStore:
     """Data access layer supporting both SQLite and Postgres backends."""
 
     def __init__(self, engine: Engine) -> None:
         self.engine = engine
         self._session_factory = sessionmaker(bind=self.engine, expire_on_commit=False)
+        self._writer: Optional[ThreadPoolExecutor] = None
+        self._pending_writes: Dict[str, Future] = {}
+        self._failed_writes: Dict[str, BaseException] = {}
+        self._pending_lock = threading.Lock()
+        self._local = threading.local()
 
     @classmethod
     def from_env(cls) -> "ProjectPlannerStore":
@@ -136,6 +186,11 @@ class ProjectPlannerStore:
 
     @contextmanager
     def session(self) -> Generator[Session, None, None]:
+        active = getattr(self._local, "session", None)
+        if active is not None:
+            # Inside `transaction()`: join it and leave the commit to the outer block.
+            yield active
+            return
         session = self._session_factory()
         try:
             yield session
@@ -146,6 +201,32 @@ class ProjectPlannerStore:
         finally:
             session.close()
 
+    @contextmanager
+    def transaction(self) -> Generator[Session, None, None]:
+        """Run every store call made by this thread inside the block under a single commit."""
+
+        if getattr(self._local, "session", None) is not None:
+            with self.session() as session:
+                yield session
+            return
+        with self.session() as session:
+            self._local.session = session
+            try:
+                yield session
+            finally:
+                self._local.session = None
+
+    def artifact_revision(self, run_id: str) -> Optional[str]:
+        """Return the persisted token that changes whenever the run's plan, steps or report is rewritten."""
+
+        with self.session() as session:
+            record = session.get(ArtifactRevisionRecord, run_id)
+            return record.revision if record else None
+
+    def _touch_run(self, session: Session, run_id: str) -> None:
+        # Written in the caller's session so the token commits with the artifacts it versions.
+        session.merge(ArtifactRevisionRecord(run_id=run_id, revision=uuid.uuid4().hex, updated_at=datetime.utcnow()))
+
     def register_run(self, run_id: str, *, source: str, stats: dict) -> None:
         with self.session() as session:
             session.merge(
@@ -183,7 +264,64 @@ class ProjectPlannerStore:
             extra={"event": "store.chunks.add", "run_id": run_id, "payload": {"count": count}},
         )
 
+    def add_chunks_background(self, run_id: str, chunks: Iterable[StoredChunk]) -> Future:
+        """Persist chunks on the store's writer thread and return the pending write.
+
+        Writes are serialized on one worker, and `get_chunks` waits for a run's
+        pending write, so callers never observe a partially ingested run.
+        """
+
+        chunks = list(chunks)
+        with self._pending_lock:
+            if self._writer is None:
+                self._writer = ThreadPoolExecutor(max_workers=1, thread_name_prefix="store-writer")
+            future = self._writer.submit(self.add_chunks, run_id, chunks)
+            self._pending_writes[run_id] = future
+            self._failed_writes.pop(run_id, None)
+        future.add_done_callback(lambda done: self._finish_write(run_id, done))
+        return future
+
+    def _finish_write(self, run_id: str, future: Future) -> None:
+        exc = future.exception()
+        with self._pending_lock:
+            if self._pending_writes.get(run_id) is future:
+                del self._pending_writes[run_id]
+                if exc is not None:
+                    # Kept so later readers of the run see the failure, not an empty run.
+                    self._failed_writes[run_id] = exc
+        if exc is not None:
+            LOGGER.error(
+                "Background chunk write failed for run %s",
+                run_id,
+                exc_info=exc,
+                extra={"event": "store.chunks.add_error", "run_id": run_id},
+            )
+
+    def wait_for_writes(self, run_id: Optional[str] = None) -> None:
+        """Block until pending chunk writes (for one run, or all runs) have finished.
+
+        Raises `ChunkWriteError` chained to the original error if a write failed.
+        """
+
+        with self._pending_lock:
+            if run_id is None:
+                pending = list(self._pending_writes.items())
+                failed = dict(self._failed_writes)
+            else:
+                future = self._pending_writes.get(run_id)
+                pending = [(run_id, future)] if future else []
+                error = self._failed_writes.get(run_id)
+                failed = {run_id: error} if error is not None else {}
+        for pending_run_id, future in pending:
+            exc = future.exception()
+            if exc is not None:
+                failed.setdefault(pending_run_id, exc)
+        if failed:
+            failed_run_id, exc = next(iter(failed.items()))
+            raise ChunkWriteError(f"Persisting chunks for run {failed_run_id} failed: {exc}") from exc
+
     def get_chunks(self, run_id: str) -> List[StoredChunk]:
+        self.wait_for_writes(run_id)
         with self.session() as session:
             records = (
                 session.query(ChunkRecord)
@@ -210,6 +348,7 @@ class ProjectPlannerStore:
     def upsert_plan(self, run_id: str, plan: PromptPlan) -> None:
         with self.session() as session:
             session.merge(PlanRecord(run_id=run_id, plan_json=plan.model_dump(mode="json")))
+            self._touch_run(session, run_id)
         LOGGER.info(
             "Upserted plan for run %s",
             run_id,
@@ -218,20 +357,23 @@ class ProjectPlannerStore:
 
 
     def upsert_objectives(self, run_id: str, objectives: List[MilestoneObjective]) -> None:
+        rows = [
+            {
+                "run_id": run_id,
+                "milestone_id": objective.id,
+                "title": objective.title,
+                "objective": objective.objective,
+                "success_criteria": list(objective.success_criteria),
+                "dependencies": list(objective.dependencies),
+                "display_order": objective.order,
+            }
+            for objective in sorted(objectives, key=lambda item: item.order)
+        ]
         with self.session() as session:
-            session.query(MilestoneRecord).filter(MilestoneRecord.run_id == run_id).delete()
-            for objective in sorted(objectives, key=lambda item: item.order):
-                session.add(
-                    MilestoneRecord(
-                        run_id=run_id,
-                        milestone_id=objective.id,
-                        title=objective.title,
-                        objective=objective.objective,
-                        success_criteria=list(objective.success_criteria),
-                        dependencies=list(objective.dependencies),
-                        display_order=objective.order,
-                    )
-                )
+            session.execute(delete(MilestoneRecord).where(MilestoneRecord.run_id == run_id))
+            if rows:
+                # A Core insert with a list of rows runs as one executemany.
+                session.execute(insert(MilestoneRecord), rows)
         LOGGER.info(
             "Upserted %s objectives for run %s",
             len(objectives),
@@ -240,16 +382,15 @@ class ProjectPlannerStore:
         )
 
     def upsert_steps(self, run_id: str, steps: List[PromptStep]) -> None:
+        rows = [
+            {"run_id": run_id, "step_index": idx, "step_json": step.model_dump(mode="json")}
+            for idx, step in enumerate(steps)
+        ]
         with self.session() as session:
-            session.query(StepRecord).filter(StepRecord.run_id == run_id).delete()
-            for idx, step in enumerate(steps):
-                session.add(
-                    StepRecord(
-                        run_id=run_id,
-                        step_index=idx,
-                        step_json=step.model_dump(mode="json"),
-                    )
-                )
+            session.execute(delete(StepRecord).where(StepRecord.run_id == run_id))
+            if rows:
+                session.execute(insert(StepRecord), rows)
+            self._touch_run(session, run_id)
         LOGGER.info(
             "Upserted %s steps for run %s",
             len(steps),
@@ -260,6 +401,7 @@ class ProjectPlannerStore:
     def upsert_report(self, run_id: str, report: AgentReport) -> None:
         with self.session() as session:
             session.merge(ReportRecord(run_id=run_id, report_json=report.model_dump(mode="json")))
+            self._touch_run(session, run_id)
         LOGGER.info(
             "Upserted reviewer report for run %s",
             run_id,
@@ -329,13 +471,13 @@ class ProjectPlannerStore:
 
     def get_steps(self, run_id: str) -> List[PromptStep]:
         with self.session() as session:
-            records = (
-                session.query(StepRecord)
+            payloads = [
+                step_json
+                for (step_json,) in session.query(StepRecord.step_json)
                 .filter(StepRecord.run_id == run_id)
                 .order_by(StepRecord.step_index)
-                .all()
-            )
-        steps = [PromptStep.parse_obj(record.step_json) for record in records]
+            ]
+        steps = _STEP_LIST_ADAPTER.validate_python(payloads)
         LOGGER.debug(
             "Retrieved %s steps for run %s",
             len(steps),
@@ -361,6 +503,49 @@ class ProjectPlannerStore:
         )
         return AgentReport.parse_obj(record.report_json)
 
+    def get_cached_plan(self, fingerprint: str) -> Optional[CachedPlan]:
+        with self.session() as session:
+            record = session.get(PlanCacheRecord, fingerprint)
+        found = record is not None
+        if LOGGER.isEnabledFor(logging.DEBUG):
+            LOGGER.debug(
+                "Plan cache lookup returned %s",
+                found,
+                extra={"event": "store.plan_cache.fetch", "payload": {"found": found}},
+            )
+        if not found:
+            return None
+        return CachedPlan(
+            objectives=_OBJECTIVE_LIST_ADAPTER.validate_python(record.objectives_json),
+            plan=PromptPlan.model_validate(record.plan_json),
+            steps=_STEP_LIST_ADAPTER.validate_python(record.steps_json),
+            report=AgentReport.model_validate(record.report_json),
+        )
+
+    def cache_plan(
+        self,
+        fingerprint: str,
+        *,
+        objectives: List[MilestoneObjective],
+        plan: PromptPlan,
+        steps: List[PromptStep],
+        report: AgentReport,
+    ) -> None:
+        with self.session() as session:
+            session.merge(
+                PlanCacheRecord(
+                    fingerprint=fingerprint,
+                    objectives_json=[objective.model_dump(mode="json") for objective in objectives],
+                    plan_json=plan.model_dump(mode="json"),
+                    steps_json=[step.model_dump(mode="json") for step in steps],
+                    report_json=report.model_dump(mode="json"),
+                )
+            )
+        LOGGER.info(
+            "Cached plan artifacts",
+            extra={"event": "store.plan_cache.store", "payload": {"step_count": len(steps)}},
+        )
+
     def run_exists(self, run_id: str) -> bool:
         with self.session() as session:
             exists = session.query(RunRecord.id).filter(RunRecord.id == run_id).scalar() is not None
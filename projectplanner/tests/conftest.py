@@ -1,4 +1,15 @@
-﻿import pytest
+﻿import os
+import tempfile
+from pathlib import Path
+
+# Point every on-disk default at a scratch directory so test runs never write
+# into projectplanner/data. These must be set before the package is imported.
+_TEST_DATA_DIR = Path(tempfile.mkdtemp(prefix="projectplanner-tests-"))
+os.environ.setdefault("DATABASE_URL", f"sqlite:///{_TEST_DATA_DIR / 'codingconductor.db'}")
+os.environ.setdefault("CODING_CONDUCTOR_PROMPT_LOG", str(_TEST_DATA_DIR / "prompt_audit.jsonl"))
+os.environ.setdefault("CODING_ORCHESTRATOR_SUMMARY_CACHE", str(_TEST_DATA_DIR / "orchestrator_cache.db"))
+
+import pytest
 from sqlalchemy import create_engine
 
 from projectplanner.services.store import ProjectPlannerStore
@@ -0,0 +1,37 @@
+from projectplanner.orchestrator.graph_store import GraphStore
+from projectplanner.orchestrator.models import Milestone
+
+
+def test_formatted_node_listing_tracks_assignments():
+    store = GraphStore("run-graph")
+    store.load_components(["Billing API", "auth service", "Zeta"])
+
+    assert store.formatted_node_listing().splitlines() == [
+        "- auth service :: milestones none",
+        "- Billing API :: milestones none",
+        "- Zeta :: milestones none",
+    ]
+
+    store.assign_milestones([Milestone(milestone_id=1, details="Ship the billing api", context="")])
+    store.set_assignment("zeta", 2)
+
+    assert store.formatted_node_listing().splitlines() == [
+        "- auth service :: milestones none",
+        "- Billing API :: milestones 1",
+        "- Zeta :: milestones 2",
+    ]
+
+
+def test_snapshot_refreshes_after_assignment():
+    store = GraphStore("run-graph")
+    store.load_components(["Web", "API"])
+
+    first = store.snapshot()
+    assert first.uncovered_nodes == ["API", "Web"]
+
+    store.set_assignment("web", 1)
+    second = store.snapshot(notes="after")
+
+    assert second.covered_nodes == ["Web"]
+    assert second.uncovered_nodes == ["API"]
+    assert first.uncovered_nodes == ["API", "Web"]
@@ -1,7 +1,11 @@
-﻿import pytest
+﻿import threading
 
-from projectplanner.models import IngestionRequest
-from projectplanner.services import ingest
+import pytest
+from fastapi import HTTPException
+
+from projectplanner.models import IngestionRequest, PlanRequest
+from projectplanner.services import ingest, plan
+from projectplanner.services.store import ChunkWriteError
 
 
 @pytest.mark.asyncio
@@ -25,3 +29,36 @@ async def test_ingest_zero_width_space_text(store):
     assert response.stats.word_count == 4
     assert response.stats.chunk_count >= 1
 
+
+@pytest.mark.asyncio
+async def test_planning_right_after_ingest_waits_for_chunk_write(store, monkeypatch):
+    release = threading.Event()
+    add_chunks = store.add_chunks
+
+    def slow_add_chunks(run_id, chunks):
+        release.wait(timeout=5)
+        add_chunks(run_id, chunks)
+
+    monkeypatch.setattr(store, "add_chunks", slow_add_chunks)
+    response = await ingest.ingest_document(IngestionRequest(blueprint="Goals: Ship app"), store=store)
+    threading.Timer(0.05, release.set).start()
+
+    result = await plan.run_planning_workflow(PlanRequest(run_id=response.run_id), store=store)
+
+    assert result.steps
+    assert len(store.get_chunks(response.run_id)) == response.stats.chunk_count
+
+
+@pytest.mark.asyncio
+async def test_failed_chunk_write_surfaces_to_readers(store, monkeypatch):
+    def failing_add_chunks(run_id, chunks):
+        raise OSError("disk full")
+
+    monkeypatch.setattr(store, "add_chunks", failing_add_chunks)
+    response = await ingest.ingest_document(IngestionRequest(blueprint="Goals: Ship app"), store=store)
+
+    with pytest.raises(ChunkWriteError, match="disk full"):
+        store.get_chunks(response.run_id)
+    with pytest.raises(HTTPException) as excinfo:
+        await plan.run_planning_workflow(PlanRequest(run_id=response.run_id), store=store)
+    assert excinfo.value.status_code == 500
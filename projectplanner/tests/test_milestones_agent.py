@@ -0,0 +1,42 @@
+import asyncio
+import json
+import threading
+
+import pytest
+
+from projectplanner.orchestrator.agents.milestones_agent import MilestonesAgent
+
+
+@pytest.mark.asyncio
+async def test_cancelled_leader_still_shares_its_summary(monkeypatch):
+    started = threading.Event()
+    release = threading.Event()
+    calls = []
+
+    def fake_completion(client, *, model, **kwargs):
+        calls.append(model)
+        started.set()
+        release.wait(timeout=5)
+        reply = json.dumps({"summary": "Shared summary"})
+        return {"choices": [{"message": {"role": "assistant", "content": reply}}]}
+
+    monkeypatch.setattr("projectplanner.orchestrator.agents.milestones_agent.create_chat_completion", fake_completion)
+    monkeypatch.setattr("projectplanner.orchestrator.agents.milestones_agent.log_prompt", lambda *args, **kwargs: None)
+    agent = MilestonesAgent()
+    agent._client = object()
+
+    blueprint = "Coalesced blueprint for a cancelled leader"
+    leader = asyncio.create_task(agent.asummarize_blueprint(run_id="run-1", blueprint_text=blueprint))
+    await asyncio.to_thread(started.wait, 5)
+    follower = asyncio.create_task(
+        agent.asummarize_blueprint(run_id="run-2", blueprint_text=blueprint, use_cache=False)
+    )
+    await asyncio.sleep(0.05)
+    leader.cancel()
+    release.set()
+
+    summary = await follower
+    assert leader.cancelled()
+    assert summary.run_id == "run-2"
+    assert summary.summary == "Shared summary"
+    assert len(calls) == 1
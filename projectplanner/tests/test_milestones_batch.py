@@ -0,0 +1,86 @@
+import json
+from types import SimpleNamespace
+
+from projectplanner.orchestrator.agents.milestones_agent import (
+    MILESTONE_RESPONSE_FORMAT,
+    MilestonesAgent,
+)
+from projectplanner.orchestrator.agents.milestones_batch import BATCH_ENDPOINT, MilestonesBatch
+from projectplanner.orchestrator.models import BlueprintSummary, MilestonePlan
+
+
+def _completion(payload):
+    reply = json.dumps(payload)
+    return {"choices": [{"message": {"role": "assistant", "content": f"```json\n{reply}\n```"}}]}
+
+
+class FakeBatchClient:
+    """Stands in for the OpenAI client: answers every uploaded request from a canned reply."""
+
+    def __init__(self):
+        self.uploads = {}
+        self.files = SimpleNamespace(create=self._upload, content=self._download)
+        self.batches = SimpleNamespace(
+            create=lambda *, input_file_id, **_: SimpleNamespace(id=input_file_id),
+            retrieve=lambda batch_id: SimpleNamespace(id=batch_id, status="completed", output_file_id=batch_id),
+        )
+
+    def _upload(self, *, file, purpose):
+        name, handle = file
+        self.uploads[name] = [json.loads(line) for line in handle.read().decode("utf-8").splitlines()]
+        return SimpleNamespace(id=name)
+
+    def _download(self, file_id):
+        lines = []
+        for request in self.uploads[file_id]:
+            run_id = request["custom_id"]
+            if run_id == "run-failed":
+                lines.append({"custom_id": run_id, "response": {"status_code": 500, "body": {}}})
+                continue
+            if request["body"]["response_format"] == MILESTONE_RESPONSE_FORMAT:
+                payload = {
+                    "milestones": [
+                        {"milestoneID": idx, "MilestoneDetails": f"Step {idx} for {run_id}"} for idx in range(1, 6)
+                    ]
+                }
+            else:
+                payload = {"summary": f"Summary of {run_id}", "components": ["API"]}
+            lines.append({"custom_id": run_id, "response": {"status_code": 200, "body": _completion(payload)}})
+        return SimpleNamespace(text="\n".join(json.dumps(line) for line in lines))
+
+
+def test_batch_round_trips_both_stages_and_falls_back_for_failed_lines(monkeypatch):
+    client = FakeBatchClient()
+    monkeypatch.setattr(MilestonesAgent, "client", client)
+    agent = MilestonesAgent()
+    cached = []
+    monkeypatch.setattr(agent, "remember_summary", lambda text, summary: cached.append(("summary", text)))
+    monkeypatch.setattr(agent, "remember_milestones", lambda summary, plan: cached.append(("plan", plan.run_id)))
+    monkeypatch.setattr(
+        agent,
+        "summarize_blueprint",
+        lambda *, run_id, blueprint_text: BlueprintSummary(run_id=run_id, summary="synchronous"),
+    )
+    monkeypatch.setattr(
+        agent,
+        "generate_milestones",
+        lambda *, run_id, summary: MilestonePlan(run_id=run_id),
+    )
+
+    results = MilestonesBatch(agent, poll_interval=0).process(
+        [("run-1", "Build an API"), ("run-failed", "Build a UI")]
+    )
+
+    summary_requests = client.uploads["blueprints.jsonl"]
+    assert [request["url"] for request in summary_requests] == [BATCH_ENDPOINT, BATCH_ENDPOINT]
+    assert summary_requests[0]["body"] == agent.summary_request_body("Build an API")
+    milestone_requests = client.uploads["milestones.jsonl"]
+    assert milestone_requests[0]["body"] == agent.milestone_request_body(results["run-1"][0])
+
+    summary, plan = results["run-1"]
+    assert summary.summary == "Summary of run-1"
+    assert summary.components == ["API"]
+    assert [milestone.details for milestone in plan.milestones] == [f"Step {idx} for run-1" for idx in range(1, 6)]
+    assert results["run-failed"][0].summary == "synchronous"
+    assert results["run-failed"][1].milestones == []
+    assert cached == [("summary", "Build an API"), ("plan", "run-1")]
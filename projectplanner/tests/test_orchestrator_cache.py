@@ -0,0 +1,40 @@
+from projectplanner.orchestrator.cache import SummaryCache, cache_scope, fingerprint
+from projectplanner.orchestrator.models import BlueprintSummary, Milestone, MilestonePlan
+
+
+def test_summary_cache_matches_reflowed_blueprints(tmp_path):
+    cache = SummaryCache(tmp_path / "cache.db")
+    summary = BlueprintSummary(run_id="run-1", summary="Build an API", components=["API"])
+
+    assert cache.get("Build  an\nAPI") is None
+    cache.put("Build  an\nAPI", summary)
+
+    cached = cache.get("Build an API ")
+    assert cached == summary
+    assert cache.get("Build a UI") is None
+
+
+def test_plan_cache_ignores_run_id(tmp_path):
+    cache = SummaryCache(tmp_path / "cache.db")
+    first = BlueprintSummary(run_id="run-1", summary="Build an API")
+    second = BlueprintSummary(run_id="run-2", summary="Build an API")
+    plan = MilestonePlan(run_id="run-1", milestones=[Milestone(milestone_id=1, details="Scaffold")])
+
+    assert fingerprint(first) == fingerprint(second)
+    cache.put_plan("milestones", fingerprint(first), plan)
+
+    assert cache.get_plan("milestones", fingerprint(second), MilestonePlan) == plan
+    assert cache.get_plan("prompts", fingerprint(second), MilestonePlan) is None
+
+
+def test_cache_entries_are_scoped_to_model_and_prompts(tmp_path):
+    cache = SummaryCache(tmp_path / "cache.db")
+    summary = BlueprintSummary(run_id="run-1", summary="Build an API")
+    scope = cache_scope("gpt-5", "system prompt", {"type": "json_object"})
+
+    cache.put("Build an API", summary, scope)
+
+    assert cache.get("Build an API", scope) == summary
+    assert cache.get("Build an API", cache_scope("gpt-5-mini", "system prompt", {"type": "json_object"})) is None
+    assert cache.get("Build an API", cache_scope("gpt-5", "edited prompt", {"type": "json_object"})) is None
+    assert fingerprint(summary, scope=scope) != fingerprint(summary)
@@ -0,0 +1,31 @@
+from projectplanner.agents._openai_helpers import collect_streamed_completion
+from projectplanner.orchestrator.agents._json_utils import ensure_str_list, parse_json
+
+
+def test_parse_json_strips_code_fences() -> None:
+    raw = "```json\n{\"title\": \"Bootstrap\", \"references\": []}\n```"
+
+    assert parse_json(raw) == {"title": "Bootstrap", "references": []}
+    assert parse_json("```JSON\n{\"title\": \"Open\"}") == {"title": "Open"}
+
+
+def test_parse_json_handles_bare_and_empty_replies() -> None:
+    assert parse_json('  {"notes": "ok"}  ') == {"notes": "ok"}
+    assert parse_json("   ") == {}
+
+
+def test_ensure_str_list_normalizes_items():
+    assert ensure_str_list([" api ", "", 3, None]) == ["api", "3", "None"]
+    assert ensure_str_list("  single ") == ["single"]
+    assert ensure_str_list({"not": "a list"}) == []
+
+
+def test_streamed_completion_stops_when_json_closes():
+    deltas = ['{"notes": "brace } in', ' text", "nested": {"a": 1}', "}", " trailing commentary"]
+    chunks = [{"id": "resp-1", "choices": [{"delta": {"content": text}}]} for text in deltas]
+
+    content, metadata = collect_streamed_completion(iter(chunks), stop_on_json_close=True)
+
+    assert parse_json(content) == {"notes": "brace } in text", "nested": {"a": 1}}
+    assert metadata["stopped_early"] is True
+    assert metadata["response_id"] == "resp-1"
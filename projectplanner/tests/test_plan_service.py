@@ -1,7 +1,11 @@
 import pytest
+import yaml
+from sqlalchemy import create_engine
 
-from projectplanner.models import ExportRequest, IngestionRequest, PlanRequest
+from projectplanner.config import resolve_env_key
+from projectplanner.models import ExportRequest, IngestionRequest, PlanRequest, PromptPlan, PromptStep
 from projectplanner.services import ingest, plan
+from projectplanner.services.store import ProjectPlannerStore
 
 
 @pytest.mark.asyncio
@@ -22,3 +26,186 @@ async def test_planning_workflow_generates_plan(store):
         store=store,
     )
     assert "plan" in export_bundle.content
+
+
+async def _plan_fresh_run(store, **options):
+    ingest_response = await ingest.ingest_document(
+        IngestionRequest(blueprint="Goals: Ship app\\nRisks: scope"),
+        store=store,
+    )
+    request = PlanRequest(run_id=ingest_response.run_id, style="strict", **options)
+    return ingest_response.run_id, await plan.run_planning_workflow(request, store=store)
+
+
+def _pretend_agents_used_model(monkeypatch):
+    def as_model_output(method):
+        def wrapper(self, payload):
+            return method(self, payload).model_copy(update={"from_model": True})
+
+        return wrapper
+
+    for agent_cls, name in (
+        (plan.CoordinatorAgent, "synthesize_objectives"),
+        (plan.PlannerAgent, "generate_plan"),
+        (plan.DecomposerAgent, "decompose"),
+    ):
+        monkeypatch.setattr(agent_cls, name, as_model_output(getattr(agent_cls, name)))
+
+
+def _forbid_agents(monkeypatch):
+    def fail(*args, **kwargs):
+        raise AssertionError("agents should not run on a plan cache hit")
+
+    monkeypatch.setattr(plan.CoordinatorAgent, "synthesize_objectives", fail)
+
+
+@pytest.mark.asyncio
+async def test_planning_reuses_cached_plan_for_identical_inputs(store, monkeypatch):
+    _pretend_agents_used_model(monkeypatch)
+    _, first = await _plan_fresh_run(store)
+
+    _forbid_agents(monkeypatch)
+    run_id, second = await _plan_fresh_run(store)
+
+    assert second.plan == first.plan
+    assert second.steps == first.steps
+    assert second.report.run_id == run_id
+    assert second.report.generated_at > first.report.generated_at
+    assert store.get_steps(run_id) == second.steps
+
+
+@pytest.mark.asyncio
+async def test_planning_does_not_cache_heuristic_plans(store, monkeypatch):
+    await _plan_fresh_run(store)
+
+    calls = []
+    synthesize = plan.CoordinatorAgent.synthesize_objectives
+    monkeypatch.setattr(
+        plan.CoordinatorAgent,
+        "synthesize_objectives",
+        lambda self, payload: calls.append(payload.run_id) or synthesize(self, payload),
+    )
+    run_id, _ = await _plan_fresh_run(store)
+
+    assert calls == [run_id]
+
+
+@pytest.mark.asyncio
+async def test_planning_can_skip_the_plan_cache(store, monkeypatch):
+    _pretend_agents_used_model(monkeypatch)
+    await _plan_fresh_run(store)
+
+    _forbid_agents(monkeypatch)
+    with pytest.raises(AssertionError, match="cache hit"):
+        await _plan_fresh_run(store, use_cache=False)
+
+
+def test_plan_fingerprint_tracks_configured_models(monkeypatch):
+    request = PlanRequest(run_id="run-1")
+    before = plan._plan_fingerprint(["chunk"], request)
+
+    monkeypatch.setenv(resolve_env_key("PLANNER_MODEL"), "another-model")
+
+    assert plan._plan_fingerprint(["chunk"], request) != before
+
+
+@pytest.mark.asyncio
+async def test_export_is_cached_until_steps_change(store, monkeypatch):
+    ingest_response = await ingest.ingest_document(
+        IngestionRequest(blueprint="Goals: Ship export cache\\nRisks: staleness"),
+        store=store,
+    )
+    run_id = ingest_response.run_id
+    response = await plan.run_planning_workflow(PlanRequest(run_id=run_id), store=store)
+    request = ExportRequest(run_id=run_id, format="md")
+    first = await plan.export_prompts(request, store=store)
+
+    get_plan = store.get_plan
+    monkeypatch.setattr(store, "get_plan", lambda *_: pytest.fail("cached export should skip the store"))
+    second = await plan.export_prompts(request, store=store)
+    assert second.content == first.content
+    assert second.metadata.generated_at > first.metadata.generated_at
+
+    monkeypatch.setattr(store, "get_plan", get_plan)
+    # A separate store on the same database stands in for another worker process.
+    other_worker = ProjectPlannerStore(create_engine(store.engine.url, future=True))
+    renamed = response.steps[0].model_copy(update={"title": "Renamed step"})
+    other_worker.upsert_steps(run_id, [renamed, *response.steps[1:]])
+    assert "Renamed step" in (await plan.export_prompts(request, store=store)).content
+
+
+def test_store_transaction_rolls_back_every_write(store):
+    prompt_plan = PromptPlan(
+        context="Context",
+        goals=["Goal"],
+        assumptions=[],
+        non_goals=[],
+        risks=[],
+        milestones=["Milestone"],
+    )
+
+    with pytest.raises(RuntimeError):
+        with store.transaction():
+            store.upsert_plan("run-1", prompt_plan)
+            raise RuntimeError("boom")
+
+    assert store.get_plan("run-1") is None
+    with store.transaction():
+        store.upsert_plan("run-1", prompt_plan)
+    assert store.get_plan("run-1") == prompt_plan
+
+
+def test_yaml_export_round_trips_multiline_and_special_text():
+    prompt_plan = PromptPlan(
+        context="Line one\nkey: value",
+        goals=["- leading dash", "a: b"],
+        assumptions=[],
+        non_goals=[],
+        risks=[],
+        milestones=["Milestone"],
+    )
+    step = PromptStep(
+        id="step-1",
+        title='Title: "quoted"',
+        system_prompt="System\nprompt",
+        user_prompt="Single line",
+        expected_artifacts=["artifact"],
+        acceptance_criteria=["done"],
+        inputs=["input"],
+        outputs=["output"],
+    )
+
+    content = "".join(plan._iter_yaml(prompt_plan, [step], None))
+
+    assert "context: |" in content
+    data = yaml.safe_load(content)
+    assert data["plan"]["context"] == prompt_plan.context
+    assert data["plan"]["goals"] == prompt_plan.goals
+    assert data["steps"][0]["title"] == step.title
+    assert data["steps"][0]["system_prompt"] == step.system_prompt
+
+
+def test_markdown_export_fences_prompts_verbatim():
+    prompt_plan = PromptPlan(
+        context="Context",
+        goals=["Goal"],
+        assumptions=[],
+        non_goals=[],
+        risks=[],
+        milestones=["Milestone"],
+    )
+    step = PromptStep(
+        id="step-1",
+        title="Title",
+        system_prompt="line1\r\nline2\n\n",
+        user_prompt="Reply with:\n```json\n{}\n```",
+        expected_artifacts=["artifact"],
+        acceptance_criteria=["done"],
+        inputs=["input"],
+        outputs=["output"],
+    )
+
+    content = "".join(plan._iter_markdown(prompt_plan, [step], None))
+
+    assert "**System Prompt**\n```\nline1\r\nline2\n```\n\n" in content
+    assert "**User Prompt**\n````\nReply with:\n```json\n{}\n```\n````\n\n" in content